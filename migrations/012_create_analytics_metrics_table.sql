@@ -13,8 +13,8 @@ CREATE TABLE IF NOT EXISTS analytics_metrics (
 );
 
 -- Create indexes for efficient time-series queries
-CREATE INDEX IF NOT EXISTS idx_analytics_timestamp ON analytics_metrics(timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_analytics_metric_name ON analytics_metrics(metric_name);
+CREATE INDEX IF NOT EXISTS idx_analytics_timestamp_category ON analytics_metrics(timestamp DESC, category);
+CREATE INDEX IF NOT EXISTS idx_analytics_name_timestamp ON analytics_metrics(metric_name, timestamp DESC) INCLUDE (metric_value);
 CREATE INDEX IF NOT EXISTS idx_analytics_category ON analytics_metrics(category);
 CREATE INDEX IF NOT EXISTS idx_analytics_composite ON analytics_metrics(metric_name, category, timestamp DESC);
 
@@ -20,9 +20,12 @@ CREATE TABLE IF NOT EXISTS audit_logs (
 
 -- Create indexes for efficient audit queries
 CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs(timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs(user_id, timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_audit_logs_resource ON audit_logs(resource_type, resource_id);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_user_ts ON audit_logs(user_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_resource_ts ON audit_logs(resource_type, resource_id, timestamp DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs(action_type, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp_brin ON audit_logs USING brin (timestamp) WITH (pages_per_range = 64);
+-- old_value/new_value (JSONB) are intentionally not indexed; see AuditLog model docstring
+-- (use a jsonb_path_ops GIN index with @> queries if diff search is ever added)
 
 -- Prevent UPDATE and DELETE operations (INSERT-only table)
 CREATE OR REPLACE FUNCTION prevent_audit_log_modification()
@@ -47,10 +50,9 @@ BEFORE DELETE ON audit_logs
 FOR EACH ROW
 EXECUTE FUNCTION prevent_audit_log_modification();
 
--- Optional: Partition table by month for better query performance
--- Example partition creation for current month:
--- CREATE TABLE audit_logs_2025_10 PARTITION OF audit_logs
---     FOR VALUES FROM ('2025-10-01') TO ('2025-11-01');
+-- Monthly partitioning is applied by Alembic revision 007_audit_logs_partitioning,
+-- which converts this table to PARTITION BY RANGE (timestamp) with
+-- audit_logs_YYYY_MM partitions created on demand.
 
--- Note: 7-year retention policy should be implemented via scheduled cleanup job
--- that moves old partitions to archive storage (Celery task or cron job)
+-- Note: 7-year retention policy is implemented by dropping expired partitions
+-- (AuditService.drop_expired_partitions) from a scheduled job
@@ -0,0 +1,60 @@
+"""Add composite indexes for analytics_metrics time-window queries
+
+Revision ID: 006_analytics_indexes
+Revises: 005_feature_024
+Create Date: 2026-10-17 09:00:00
+
+AnalyticsService filters every query by a recent timestamp window combined
+with either category ('error') or metric_name ('response_time', IN (...)).
+- (timestamp DESC, category) serves the error-rate counts
+- (metric_name, timestamp DESC) INCLUDE (metric_value) makes the average
+  response time an index-only scan
+- Single-column timestamp/metric_name indexes are dropped as they are
+  leading prefixes of the new indexes
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_analytics_indexes'
+down_revision = '005_feature_024'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create composite analytics_metrics indexes and drop redundant ones."""
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analytics_timestamp_category
+            ON analytics_metrics (timestamp DESC, category);
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analytics_name_timestamp
+            ON analytics_metrics (metric_name, timestamp DESC)
+            INCLUDE (metric_value);
+        """)
+
+        # Superseded by the composite indexes above (names differ between the
+        # SQL bootstrap scripts and revision 003, so drop both variants)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_analytics_timestamp;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_analytics_metrics_timestamp;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_analytics_metric_name;")
+
+
+def downgrade():
+    """Restore single-column indexes and drop composite indexes."""
+
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analytics_timestamp
+            ON analytics_metrics (timestamp DESC);
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_analytics_metric_name
+            ON analytics_metrics (metric_name);
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_analytics_name_timestamp;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_analytics_timestamp_category;")
@@ -0,0 +1,199 @@
+"""Partition audit_logs by month
+
+Revision ID: 007_audit_logs_partitioning
+Revises: 006_analytics_indexes
+Create Date: 2026-10-17 09:30:00
+
+audit_logs is append-only with 7-year retention and every reader filters on
+a timestamp range. Converting it to PARTITION BY RANGE (timestamp) lets the
+planner prune to the months in range, and retention becomes a DROP of whole
+monthly partitions instead of a DELETE (which the immutability trigger
+forbids anyway).
+- audit_logs_YYYY_MM child tables, created on demand by
+  ensure_audit_logs_partition(ts)
+- drop_audit_logs_partitions_before(cutoff) for the retention job
+- Primary key becomes (id, timestamp) as required for partitioned tables
+- (timestamp DESC, user_id) index replaces the single-column timestamp index
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_audit_logs_partitioning'
+down_revision = '006_analytics_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _create_audit_log_indexes():
+    """Create audit_logs indexes on the parent table (propagated to partitions)."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp_user ON audit_logs (timestamp DESC, user_id);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs (user_id, timestamp DESC);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_resource ON audit_logs (resource_type, resource_id);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs (action_type, timestamp DESC);")
+
+
+def _create_immutability_triggers():
+    """Re-attach the INSERT-only triggers if the trigger function is installed."""
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'prevent_audit_log_modification') THEN
+                CREATE TRIGGER trigger_prevent_audit_log_update
+                BEFORE UPDATE ON audit_logs
+                FOR EACH ROW EXECUTE FUNCTION prevent_audit_log_modification();
+
+                CREATE TRIGGER trigger_prevent_audit_log_delete
+                BEFORE DELETE ON audit_logs
+                FOR EACH ROW EXECUTE FUNCTION prevent_audit_log_modification();
+            END IF;
+        END $$;
+    """)
+
+
+def _copy_foreign_keys(source_table):
+    """Copy foreign key constraints from source_table onto audit_logs."""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            fk RECORD;
+        BEGIN
+            FOR fk IN
+                SELECT conname, pg_get_constraintdef(oid) AS definition
+                FROM pg_constraint
+                WHERE conrelid = '{source_table}'::regclass AND contype = 'f'
+            LOOP
+                EXECUTE format('ALTER TABLE {source_table} DROP CONSTRAINT %I', fk.conname);
+                EXECUTE format('ALTER TABLE audit_logs ADD CONSTRAINT %I %s', fk.conname, fk.definition);
+            END LOOP;
+        END $$;
+    """)
+
+
+def _move_id_sequence(source_table):
+    """Re-home the id sequence (if any) so dropping source_table keeps it."""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            seq TEXT := pg_get_serial_sequence('{source_table}', 'id');
+        BEGIN
+            IF seq IS NOT NULL THEN
+                EXECUTE format('ALTER SEQUENCE %s OWNED BY audit_logs.id', seq);
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade():
+    """Convert audit_logs into a monthly range-partitioned table."""
+
+    # ============================================================================
+    # Partition management functions
+    # ============================================================================
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_audit_logs_partition(ts TIMESTAMP)
+        RETURNS TEXT AS $$
+        DECLARE
+            start_month TIMESTAMP := date_trunc('month', ts);
+            partition_name TEXT := 'audit_logs_' || to_char(start_month, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_month, start_month + INTERVAL '1 month'
+            );
+            RETURN partition_name;
+        EXCEPTION
+            -- Another session created the same partition concurrently
+            WHEN duplicate_table THEN
+                RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute(r"""
+        CREATE OR REPLACE FUNCTION drop_audit_logs_partitions_before(cutoff TIMESTAMP)
+        RETURNS INTEGER AS $$
+        DECLARE
+            part RECORD;
+            dropped INTEGER := 0;
+        BEGIN
+            FOR part IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'audit_logs'::regclass
+                  AND c.relname ~ '^audit_logs_\d{4}_\d{2}$'
+                  AND to_date(substring(c.relname from '\d{4}_\d{2}$'), 'YYYY_MM')::TIMESTAMP
+                      + INTERVAL '1 month' <= cutoff
+            LOOP
+                EXECUTE format('DROP TABLE %I', part.relname);
+                dropped := dropped + 1;
+            END LOOP;
+            RETURN dropped;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # ============================================================================
+    # Swap in the partitioned table
+    # ============================================================================
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;")
+    op.execute("""
+        CREATE TABLE audit_logs (
+            LIKE audit_logs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (timestamp);
+    """)
+    _copy_foreign_keys('audit_logs_unpartitioned')
+    _move_id_sequence('audit_logs_unpartitioned')
+
+    # Partitions for every month with existing rows plus the next three months
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(MIN(timestamp), CURRENT_TIMESTAMP::TIMESTAMP)),
+                    date_trunc('month', CURRENT_TIMESTAMP::TIMESTAMP) + INTERVAL '3 months',
+                    INTERVAL '1 month'
+                )
+                FROM audit_logs_unpartitioned
+            LOOP
+                PERFORM ensure_audit_logs_partition(month_start);
+            END LOOP;
+        END $$;
+    """)
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned;")
+    op.execute("DROP TABLE audit_logs_unpartitioned;")
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, timestamp);")
+
+    _create_audit_log_indexes()
+    _create_immutability_triggers()
+
+
+def downgrade():
+    """Convert audit_logs back into a single unpartitioned table."""
+
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned;")
+    op.execute("""
+        CREATE TABLE audit_logs (
+            LIKE audit_logs_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        );
+    """)
+    _copy_foreign_keys('audit_logs_partitioned')
+    _move_id_sequence('audit_logs_partitioned')
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned;")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE;")
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id);")
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs (timestamp DESC);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs (user_id, timestamp DESC);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_resource ON audit_logs (resource_type, resource_id);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs (action_type, timestamp DESC);")
+    _create_immutability_triggers()
+
+    op.execute("DROP FUNCTION IF EXISTS drop_audit_logs_partitions_before(TIMESTAMP);")
+    op.execute("DROP FUNCTION IF EXISTS ensure_audit_logs_partition(TIMESTAMP);")
@@ -0,0 +1,85 @@
+"""Add keyset-ordered composite indexes for audit_logs readers
+
+Revision ID: 008_audit_logs_keyset_indexes
+Revises: 007_audit_logs_partitioning
+Create Date: 2026-10-17 10:00:00
+
+get_user_activity filters by user_id and get_resource_history by
+(resource_type, resource_id); both page newest first on (timestamp, id).
+Indexes whose trailing keys match that sort let the planner serve the LIMIT
+with a plain index scan instead of a Bitmap Heap Scan + Sort.
+- idx_audit_logs_user_ts: (user_id, timestamp DESC, id DESC), replaces
+  idx_audit_logs_user
+- idx_audit_logs_resource_ts: (resource_type, resource_id, timestamp DESC,
+  id DESC), replaces idx_audit_logs_resource
+
+audit_logs is partitioned, and PostgreSQL cannot build an index on a
+partitioned table CONCURRENTLY. Each index is created ON ONLY the parent
+(initially invalid), built CONCURRENTLY on every partition and attached;
+the parent index becomes valid once all partitions are attached and new
+partitions inherit it automatically.
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = '008_audit_logs_keyset_indexes'
+down_revision = '007_audit_logs_partitioning'
+branch_labels = None
+depends_on = None
+
+# (parent index, per-partition suffix, column list)
+KEYSET_INDEXES = [
+    ('idx_audit_logs_user_ts', 'user_ts_idx', 'user_id, timestamp DESC, id DESC'),
+    (
+        'idx_audit_logs_resource_ts',
+        'resource_ts_idx',
+        'resource_type, resource_id, timestamp DESC, id DESC',
+    ),
+]
+
+
+def _audit_log_partitions():
+    """Return the names of the current audit_logs partitions."""
+    result = op.get_bind().execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_logs'::regclass
+        ORDER BY c.relname
+    """))
+    return [row[0] for row in result]
+
+
+def upgrade():
+    """Create keyset indexes partition by partition and drop superseded ones."""
+
+    for index_name, _, columns in KEYSET_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON ONLY audit_logs ({columns});")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for partition in _audit_log_partitions():
+            for index_name, suffix, columns in KEYSET_INDEXES:
+                partition_index = f"{partition}_{suffix}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} "
+                    f"ON {partition} ({columns});"
+                )
+                op.execute(f"ALTER INDEX {index_name} ATTACH PARTITION {partition_index};")
+
+    # Leading prefixes of the new indexes
+    op.execute("DROP INDEX IF EXISTS idx_audit_logs_user;")
+    op.execute("DROP INDEX IF EXISTS idx_audit_logs_resource;")
+
+
+def downgrade():
+    """Restore the previous user/resource indexes and drop keyset indexes."""
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs (user_id, timestamp DESC);")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_logs_resource ON audit_logs (resource_type, resource_id);")
+
+    # Dropping the parent index drops the attached partition indexes with it
+    for index_name, _, _ in KEYSET_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name};")
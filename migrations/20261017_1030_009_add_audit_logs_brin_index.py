@@ -0,0 +1,63 @@
+"""Add BRIN index on audit_logs.timestamp
+
+Revision ID: 009_audit_logs_brin
+Revises: 008_audit_logs_keyset_indexes
+Create Date: 2026-10-17 10:30:00
+
+audit_logs is append-only, so rows are physically stored in timestamp
+order. A BRIN index stores only the min/max timestamp per block range: it
+is a tiny fraction of the size of a BTREE, and it lets wide-range scans
+such as get_action_summary's GROUP BY action_type read only the block
+ranges that overlap the requested window.
+- idx_audit_logs_timestamp_brin: BRIN (timestamp), pages_per_range = 64
+- The BTREE composite indexes stay in place for ordered/LIMIT queries
+
+As in revision 008, the index is created ON ONLY the partitioned parent,
+built CONCURRENTLY per partition and attached; new partitions inherit it.
+"""
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision = '009_audit_logs_brin'
+down_revision = '008_audit_logs_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'idx_audit_logs_timestamp_brin'
+INDEX_DEFINITION = 'USING brin (timestamp) WITH (pages_per_range = 64)'
+
+
+def _audit_log_partitions():
+    """Return the names of the current audit_logs partitions."""
+    result = op.get_bind().execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'audit_logs'::regclass
+        ORDER BY c.relname
+    """))
+    return [row[0] for row in result]
+
+
+def upgrade():
+    """Create the BRIN timestamp index on every audit_logs partition."""
+
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON ONLY audit_logs {INDEX_DEFINITION};")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for partition in _audit_log_partitions():
+            partition_index = f"{partition}_timestamp_brin_idx"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} "
+                f"ON {partition} {INDEX_DEFINITION};"
+            )
+            op.execute(f"ALTER INDEX {INDEX_NAME} ATTACH PARTITION {partition_index};")
+
+
+def downgrade():
+    """Drop the BRIN timestamp index (and its partition indexes)."""
+
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME};")
@@ -0,0 +1,80 @@
+"""Vacuum audit_logs partitions more eagerly after inserts
+
+Revision ID: 010_audit_logs_autovacuum
+Revises: 009_audit_logs_brin
+Create Date: 2026-10-17 11:00:00
+
+get_action_summary counts each action type with an index-only scan on
+idx_audit_logs_action. Index-only scans fall back to heap fetches for pages
+not yet marked all-visible, and on an insert-only table only the
+insert-triggered autovacuum sets that bit. Its default threshold (20% of the
+table) leaves most of the current month's pages unmarked, which is the range
+summaries usually read.
+- autovacuum_vacuum_insert_scale_factor = 0.01 on every partition
+- ensure_audit_logs_partition creates new partitions with the same setting
+  (storage parameters cannot be set on the partitioned parent itself)
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_audit_logs_autovacuum'
+down_revision = '009_audit_logs_brin'
+branch_labels = None
+depends_on = None
+
+
+def _create_ensure_partition_function(storage_clause):
+    """(Re)create ensure_audit_logs_partition with the given WITH clause."""
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION ensure_audit_logs_partition(ts TIMESTAMP)
+        RETURNS TEXT AS $$
+        DECLARE
+            start_month TIMESTAMP := date_trunc('month', ts);
+            partition_name TEXT := 'audit_logs_' || to_char(start_month, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L){storage_clause}',
+                partition_name, start_month, start_month + INTERVAL '1 month'
+            );
+            RETURN partition_name;
+        EXCEPTION
+            -- Another session created the same partition concurrently
+            WHEN duplicate_table THEN
+                RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def _alter_partitions(action):
+    """Apply an ALTER TABLE action to every existing audit_logs partition."""
+    op.execute(f"""
+        DO $$
+        DECLARE
+            part RECORD;
+        BEGIN
+            FOR part IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'audit_logs'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %I {action}', part.relname);
+            END LOOP;
+        END $$;
+    """)
+
+
+def upgrade():
+    """Lower the insert-triggered autovacuum threshold on audit_logs partitions."""
+
+    _create_ensure_partition_function(" WITH (autovacuum_vacuum_insert_scale_factor = 0.01)")
+    _alter_partitions("SET (autovacuum_vacuum_insert_scale_factor = 0.01)")
+
+
+def downgrade():
+    """Restore default autovacuum settings on audit_logs partitions."""
+
+    _alter_partitions("RESET (autovacuum_vacuum_insert_scale_factor)")
+    _create_ensure_partition_function("")
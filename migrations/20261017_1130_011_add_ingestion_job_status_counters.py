@@ -0,0 +1,62 @@
+"""Add processing status counters to ingestion_jobs
+
+Revision ID: 011_ingestion_job_counters
+Revises: 010_audit_logs_autovacuum
+Create Date: 2026-10-17 11:30:00
+
+BatchProcessorService.get_processing_status is polled by the UI and used to
+count every processing_jobs row of the ingestion job on each call. The
+counts now live on the ingestion_jobs row and are maintained with atomic
+UPDATEs on every status transition, so polling is a primary-key lookup.
+- queued_count / processing_count: new columns
+- processed_documents / failed_documents: existing columns, now kept in
+  step with COMPLETED / FAILED processing jobs
+- All four are backfilled from processing_jobs
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_ingestion_job_counters'
+down_revision = '010_audit_logs_autovacuum'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add queued/processing counters and backfill all status counters."""
+
+    op.add_column(
+        'ingestion_jobs',
+        sa.Column('queued_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'ingestion_jobs',
+        sa.Column('processing_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute("""
+        UPDATE ingestion_jobs j
+        SET queued_count = c.queued,
+            processing_count = c.processing,
+            processed_documents = c.completed,
+            failed_documents = c.failed
+        FROM (
+            SELECT ingestion_job_id,
+                   COUNT(*) FILTER (WHERE status = 'QUEUED') AS queued,
+                   COUNT(*) FILTER (WHERE status = 'PROCESSING') AS processing,
+                   COUNT(*) FILTER (WHERE status = 'COMPLETED') AS completed,
+                   COUNT(*) FILTER (WHERE status = 'FAILED') AS failed
+            FROM processing_jobs
+            GROUP BY ingestion_job_id
+        ) c
+        WHERE c.ingestion_job_id = j.job_id;
+    """)
+
+
+def downgrade():
+    """Drop queued/processing counters."""
+
+    op.drop_column('ingestion_jobs', 'processing_count')
+    op.drop_column('ingestion_jobs', 'queued_count')
@@ -0,0 +1,33 @@
+"""Store the Celery batch group on ingestion_jobs
+
+Revision ID: 012_ingestion_job_celery_group
+Revises: 011_ingestion_job_counters
+Create Date: 2026-10-17 12:00:00
+
+BatchProcessorService.cancel_ingestion used to only flip the job status, so
+batch tasks already running kept processing (and paying for embeddings)
+until they finished. The ID of the Celery group running the batches is now
+stored on the ingestion job so cancel can revoke its tasks.
+- celery_group_id: nullable, set when batch processing starts
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_ingestion_job_celery_group'
+down_revision = '011_ingestion_job_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add celery_group_id to ingestion_jobs."""
+
+    op.add_column('ingestion_jobs', sa.Column('celery_group_id', sa.String(36), nullable=True))
+
+
+def downgrade():
+    """Drop celery_group_id from ingestion_jobs."""
+
+    op.drop_column('ingestion_jobs', 'celery_group_id')
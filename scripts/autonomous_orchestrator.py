@@ -134,6 +134,8 @@ class Database:
             'with_content': doc_stats[1],
             'processed': doc_stats[2],
             'queue_pending': queue_stats.get('pending', 0),
+            # Claimed by the poller and dispatched, not yet started by a worker
+            'queue_queued': queue_stats.get('queued', 0),
             'queue_processing': queue_stats.get('processing', 0),
             'queue_completed': queue_stats.get('completed', 0),
             'queue_failed': queue_stats.get('failed', 0)
@@ -316,10 +318,10 @@ class Orchestrator:
 
         while True:
             stats = Database.get_stats()
-            pending = stats['queue_pending']
+            pending = stats['queue_pending'] + stats['queue_queued']
             processing = stats['queue_processing']
 
-            logger.info(f"   Queue: {pending} pending, {processing} processing")
+            logger.info(f"   Queue: {pending} pending (incl. queued), {processing} processing")
 
             if pending <= max_pending:
                 logger.info(f"✅ Queue drained to {pending} pending jobs")
@@ -419,9 +421,12 @@ class Orchestrator:
             logger.info("📊 STEP 1: Waiting for existing documents to process...")
             stats = Database.get_stats()
             logger.info(f"   Documents with content: {stats['with_content']}")
-            logger.info(f"   Processing queue: {stats['queue_pending']} pending, {stats['queue_processing']} processing")
+            logger.info(
+                f"   Processing queue: {stats['queue_pending']} pending, {stats['queue_queued']} queued, "
+                f"{stats['queue_processing']} processing"
+            )
 
-            if stats['queue_pending'] > 100:
+            if stats['queue_pending'] + stats['queue_queued'] > 100:
                 self.wait_for_queue_drain(max_pending=100, timeout_minutes=20)
 
             # Step 2: Batch scraping loop
@@ -490,6 +495,7 @@ class Orchestrator:
 
 📋 PROCESSING QUEUE
    Pending:        {stats['queue_pending']:,}
+   Queued:         {stats['queue_queued']:,}
    Processing:     {stats['queue_processing']:,}
    Completed:      {stats['queue_completed']:,}
    Failed:         {stats['queue_failed']:,}
@@ -37,6 +37,7 @@ echo "📋 PROCESSING QUEUE"
 PGPASSWORD=postgres psql -h localhost -U postgres -d gov_ai_db -t -c "
     SELECT
         '   Pending: ' || COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0) ||
+        ' | Queued: ' || COALESCE(SUM(CASE WHEN status = 'queued' THEN 1 ELSE 0 END), 0) ||
         ' | Processing: ' || COALESCE(SUM(CASE WHEN status = 'processing' THEN 1 ELSE 0 END), 0) ||
         ' | Completed: ' || COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0) ||
         ' | Failed: ' || COALESCE(SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END), 0)
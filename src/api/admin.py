@@ -16,21 +16,33 @@ Authentication: Requires Admin role
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 from ..database import get_db
 from ..models.user import UserWithRole
-from ..models.audit_log import AuditLogInDB, AuditLogFilter
+from ..models.audit_log import AuditLogFilter
 from ..services.user_service import UserService
-from ..services.audit_service import AuditService
+from ..services.audit_service import AuditBuffer, AuditService, get_audit_queue
 from ..middleware.rbac import get_current_user_with_role
 
 
 router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 
 
+async def get_audit_buffer(db: Session = Depends(get_db)) -> AsyncGenerator[AuditBuffer, None]:
+    """
+    Request-scoped audit buffer dependency.
+
+    Audit events added during the request are handed to the background audit
+    queue on request teardown (written in one bulk INSERT if it is full).
+    Async so the hand-off runs on the event loop thread.
+    """
+    with AuditBuffer(AuditService(db), get_audit_queue()) as audit_buffer:
+        yield audit_buffer
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -334,7 +346,7 @@ async def get_system_configuration(
 async def update_system_configuration(
     request: Request,
     config: SystemConfiguration,
-    db: Session = Depends(get_db),
+    audit_buffer: AuditBuffer = Depends(get_audit_buffer),
     current_user=Depends(get_current_user_with_role("admin")),
 ):
     """
@@ -352,8 +364,6 @@ async def update_system_configuration(
         Updated configuration object
     """
     try:
-        audit_service = AuditService(db)
-
         # Get client IP and user agent
         ip_address = request.client.host
         user_agent = request.headers.get("user-agent")
@@ -366,8 +376,8 @@ async def update_system_configuration(
             "retention_days": 2555,
         }
 
-        # Create audit log
-        audit_service.log_action(
+        # Create audit log (written on request teardown)
+        audit_buffer.add(
             user_id=current_user.id,
             action_type="config_change",
             resource_type="config",
@@ -402,7 +412,10 @@ async def get_audit_logs(
     resource_type: Optional[str] = Query(None, description="Filter by resource type"),
     start_date: Optional[datetime] = Query(None, description="Filter from this date"),
     end_date: Optional[datetime] = Query(None, description="Filter until this date"),
-    page: int = Query(1, ge=1, description="Page number"),
+    after_timestamp: Optional[datetime] = Query(
+        None, description="Cursor: timestamp of the last log on the previous page"
+    ),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last log on the previous page"),
     limit: int = Query(50, ge=1, le=100, description="Results per page"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user_with_role("admin")),
@@ -419,6 +432,10 @@ async def get_audit_logs(
     - start_date: Filter from this date
     - end_date: Filter until this date
 
+    Pagination:
+    - Keyset on (timestamp, id), newest first. Pass pagination.next_cursor
+      back as after_timestamp/after_id to fetch the next page.
+
     Returns:
         Dict with audit logs array and pagination metadata
     """
@@ -431,19 +448,23 @@ async def get_audit_logs(
             resource_type=resource_type,
             start_date=start_date,
             end_date=end_date,
-            page=page,
+            after_timestamp=after_timestamp,
+            after_id=after_id,
             limit=limit,
         )
 
-        logs, total_count = audit_service.get_audit_logs(filters)
+        logs, has_more = audit_service.get_audit_logs(filters)
+
+        next_cursor = None
+        if has_more:
+            next_cursor = {"after_timestamp": logs[-1].timestamp, "after_id": logs[-1].id}
 
         return {
-            "audit_logs": [AuditLogInDB.from_orm(log).dict() for log in logs],
+            "audit_logs": [log.model_dump() for log in logs],
             "pagination": {
-                "page": page,
                 "limit": limit,
-                "total_count": total_count,
-                "total_pages": (total_count + limit - 1) // limit,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
             },
         }
 
@@ -524,7 +545,6 @@ async def get_user_profile(
         # Get recent activity (last 20 audit log entries)
         activity_filter = AuditLogFilter(
             user_id=user_id,
-            page=1,
             limit=20,
         )
         activity_logs, _ = audit_service.get_audit_logs(activity_filter)
@@ -533,10 +553,9 @@ async def get_user_profile(
         login_filter = AuditLogFilter(
             user_id=user_id,
             action_type="login",
-            page=1,
             limit=10,
         )
-        login_logs, _ = audit_service.get_audit_logs(login_filter)
+        login_logs, _ = audit_service.get_audit_logs(login_filter, include_values=False)
 
         login_history = [
             LoginHistoryEntry(
@@ -557,7 +576,7 @@ async def get_user_profile(
             created_at=user.created_at,
             last_modified_at=user.updated_at or user.created_at,
             assigned_permissions=role_permissions,
-            activity_history=[AuditLogInDB.from_orm(log).dict() for log in activity_logs],
+            activity_history=[log.model_dump() for log in activity_logs],
             login_history=login_history,
         )
 
@@ -398,7 +398,7 @@ async def get_resource_usage(
         analytics_service = AnalyticsService(db)
 
         # Get resource usage from service
-        resource_usage = analytics_service.get_resource_usage()
+        resource_usage = await analytics_service.get_resource_usage_async()
 
         return resource_usage
 
@@ -5,6 +5,7 @@ Feature 011: Document Ingestion & Batch Processing
 T041-T043: URL scraping, file upload, and cloud drive sync endpoints
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from typing import List, Optional
@@ -305,16 +306,18 @@ async def ingest_files(
     file_processor = FileProcessorService(chunk_size_tokens=ingestion_config.chunk_size)
 
     try:
-        # Read file contents
-        file_data_list = []
-        for upload_file in files:
-            content = await upload_file.read()
+        # Read file contents concurrently (uploads spooled to disk are read
+        # in the threadpool, so the reads overlap)
+        contents = await asyncio.gather(*(upload_file.read() for upload_file in files))
 
-            file_data_list.append({
+        file_data_list = [
+            {
                 'filename': upload_file.filename,
                 'content': content,
                 'content_type': upload_file.content_type
-            })
+            }
+            for upload_file, content in zip(files, contents)
+        ]
 
         # Process files in parallel (FR-018)
         process_result = await file_processor.process_files(
@@ -285,6 +285,7 @@ async def reprocess_failed_documents(
             total_documents=queued_count,
             processed_documents=0,
             failed_documents=0,
+            queued_count=queued_count,
             start_time=datetime.utcnow()
         )
         db.add(ingestion_job)
@@ -45,6 +45,10 @@ from src.api.routes.graph import router as graph_router  # Feature NEO4J-001: Gr
 from src.api.models.rag import ErrorResponse
 from rag.pipelines.haystack_retrieval import create_production_pipeline, HaystackRetrievalPipeline
 from src.services.rag_service import get_rag_service
+from src.services.audit_service import get_audit_queue
+from src.services.experimental_generation_service import close_experimental_generation_service
+from src.services.file_processor import shutdown_extraction_pool
+from src.services.openrouter_service import close_openrouter_client
 
 # Feature 011: Document Ingestion & Batch Processing
 from src.api import websocket
@@ -80,10 +84,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     3. Verify Qdrant connection
     4. Verify DeepInfra API key
     5. Set global pipeline instance for dependency injection
+    6. Start background audit log writer
 
     Shutdown:
-    1. Close Qdrant connections
-    2. Clean up pipeline resources
+    1. Drain queued audit log events
+    2. Close pooled OpenRouter connections
+    3. Stop file extraction worker processes
+    4. Close Qdrant connections
+    5. Clean up pipeline resources
 
     Yields:
         None (lifespan context)
@@ -130,6 +138,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         # Set global pipeline for dependency injection
         set_pipeline(pipeline)
 
+        # Start background audit log writer
+        audit_queue = get_audit_queue()
+        audit_queue.start()
+
         # Initialize Neo4J graph schema if enabled (Feature NEO4J-001)
         if os.getenv("GRAPH_EXTRACTION_ENABLED", "false").lower() == "true":
             try:
@@ -163,6 +175,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         # Shutdown
         logger.info("🛑 Shutting down UK Immigration RAG API...")
 
+        # Write any queued audit events before exiting
+        await audit_queue.stop()
+
+        # Close pooled connections of the template generation and OpenRouter services
+        await close_experimental_generation_service()
+        await close_openrouter_client()
+
+        # Stop file extraction worker processes
+        shutdown_extraction_pool()
+
         # Cleanup pipeline resources
         try:
             # Close Qdrant connections if needed
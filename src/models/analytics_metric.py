@@ -17,7 +17,7 @@ from typing import Optional
 from sqlalchemy import Column, BigInteger, VARCHAR, Float, TIMESTAMP, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import validates
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .base import Base
 
@@ -42,8 +42,8 @@ class AnalyticsMetric(Base):
         - timestamp must be within last 90 days (older metrics archived)
 
     Indexes:
-        - idx_analytics_timestamp: timestamp DESC
-        - idx_analytics_metric_name: metric_name
+        - idx_analytics_timestamp_category: (timestamp DESC, category)
+        - idx_analytics_name_timestamp: (metric_name, timestamp DESC) INCLUDE (metric_value)
         - idx_analytics_category: category
         - idx_analytics_composite: (metric_name, category, timestamp DESC)
     """
@@ -66,8 +66,19 @@ class AnalyticsMetric(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint("metric_value >= 0", name="ck_analytics_metric_value_positive"),
-        Index("idx_analytics_timestamp", "timestamp", postgresql_ops={"timestamp": "DESC"}),
-        Index("idx_analytics_metric_name", "metric_name"),
+        Index(
+            "idx_analytics_timestamp_category",
+            "timestamp",
+            "category",
+            postgresql_ops={"timestamp": "DESC"},
+        ),
+        Index(
+            "idx_analytics_name_timestamp",
+            "metric_name",
+            "timestamp",
+            postgresql_ops={"timestamp": "DESC"},
+            postgresql_include=["metric_value"],
+        ),
         Index("idx_analytics_category", "category"),
         Index(
             "idx_analytics_composite",
@@ -115,13 +126,15 @@ class AnalyticsMetricBase(BaseModel):
     category: str = Field(..., description="Category (search/performance/error/resource)")
     metadata: Optional[dict] = Field(None, description="Additional context (JSONB)")
 
-    @validator("metric_unit")
+    @field_validator("metric_unit")
+    @classmethod
     def validate_unit(cls, v):
         if v not in AnalyticsMetric.ALLOWED_UNITS:
             raise ValueError(f"metric_unit must be one of {AnalyticsMetric.ALLOWED_UNITS}")
         return v
 
-    @validator("category")
+    @field_validator("category")
+    @classmethod
     def validate_category_value(cls, v):
         if v not in AnalyticsMetric.ALLOWED_CATEGORIES:
             raise ValueError(f"category must be one of {AnalyticsMetric.ALLOWED_CATEGORIES}")
@@ -137,12 +150,11 @@ class AnalyticsMetricCreate(AnalyticsMetricBase):
 class AnalyticsMetricInDB(AnalyticsMetricBase):
     """Schema for metric stored in database."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     timestamp: datetime
 
-    class Config:
-        orm_mode = True
-
 
 class MetricAggregation(BaseModel):
     """Schema for aggregated metrics."""
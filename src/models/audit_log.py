@@ -18,10 +18,10 @@ CRITICAL: This table is immutable. No UPDATE or DELETE operations allowed.
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, BigInteger, VARCHAR, TIMESTAMP, ForeignKey, Index
+from sqlalchemy import Column, BigInteger, VARCHAR, TEXT, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import INET, JSONB
 from sqlalchemy.orm import relationship, validates
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 import ipaddress
 
 from .base import Base
@@ -60,14 +60,26 @@ class AuditLog(Base):
 
     Retention Policy:
         - 7 years (UK government compliance)
-        - Monthly partitioning for performance
+        - Monthly partitioning for performance (audit_logs_YYYY_MM, range on timestamp)
+        - Expired months are removed by dropping whole partitions
+
+    JSONB Indexing:
+        - old_value/new_value are deliberately NOT indexed: nothing queries
+          their contents, and a GIN index would add write amplification to
+          every audit INSERT
+        - If diff search is added, index only the searched column with
+          jsonb_path_ops (much smaller than the default jsonb_ops) and query
+          with containment, e.g.
+          CREATE INDEX idx_audit_logs_new_value_path ON audit_logs USING gin (new_value jsonb_path_ops);
+          WHERE new_value @> '{"role": "admin"}'::jsonb
     """
 
     __tablename__ = "audit_logs"
 
     # Columns
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    timestamp = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
+    # Part of the primary key: PostgreSQL requires the partition key in it
+    timestamp = Column(TIMESTAMP, primary_key=True, nullable=False, default=datetime.utcnow)
     user_id = Column(VARCHAR(36), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     action_type = Column(VARCHAR(50), nullable=False)
     resource_type = Column(VARCHAR(50), nullable=False)
@@ -95,15 +107,43 @@ class AuditLog(Base):
     # user = relationship("User", back_populates="audit_logs")
 
     __table_args__ = (
-        Index("idx_audit_logs_timestamp", "timestamp", postgresql_ops={"timestamp": "DESC"}),
-        Index("idx_audit_logs_user", "user_id", "timestamp", postgresql_ops={"timestamp": "DESC"}),
-        Index("idx_audit_logs_resource", "resource_type", "resource_id"),
+        Index(
+            "idx_audit_logs_timestamp_user",
+            "timestamp",
+            "user_id",
+            postgresql_ops={"timestamp": "DESC"},
+        ),
+        # Trailing (timestamp DESC, id DESC) matches the keyset pagination order
+        Index(
+            "idx_audit_logs_user_ts",
+            "user_id",
+            "timestamp",
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"},
+        ),
+        Index(
+            "idx_audit_logs_resource_ts",
+            "resource_type",
+            "resource_id",
+            "timestamp",
+            "id",
+            postgresql_ops={"timestamp": "DESC", "id": "DESC"},
+        ),
         Index(
             "idx_audit_logs_action",
             "action_type",
             "timestamp",
             postgresql_ops={"timestamp": "DESC"},
         ),
+        # Append-only rows are stored in timestamp order: BRIN serves wide
+        # range scans (e.g. action summaries) at a fraction of a BTREE's size
+        Index(
+            "idx_audit_logs_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     @validates("action_type")
@@ -138,9 +178,6 @@ class AuditLog(Base):
 
 
 # Pydantic schemas for API validation
-from sqlalchemy import TEXT
-
-
 class AuditLogBase(BaseModel):
     """Base audit log schema."""
 
@@ -181,6 +218,10 @@ class AuditLogCreate(AuditLogBase):
     """Schema for creating new audit log entry."""
 
     user_id: str = Field(..., description="User ID who performed action")
+    # Stamped when the event is recorded, not when a queued batch is written
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="When the action happened"
+    )
 
 
 class AuditLogInDB(AuditLogBase):
@@ -190,8 +231,7 @@ class AuditLogInDB(AuditLogBase):
     timestamp: datetime
     user_id: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogFilter(BaseModel):
@@ -202,7 +242,12 @@ class AuditLogFilter(BaseModel):
     resource_type: Optional[str] = Field(None, description="Filter by resource type")
     start_date: Optional[datetime] = Field(None, description="Filter from this date")
     end_date: Optional[datetime] = Field(None, description="Filter until this date")
-    page: int = Field(default=1, description="Page number", ge=1)
+    after_timestamp: Optional[datetime] = Field(
+        None, description="Keyset cursor: timestamp of the last log on the previous page"
+    )
+    after_id: Optional[int] = Field(
+        None, description="Keyset cursor: id of the last log on the previous page"
+    )
     limit: int = Field(default=50, description="Results per page", ge=1, le=100)
 
 
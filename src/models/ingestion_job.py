@@ -60,6 +60,16 @@ class IngestionJob(Base):
     processed_documents = Column(Integer, default=0)
     failed_documents = Column(Integer, default=0)
 
+    # Processing jobs currently queued / in progress. Together with
+    # processed_documents (completed) and failed_documents these are kept in
+    # step with ProcessingJob.status by atomic UPDATEs in
+    # BatchProcessorService, so status polling never scans processing_jobs.
+    queued_count = Column(Integer, nullable=False, default=0, server_default="0")
+    processing_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Celery group of the batch tasks, used to revoke them on cancel
+    celery_group_id = Column(String(36), nullable=True)
+
     # Timing
     start_time = Column(TIMESTAMP, nullable=True)
     end_time = Column(TIMESTAMP, nullable=True)
@@ -68,7 +78,9 @@ class IngestionJob(Base):
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    @validates('total_documents', 'processed_documents', 'failed_documents')
+    @validates(
+        'total_documents', 'processed_documents', 'failed_documents', 'queued_count', 'processing_count'
+    )
     def validate_document_counts(self, key, value):
         """Validate document counts are non-negative"""
         if value < 0:
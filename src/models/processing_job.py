@@ -7,6 +7,7 @@ T033: ProcessingJob with progress tracking, retry count, and ETA calculation
 
 from datetime import datetime, timedelta
 from enum import Enum
+from typing import Optional
 from sqlalchemy import Column, String, Integer, Float, ForeignKey, TIMESTAMP, Enum as SQLEnum, func
 from sqlalchemy.orm import validates
 
@@ -97,18 +98,29 @@ class ProcessingJob(Base):
 
         Uses current progress and elapsed time to estimate completion time.
         """
-        if self.status != ProcessingStatus.PROCESSING or self.progress == 0:
+        if self.status != ProcessingStatus.PROCESSING:
             return 0
 
-        elapsed = self.processing_time_seconds
+        return self.estimate_eta_seconds(self.progress, self.start_time)
+
+    @staticmethod
+    def estimate_eta_seconds(progress: float, start_time: Optional[datetime]) -> int:
+        """
+        Estimate remaining seconds for an in-progress job from its progress
+        percentage and start time (usable on plain column rows).
+        """
+        if progress == 0 or not start_time:
+            return 0
+
+        elapsed = int((datetime.utcnow() - start_time).total_seconds())
         if elapsed == 0:
             return 0
 
         # Calculate rate: progress_percentage / elapsed_seconds
-        rate = self.progress / elapsed
+        rate = progress / elapsed
 
         # Calculate remaining progress
-        remaining_progress = 100 - self.progress
+        remaining_progress = 100 - progress
 
         # Estimate remaining time
         if rate > 0:
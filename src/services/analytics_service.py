@@ -4,8 +4,10 @@ Business logic layer for system performance monitoring and metrics aggregation
 
 Service Methods:
 - record_metric(metric_name, value, unit, category, metadata): Record new metric
+- record_metrics(metrics): Record a batch of metrics in one INSERT
 - get_metrics_by_period(period, metric_types): Query metrics with time period filter
 - get_resource_usage(): Real-time system resource monitoring (CPU, memory, storage, connections)
+- get_resource_usage_async(): Coalesced, non-blocking variant of get_resource_usage
 - check_thresholds(): Evaluate metrics against alert thresholds
 - export_to_csv(metrics, filename): Export metrics to CSV format
 - export_to_json(metrics, filename): Export metrics to JSON format
@@ -21,13 +23,18 @@ Alert Thresholds (FR-AD-010):
 - memory_usage ≥95%: CRITICAL
 """
 
+import asyncio
 from typing import List, Optional, Dict, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert
 import psutil
 import csv
 import json
+import logging
+import threading
+import time
+from cachetools import TTLCache
 
 from ..models.analytics_metric import (
     AnalyticsMetric,
@@ -36,6 +43,27 @@ from ..models.analytics_metric import (
     MetricAggregation,
 )
 
+logger = logging.getLogger(__name__)
+
+# Core INSERT for the append-only metric ingest path
+_METRIC_INSERT = insert(AnalyticsMetric.__table__).returning(
+    AnalyticsMetric.__table__.c.id,
+    AnalyticsMetric.__table__.c.timestamp,
+    sort_by_parameter_order=True,
+)
+
+# Aggregation results shared across requests (services are created per request).
+# Dashboards poll the same windows repeatedly; entries expire after 60 seconds.
+_AGGREGATION_CACHE_TTL_SECONDS = 60
+_aggregation_cache: TTLCache = TTLCache(maxsize=256, ttl=_AGGREGATION_CACHE_TTL_SECONDS)
+_aggregation_cache_lock = threading.Lock()
+
+# Resource usage sampling blocks for ~1 second (cpu_percent interval), so
+# concurrent async callers share one in-flight collection and a short-lived result
+_RESOURCE_USAGE_TTL_SECONDS = 5.0
+_resource_usage_cache: Optional[Tuple[float, Dict]] = None
+_resource_usage_inflight: Optional[asyncio.Future] = None
+
 
 class Alert:
     """Alert object for threshold breaches."""
@@ -53,7 +81,15 @@ class Alert:
         self.threshold_value = threshold_value
         self.severity = severity  # WARNING or CRITICAL
         self.message = message
-        self.timestamp = datetime.utcnow()
+        # Stored as an int; converted to datetime only when serialized
+        self.timestamp_ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Alert creation time as a naive UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc).replace(
+            tzinfo=None
+        )
 
 
 class AnalyticsService:
@@ -105,7 +141,7 @@ class AnalyticsService:
             Created metric record
 
         Logs:
-            - INFO: Metric recorded successfully
+            - DEBUG: Metric recorded successfully
             - ERROR: Metric recording failed
         """
         metric_data = AnalyticsMetricCreate(
@@ -116,29 +152,63 @@ class AnalyticsService:
             metadata=metadata,
         )
 
-        new_metric = AnalyticsMetric(
-            metric_name=metric_data.metric_name,
-            metric_value=metric_data.metric_value,
-            metric_unit=metric_data.metric_unit,
-            category=metric_data.category,
-            metadata=metric_data.metadata,
-        )
-
         try:
-            self.db.add(new_metric)
+            # Metrics are append-only, so a Core INSERT ... RETURNING skips the
+            # ORM unit-of-work (identity map, flush, refresh) entirely
+            row = self.db.execute(_METRIC_INSERT, metric_data.model_dump()).one()
             self.db.commit()
-            self.db.refresh(new_metric)
 
-            print(
-                f"[AnalyticsService] Recorded metric: {metric_name}={value}{unit} (category={category})"
+            logger.debug(
+                "Recorded metric: %s=%s%s (category=%s)", metric_name, value, unit, category
+            )
+            # Values were already validated by AnalyticsMetricCreate above, so
+            # build the response without running the validators a second time.
+            return AnalyticsMetricInDB.model_construct(
+                id=row.id,
+                timestamp=row.timestamp,
+                **metric_data.model_dump(),
             )
-            return AnalyticsMetricInDB.from_orm(new_metric)
 
         except Exception as e:
             self.db.rollback()
-            print(f"[AnalyticsService] ERROR: Failed to record metric - {str(e)}")
+            logger.error("Failed to record metric - %s", e)
             raise ValueError(f"Failed to record metric: {str(e)}")
 
+    def record_metrics(self, metrics: List[AnalyticsMetricCreate]) -> List[AnalyticsMetricInDB]:
+        """
+        Record a batch of analytics metrics in a single INSERT statement.
+
+        Args:
+            metrics: Validated metrics to record
+
+        Returns:
+            Created metric records, in input order
+
+        Logs:
+            - DEBUG: Number of metrics recorded
+            - ERROR: Batch recording failed
+        """
+        if not metrics:
+            return []
+
+        rows_data = [metric.model_dump() for metric in metrics]
+
+        try:
+            # executemany with RETURNING is batched via insertmanyvalues
+            rows = self.db.execute(_METRIC_INSERT, rows_data).all()
+            self.db.commit()
+
+            logger.debug("Recorded %d metrics", len(rows))
+            return [
+                AnalyticsMetricInDB.model_construct(id=row.id, timestamp=row.timestamp, **data)
+                for row, data in zip(rows, rows_data)
+            ]
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Failed to record metrics batch - %s", e)
+            raise ValueError(f"Failed to record metrics: {str(e)}")
+
     def get_metrics_by_period(
         self, period: str, metric_types: Optional[List[str]] = None, granularity: str = "hour"
     ) -> List[MetricAggregation]:
@@ -151,7 +221,8 @@ class AnalyticsService:
             granularity: Aggregation granularity (hour, day, week)
 
         Returns:
-            List of aggregated metrics
+            List of aggregated metrics (cached for 60 seconds per
+            period/metric_types/granularity combination)
 
         Logs:
             - INFO: Number of metrics retrieved with period details
@@ -167,6 +238,13 @@ class AnalyticsService:
         if period not in period_map:
             raise ValueError(f"Invalid period '{period}'. Must be one of {list(period_map.keys())}")
 
+        cache_key = (period, tuple(sorted(metric_types or ())), granularity)
+        with _aggregation_cache_lock:
+            cached = _aggregation_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Serving metric aggregations for period=%s from cache", period)
+            return list(cached)
+
         start_time = datetime.utcnow() - period_map[period]
 
         query = self.db.query(
@@ -188,13 +266,14 @@ class AnalyticsService:
 
         results = query.all()
 
+        period_end = datetime.utcnow()
         aggregations = []
         for row in results:
             agg = MetricAggregation(
                 metric_name=row.metric_name,
                 category=row.category,
                 period_start=start_time,
-                period_end=datetime.utcnow(),
+                period_end=period_end,
                 count=row.count,
                 min_value=row.min_value,
                 max_value=row.max_value,
@@ -203,10 +282,46 @@ class AnalyticsService:
             )
             aggregations.append(agg)
 
-        print(
-            f"[AnalyticsService] Retrieved {len(aggregations)} metric aggregations for period={period}, granularity={granularity}"
+        logger.info(
+            "Retrieved %d metric aggregations for period=%s, granularity=%s",
+            len(aggregations),
+            period,
+            granularity,
         )
-        return aggregations
+        with _aggregation_cache_lock:
+            _aggregation_cache[cache_key] = aggregations
+        return list(aggregations)
+
+    async def get_resource_usage_async(self) -> Dict:
+        """
+        Get real-time system resource usage without blocking the event loop.
+
+        Concurrent callers are coalesced onto a single collection running in a
+        worker thread, and the result is reused for a few seconds.
+
+        Returns:
+            Dict with CPU, memory, storage, and database connection metrics
+        """
+        global _resource_usage_inflight
+
+        cached = _resource_usage_cache
+        if cached is not None and time.monotonic() - cached[0] < _RESOURCE_USAGE_TTL_SECONDS:
+            return cached[1]
+
+        if _resource_usage_inflight is None:
+            inflight = asyncio.ensure_future(asyncio.to_thread(self.get_resource_usage))
+
+            def _on_done(future: asyncio.Future) -> None:
+                global _resource_usage_cache, _resource_usage_inflight
+                _resource_usage_inflight = None
+                if not future.cancelled() and future.exception() is None:
+                    _resource_usage_cache = (time.monotonic(), future.result())
+
+            inflight.add_done_callback(_on_done)
+            _resource_usage_inflight = inflight
+
+        # Shield so a cancelled waiter does not cancel the shared collection
+        return await asyncio.shield(_resource_usage_inflight)
 
     def get_resource_usage(self) -> Dict:
         """
@@ -216,7 +331,7 @@ class AnalyticsService:
             Dict with CPU, memory, storage, and database connection metrics
 
         Logs:
-            - INFO: Resource usage details
+            - DEBUG: Resource usage details
         """
         # CPU usage (percentage)
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -284,8 +399,11 @@ class AnalyticsService:
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        print(
-            f"[AnalyticsService] Resource usage: CPU={cpu_percent}%, Memory={memory_percent}%, Storage={storage_percent}%"
+        logger.debug(
+            "Resource usage: CPU=%s%%, Memory=%s%%, Storage=%s%%",
+            cpu_percent,
+            memory_percent,
+            storage_percent,
         )
         return resource_usage
 
@@ -305,126 +423,41 @@ class AnalyticsService:
         # Get resource usage
         resource_usage = self.get_resource_usage()
 
-        # Check CPU usage
-        cpu_percent = resource_usage["cpu"]["percent"]
-        if cpu_percent >= self.THRESHOLDS["cpu_usage"]["CRITICAL"]:
-            alerts.append(
-                Alert(
-                    metric_name="cpu_usage",
-                    current_value=cpu_percent,
-                    threshold_value=self.THRESHOLDS["cpu_usage"]["CRITICAL"],
-                    severity="CRITICAL",
-                    message=f"CPU usage at {cpu_percent}% (threshold: {self.THRESHOLDS['cpu_usage']['CRITICAL']}%)",
-                )
-            )
-        elif cpu_percent >= self.THRESHOLDS["cpu_usage"]["WARNING"]:
-            alerts.append(
-                Alert(
-                    metric_name="cpu_usage",
-                    current_value=cpu_percent,
-                    threshold_value=self.THRESHOLDS["cpu_usage"]["WARNING"],
-                    severity="WARNING",
-                    message=f"CPU usage at {cpu_percent}% (threshold: {self.THRESHOLDS['cpu_usage']['WARNING']}%)",
-                )
-            )
-
-        # Check memory usage
-        memory_percent = resource_usage["memory"]["percent"]
-        if memory_percent >= self.THRESHOLDS["memory_usage"]["CRITICAL"]:
-            alerts.append(
-                Alert(
-                    metric_name="memory_usage",
-                    current_value=memory_percent,
-                    threshold_value=self.THRESHOLDS["memory_usage"]["CRITICAL"],
-                    severity="CRITICAL",
-                    message=f"Memory usage at {memory_percent}% (threshold: {self.THRESHOLDS['memory_usage']['CRITICAL']}%)",
-                )
-            )
-        elif memory_percent >= self.THRESHOLDS["memory_usage"]["WARNING"]:
-            alerts.append(
-                Alert(
-                    metric_name="memory_usage",
-                    current_value=memory_percent,
-                    threshold_value=self.THRESHOLDS["memory_usage"]["WARNING"],
-                    severity="WARNING",
-                    message=f"Memory usage at {memory_percent}% (threshold: {self.THRESHOLDS['memory_usage']['WARNING']}%)",
-                )
-            )
-
-        # Check storage usage
-        storage_percent = resource_usage["storage"]["percent"]
-        if storage_percent >= self.THRESHOLDS["storage_usage"]["CRITICAL"]:
+        # (metric name, display label, current value, unit) - None values are skipped
+        checks = [
+            ("cpu_usage", "CPU usage", resource_usage["cpu"]["percent"], "%"),
+            ("memory_usage", "Memory usage", resource_usage["memory"]["percent"], "%"),
+            ("storage_usage", "Storage usage", resource_usage["storage"]["percent"], "%"),
+            ("error_rate", "Error rate", self._calculate_error_rate(), "%"),
+            ("response_time", "Response time", self._calculate_avg_response_time(), "ms"),
+        ]
+
+        for metric_name, label, value, unit in checks:
+            if value is None:
+                continue
+
+            thresholds = self.THRESHOLDS[metric_name]
+            if value >= thresholds["CRITICAL"]:
+                severity = "CRITICAL"
+            elif value >= thresholds["WARNING"]:
+                severity = "WARNING"
+            else:
+                continue
+
+            threshold_value = thresholds[severity]
             alerts.append(
                 Alert(
-                    metric_name="storage_usage",
-                    current_value=storage_percent,
-                    threshold_value=self.THRESHOLDS["storage_usage"]["CRITICAL"],
-                    severity="CRITICAL",
-                    message=f"Storage usage at {storage_percent}% (threshold: {self.THRESHOLDS['storage_usage']['CRITICAL']}%)",
+                    metric_name=metric_name,
+                    current_value=value,
+                    threshold_value=threshold_value,
+                    severity=severity,
+                    message=f"{label} at {value}{unit} (threshold: {threshold_value}{unit})",
                 )
             )
-        elif storage_percent >= self.THRESHOLDS["storage_usage"]["WARNING"]:
-            alerts.append(
-                Alert(
-                    metric_name="storage_usage",
-                    current_value=storage_percent,
-                    threshold_value=self.THRESHOLDS["storage_usage"]["WARNING"],
-                    severity="WARNING",
-                    message=f"Storage usage at {storage_percent}% (threshold: {self.THRESHOLDS['storage_usage']['WARNING']}%)",
-                )
-            )
-
-        # Check error rate (query recent metrics)
-        error_rate = self._calculate_error_rate()
-        if error_rate is not None:
-            if error_rate >= self.THRESHOLDS["error_rate"]["CRITICAL"]:
-                alerts.append(
-                    Alert(
-                        metric_name="error_rate",
-                        current_value=error_rate,
-                        threshold_value=self.THRESHOLDS["error_rate"]["CRITICAL"],
-                        severity="CRITICAL",
-                        message=f"Error rate at {error_rate}% (threshold: {self.THRESHOLDS['error_rate']['CRITICAL']}%)",
-                    )
-                )
-            elif error_rate >= self.THRESHOLDS["error_rate"]["WARNING"]:
-                alerts.append(
-                    Alert(
-                        metric_name="error_rate",
-                        current_value=error_rate,
-                        threshold_value=self.THRESHOLDS["error_rate"]["WARNING"],
-                        severity="WARNING",
-                        message=f"Error rate at {error_rate}% (threshold: {self.THRESHOLDS['error_rate']['WARNING']}%)",
-                    )
-                )
 
-        # Check response time (query recent metrics)
-        avg_response_time = self._calculate_avg_response_time()
-        if avg_response_time is not None:
-            if avg_response_time >= self.THRESHOLDS["response_time"]["CRITICAL"]:
-                alerts.append(
-                    Alert(
-                        metric_name="response_time",
-                        current_value=avg_response_time,
-                        threshold_value=self.THRESHOLDS["response_time"]["CRITICAL"],
-                        severity="CRITICAL",
-                        message=f"Response time at {avg_response_time}ms (threshold: {self.THRESHOLDS['response_time']['CRITICAL']}ms)",
-                    )
-                )
-            elif avg_response_time >= self.THRESHOLDS["response_time"]["WARNING"]:
-                alerts.append(
-                    Alert(
-                        metric_name="response_time",
-                        current_value=avg_response_time,
-                        threshold_value=self.THRESHOLDS["response_time"]["WARNING"],
-                        severity="WARNING",
-                        message=f"Response time at {avg_response_time}ms (threshold: {self.THRESHOLDS['response_time']['WARNING']}ms)",
-                    )
-                )
-
-        print(f"[AnalyticsService] Threshold check complete: {len(alerts)} active alerts")
+        logger.info("Threshold check complete: %d active alerts", len(alerts))
         for alert in alerts:
-            print(f"[AnalyticsService] {alert.severity}: {alert.message}")
+            logger.warning("%s: %s", alert.severity, alert.message)
 
         return alerts
 
@@ -494,23 +527,23 @@ class AnalyticsService:
                 "category",
                 "metadata",
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for metric in metrics:
-                writer.writerow(
-                    {
-                        "id": metric.id,
-                        "metric_name": metric.metric_name,
-                        "metric_value": metric.metric_value,
-                        "metric_unit": metric.metric_unit,
-                        "timestamp": metric.timestamp.isoformat(),
-                        "category": metric.category,
-                        "metadata": json.dumps(metric.metadata) if metric.metadata else "",
-                    }
+            writer = csv.writer(csvfile)
+
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    metric.id,
+                    metric.metric_name,
+                    metric.metric_value,
+                    metric.metric_unit,
+                    metric.timestamp.isoformat(),
+                    metric.category,
+                    json.dumps(metric.metadata) if metric.metadata else "",
                 )
+                for metric in metrics
+            )
 
-        print(f"[AnalyticsService] Exported {len(metrics)} metrics to CSV: {filepath}")
+        logger.info("Exported %d metrics to CSV: %s", len(metrics), filepath)
         return filepath
 
     def export_to_json(self, metrics: List[AnalyticsMetricInDB], filename: str) -> str:
@@ -546,5 +579,5 @@ class AnalyticsService:
         with open(filepath, "w") as jsonfile:
             json.dump(metrics_data, jsonfile, indent=2)
 
-        print(f"[AnalyticsService] Exported {len(metrics)} metrics to JSON: {filepath}")
+        logger.info("Exported %d metrics to JSON: %s", len(metrics), filepath)
         return filepath
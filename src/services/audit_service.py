@@ -4,8 +4,19 @@ Business logic layer for audit log management (INSERT-ONLY, immutable records)
 
 Service Methods:
 - log_action(user_id, action_type, resource_type, resource_id, old_value, new_value, ip_address, user_agent): Create audit log entry
-- get_audit_logs(filters): Retrieve audit logs with pagination and filters
+- get_audit_logs(filters): Retrieve audit logs with keyset pagination and filters
 - get_user_activity(user_id, start_date, end_date): Get user activity in date range
+- get_resource_history(resource_type, resource_id): Get change history for a resource
+- log_actions_bulk(events): Create many audit log entries in one INSERT
+- log_actions_copy(events): Stream high-volume audit imports with COPY (psycopg3)
+- drop_expired_partitions(retention_years): Drop monthly partitions past retention
+
+AuditBuffer coalesces the audit events of one request scope and writes them
+with a single log_actions_bulk call when the scope ends.
+
+AuditQueue takes those writes off the request path: a bounded asyncio queue
+drained by a background task that writes up to AUDIT_QUEUE_BATCH_SIZE events
+per commit. Events that do not fit in the queue are written synchronously.
 
 CRITICAL:
 - Audit logs are IMMUTABLE (INSERT-ONLY)
@@ -14,14 +25,86 @@ CRITICAL:
 - Monthly partitioning for performance
 """
 
-from typing import List, Optional, Dict
+import asyncio
+import json
+import logging
+import os
+from typing import Callable, Iterable, List, Optional, Dict, Set
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
+from sqlalchemy import ColumnElement, insert, select, text, tuple_
 
 from ..models.audit_log import AuditLog, AuditLogCreate, AuditLogInDB, AuditLogFilter
 
+logger = logging.getLogger(__name__)
+# Per-call messages are DEBUG; set AUDIT_LOG_LEVEL=DEBUG to trace audit writes and reads
+_audit_log_level = os.getenv("AUDIT_LOG_LEVEL", "INFO").upper()
+if isinstance(logging.getLevelName(_audit_log_level), int):
+    logger.setLevel(_audit_log_level)
+else:
+    logger.setLevel(logging.INFO)
+    logger.warning("Unknown AUDIT_LOG_LEVEL %r, using INFO", _audit_log_level)
+
+# AuditQueue tuning: bound on queued events, events per commit, and how long
+# the writer waits for a batch to fill
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_QUEUE_BATCH_SIZE = 500
+AUDIT_QUEUE_FLUSH_INTERVAL_SECONDS = 0.05
+AUDIT_QUEUE_WRITE_ATTEMPTS = 3
+
+# Months ("YYYY_MM") whose audit_logs partition is known to exist in this process
+_known_partitions: Set[str] = set()
+
+# Column order used by log_actions_copy (id comes from the sequence default)
+_AUDIT_COPY_COLUMNS = (
+    "timestamp",
+    "user_id",
+    "action_type",
+    "resource_type",
+    "resource_id",
+    "old_value",
+    "new_value",
+    "ip_address",
+    "user_agent",
+)
+
+# Columns read by the audit log listings, in AuditLogInDB field order
+_AUDIT_LOG_COLUMNS = (
+    AuditLog.id,
+    AuditLog.timestamp,
+    AuditLog.user_id,
+    AuditLog.action_type,
+    AuditLog.resource_type,
+    AuditLog.resource_id,
+    AuditLog.old_value,
+    AuditLog.new_value,
+    AuditLog.ip_address,
+    AuditLog.user_agent,
+)
+
+# Listings that never show the diff skip decoding the (possibly large) JSONB
+_AUDIT_LOG_SUMMARY_COLUMNS = tuple(
+    column for column in _AUDIT_LOG_COLUMNS if column.key not in ("old_value", "new_value")
+)
+
+# One COUNT per known action type, each an index-only range scan on
+# idx_audit_logs_action (action_type, timestamp DESC) rather than a scan of
+# every row in range. The window SUM returns the total in the same
+# round-trip; action types with no rows in range are omitted.
+_ACTION_SUMMARY_SQL = text("""
+    SELECT a.action_type, c.count, SUM(c.count) OVER () AS total_actions
+    FROM unnest(CAST(:action_types AS VARCHAR[])) AS a(action_type)
+    CROSS JOIN LATERAL (
+        SELECT COUNT(*) AS count
+        FROM audit_logs
+        WHERE audit_logs.action_type = a.action_type
+          AND audit_logs.timestamp >= :start_date
+          AND audit_logs.timestamp <= :end_date
+    ) AS c
+    WHERE c.count > 0
+""")
+
 
 class AuditService:
     """
@@ -33,6 +116,9 @@ class AuditService:
     Handles audit log creation and retrieval with filtering.
     """
 
+    # UK government compliance retention period
+    RETENTION_YEARS = 7
+
     def __init__(self, db: Session):
         """
         Initialize AuditService with database session.
@@ -42,6 +128,32 @@ class AuditService:
         """
         self.db = db
 
+    def _ensure_partitions(self, timestamps: Iterable[datetime]) -> List[str]:
+        """
+        Make sure the monthly audit_logs partitions for timestamps exist.
+
+        The database call only happens until a month is known to this
+        process; partition creation itself is idempotent. Partitions are
+        created in the caller's transaction, so a month only becomes known
+        once that transaction commits (see _commit).
+
+        Returns:
+            Month keys to remember after commit
+        """
+        months = {timestamp.strftime("%Y_%m"): timestamp for timestamp in timestamps}
+        month_keys = [month_key for month_key in months if month_key not in _known_partitions]
+
+        for month_key in month_keys:
+            self.db.execute(
+                text("SELECT ensure_audit_logs_partition(:ts)"), {"ts": months[month_key]}
+            )
+        return month_keys
+
+    def _commit(self, month_keys: List[str]) -> None:
+        """Commit, then remember the partitions ensured in this transaction."""
+        self.db.commit()
+        _known_partitions.update(month_keys)
+
     def log_action(
         self,
         user_id: str,
@@ -73,7 +185,7 @@ class AuditService:
             ValueError: If audit log creation fails
 
         Logs:
-            - INFO: Audit log created
+            - DEBUG: Audit log created
             - ERROR: Audit log creation failed
 
         CRITICAL:
@@ -91,90 +203,238 @@ class AuditService:
             user_agent=user_agent,
         )
 
-        new_log = AuditLog(
-            user_id=audit_data.user_id,
-            action_type=audit_data.action_type,
-            resource_type=audit_data.resource_type,
-            resource_id=audit_data.resource_id,
-            old_value=audit_data.old_value,
-            new_value=audit_data.new_value,
-            ip_address=audit_data.ip_address,
-            user_agent=audit_data.user_agent,
-        )
+        values = audit_data.model_dump()
 
         try:
-            self.db.add(new_log)
-            self.db.commit()
-            self.db.refresh(new_log)
-
-            print(
-                f"[AuditService] Logged action: user={user_id}, action={action_type}, resource={resource_type}/{resource_id}"
+            month_keys = self._ensure_partitions([audit_data.timestamp])
+            # The id comes back from the INSERT itself (RETURNING), so no
+            # refresh SELECT is needed; every other column is known here
+            log_id = self.db.execute(
+                insert(AuditLog).values(values).returning(AuditLog.id)
+            ).scalar_one()
+            self._commit(month_keys)
+
+            logger.debug(
+                "Logged action: user=%s, action=%s, resource=%s/%s",
+                user_id,
+                action_type,
+                resource_type,
+                resource_id,
             )
-            return AuditLogInDB.from_orm(new_log)
+            return AuditLogInDB(id=log_id, **values)
 
         except IntegrityError as e:
             self.db.rollback()
             error_msg = f"Failed to create audit log: {str(e)}"
-            print(f"[AuditService] ERROR: {error_msg}")
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+    def log_actions_bulk(self, events: List[AuditLogCreate]) -> int:
+        """
+        Create many immutable audit log entries in a single round-trip.
+
+        All rows are sent as one multi-row INSERT ... VALUES statement and
+        committed together. Each row keeps the timestamp of its event.
+
+        Args:
+            events: Validated audit log entries
+
+        Returns:
+            Number of audit log entries created
+
+        Raises:
+            ValueError: If audit log creation fails
+
+        Logs:
+            - DEBUG: Number of audit logs created
+            - ERROR: Audit log creation failed
+        """
+        if not events:
+            return 0
+
+        rows = [event.model_dump() for event in events]
+
+        try:
+            month_keys = self._ensure_partitions(event.timestamp for event in events)
+            self.db.execute(insert(AuditLog).values(rows))
+            self._commit(month_keys)
+
+            logger.debug("Logged %d actions in bulk", len(rows))
+            return len(rows)
+
+        except IntegrityError as e:
+            self.db.rollback()
+            error_msg = f"Failed to create audit logs: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+    def log_actions_copy(self, events: List[AuditLogCreate]) -> int:
+        """
+        Stream many audit log entries with COPY ... FROM STDIN.
+
+        Intended for high-volume ingestion (replays, forensic imports) where
+        even multi-row INSERTs are round-trip and parse bound. Requires the
+        psycopg (v3) driver; other drivers fall back to log_actions_bulk.
+
+        Args:
+            events: Validated audit log entries
+
+        Returns:
+            Number of audit log entries created
+
+        Raises:
+            ValueError: If audit log creation fails
+
+        Logs:
+            - DEBUG: Number of audit logs copied
+            - ERROR: Audit log copy failed
+        """
+        if not events:
+            return 0
+
+        if self.db.get_bind().dialect.driver != "psycopg":
+            return self.log_actions_bulk(events)
+
+        from psycopg import Error as PsycopgError
+        from psycopg.types.json import Jsonb
+
+        copy_sql = f"COPY audit_logs ({', '.join(_AUDIT_COPY_COLUMNS)}) FROM STDIN"
+
+        try:
+            month_keys = self._ensure_partitions(event.timestamp for event in events)
+            dbapi_connection = self.db.connection().connection.driver_connection
+            with dbapi_connection.cursor() as cursor:
+                with cursor.copy(copy_sql) as copy:
+                    for event in events:
+                        copy.write_row(
+                            (
+                                event.timestamp,
+                                event.user_id,
+                                event.action_type,
+                                event.resource_type,
+                                event.resource_id,
+                                Jsonb(event.old_value) if event.old_value is not None else None,
+                                Jsonb(event.new_value) if event.new_value is not None else None,
+                                event.ip_address,
+                                event.user_agent,
+                            )
+                        )
+            self._commit(month_keys)
+
+            logger.debug("Copied %d actions", len(events))
+            return len(events)
+
+        except PsycopgError as e:
+            self.db.rollback()
+            error_msg = f"Failed to copy audit logs: {str(e)}"
+            logger.error(error_msg)
             raise ValueError(error_msg)
 
-    def get_audit_logs(self, filters: AuditLogFilter) -> tuple[List[AuditLogInDB], int]:
+    def _fetch_page(
+        self,
+        conditions: List[ColumnElement[bool]],
+        after_timestamp: Optional[datetime],
+        after_id: Optional[int],
+        limit: int,
+        include_values: bool = True,
+    ) -> tuple[List[AuditLogInDB], bool]:
+        """
+        Fetch one page of audit logs using keyset pagination on (timestamp, id).
+
+        Rows are ordered newest first. The cursor is the (timestamp, id) of the
+        last row of the previous page, so each page is an index range scan
+        instead of an OFFSET that re-reads every skipped row. One extra row is
+        fetched to tell whether another page exists, which avoids a COUNT(*).
+
+        Plain column rows are validated straight into AuditLogInDB, skipping
+        ORM entity construction and the identity map.
+
+        Args:
+            conditions: Filter expressions on AuditLog columns
+            after_timestamp: Timestamp of the last log on the previous page
+            after_id: ID of the last log on the previous page
+            limit: Results per page
+            include_values: Also load old_value/new_value (None otherwise)
+
+        Returns:
+            Tuple of (audit log list, has_more)
         """
-        Retrieve audit logs with pagination and filters.
+        columns = _AUDIT_LOG_COLUMNS if include_values else _AUDIT_LOG_SUMMARY_COLUMNS
+        stmt = select(*columns).where(*conditions)
+
+        if after_timestamp is not None and after_id is not None:
+            stmt = stmt.where(
+                tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(after_timestamp, after_id)
+            )
+
+        stmt = stmt.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(limit + 1)
+        rows = self.db.execute(stmt).mappings().all()
+        has_more = len(rows) > limit
+
+        return [AuditLogInDB.model_validate(dict(row)) for row in rows[:limit]], has_more
+
+    def get_audit_logs(
+        self, filters: AuditLogFilter, include_values: bool = True
+    ) -> tuple[List[AuditLogInDB], bool]:
+        """
+        Retrieve audit logs with keyset pagination and filters.
+
+        Pass the timestamp and id of the last returned log as
+        filters.after_timestamp / filters.after_id to fetch the next page.
 
         Args:
             filters: AuditLogFilter object with filter criteria
+            include_values: Load old_value/new_value (skip for listings without diffs)
 
         Returns:
-            Tuple of (audit log list, total count)
+            Tuple of (audit log list, has_more)
 
         Logs:
-            - INFO: Number of audit logs retrieved with filter details
+            - DEBUG: Number of audit logs retrieved with filter details
         """
-        query = self.db.query(AuditLog)
+        conditions = []
 
         # Apply filters
         if filters.user_id:
-            query = query.filter(AuditLog.user_id == filters.user_id)
+            conditions.append(AuditLog.user_id == filters.user_id)
 
         if filters.action_type:
-            query = query.filter(AuditLog.action_type == filters.action_type)
+            conditions.append(AuditLog.action_type == filters.action_type)
 
         if filters.resource_type:
-            query = query.filter(AuditLog.resource_type == filters.resource_type)
+            conditions.append(AuditLog.resource_type == filters.resource_type)
 
         if filters.start_date:
-            query = query.filter(AuditLog.timestamp >= filters.start_date)
+            conditions.append(AuditLog.timestamp >= filters.start_date)
 
         if filters.end_date:
-            query = query.filter(AuditLog.timestamp <= filters.end_date)
-
-        # Get total count
-        total_count = query.count()
+            conditions.append(AuditLog.timestamp <= filters.end_date)
 
-        # Apply pagination
-        offset = (filters.page - 1) * filters.limit
-        logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(filters.limit).all()
-
-        log_list = [AuditLogInDB.from_orm(log) for log in logs]
-
-        print(
-            f"[AuditService] Retrieved {len(log_list)} audit logs (page={filters.page}, limit={filters.limit})"
+        log_list, has_more = self._fetch_page(
+            conditions, filters.after_timestamp, filters.after_id, filters.limit, include_values
         )
-        print(
-            f"[AuditService] Filters: user_id={filters.user_id}, action_type={filters.action_type}, resource_type={filters.resource_type}"
+
+        logger.debug(
+            "Retrieved %d audit logs (limit=%d, has_more=%s); filters: user_id=%s, action_type=%s, resource_type=%s",
+            len(log_list),
+            filters.limit,
+            has_more,
+            filters.user_id,
+            filters.action_type,
+            filters.resource_type,
         )
 
-        return log_list, total_count
+        return log_list, has_more
 
     def get_user_activity(
         self,
         user_id: str,
         start_date: datetime,
         end_date: datetime,
-        page: int = 1,
+        after_timestamp: Optional[datetime] = None,
+        after_id: Optional[int] = None,
         limit: int = 100,
-    ) -> tuple[List[AuditLogInDB], int]:
+    ) -> tuple[List[AuditLogInDB], bool]:
         """
         Get user activity in date range.
 
@@ -182,70 +442,72 @@ class AuditService:
             user_id: User UUID
             start_date: Activity start date
             end_date: Activity end date
-            page: Page number (1-indexed)
+            after_timestamp: Keyset cursor timestamp (last log of previous page)
+            after_id: Keyset cursor id (last log of previous page)
             limit: Results per page
 
         Returns:
-            Tuple of (audit log list, total count)
+            Tuple of (audit log list, has_more)
 
         Logs:
-            - INFO: User activity summary
+            - DEBUG: User activity summary
         """
-        query = self.db.query(AuditLog).filter(
-            and_(
-                AuditLog.user_id == user_id,
-                AuditLog.timestamp >= start_date,
-                AuditLog.timestamp <= end_date,
-            )
-        )
-
-        total_count = query.count()
-
-        offset = (page - 1) * limit
-        logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
-
-        log_list = [AuditLogInDB.from_orm(log) for log in logs]
-
-        print(
-            f"[AuditService] Retrieved user activity for {user_id}: {len(log_list)} actions (total={total_count})"
+        conditions = [
+            AuditLog.user_id == user_id,
+            AuditLog.timestamp >= start_date,
+            AuditLog.timestamp <= end_date,
+        ]
+
+        log_list, has_more = self._fetch_page(conditions, after_timestamp, after_id, limit)
+
+        logger.debug(
+            "Retrieved user activity for %s: %d actions (has_more=%s), %s to %s",
+            user_id,
+            len(log_list),
+            has_more,
+            start_date,
+            end_date,
         )
-        print(f"[AuditService] Date range: {start_date} to {end_date}")
 
-        return log_list, total_count
+        return log_list, has_more
 
     def get_resource_history(
-        self, resource_type: str, resource_id: str, page: int = 1, limit: int = 50
-    ) -> tuple[List[AuditLogInDB], int]:
+        self,
+        resource_type: str,
+        resource_id: str,
+        after_timestamp: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> tuple[List[AuditLogInDB], bool]:
         """
         Get complete history for specific resource.
 
         Args:
             resource_type: Resource type (user/role/template/workflow/config/session)
             resource_id: Resource UUID
-            page: Page number (1-indexed)
+            after_timestamp: Keyset cursor timestamp (last log of previous page)
+            after_id: Keyset cursor id (last log of previous page)
             limit: Results per page
 
         Returns:
-            Tuple of (audit log list, total count)
+            Tuple of (audit log list, has_more)
 
         Logs:
-            - INFO: Resource history summary
+            - DEBUG: Resource history summary
         """
-        query = self.db.query(AuditLog).filter(
-            and_(AuditLog.resource_type == resource_type, AuditLog.resource_id == resource_id)
-        )
+        conditions = [AuditLog.resource_type == resource_type, AuditLog.resource_id == resource_id]
 
-        total_count = query.count()
+        log_list, has_more = self._fetch_page(conditions, after_timestamp, after_id, limit)
 
-        offset = (page - 1) * limit
-        logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
-
-        log_list = [AuditLogInDB.from_orm(log) for log in logs]
-
-        print(f"[AuditService] Retrieved resource history: {resource_type}/{resource_id}")
-        print(f"[AuditService] Total changes: {total_count}, returned: {len(log_list)}")
+        logger.debug(
+            "Retrieved resource history for %s/%s: %d entries (has_more=%s)",
+            resource_type,
+            resource_id,
+            len(log_list),
+            has_more,
+        )
 
-        return log_list, total_count
+        return log_list, has_more
 
     def get_action_summary(self, start_date: datetime, end_date: datetime) -> Dict:
         """
@@ -259,26 +521,27 @@ class AuditService:
             Dict with action type counts
 
         Logs:
-            - INFO: Action summary details
+            - DEBUG: Action summary details
         """
-        from sqlalchemy import func
-
-        query = (
-            self.db.query(AuditLog.action_type, func.count(AuditLog.id).label("count"))
-            .filter(and_(AuditLog.timestamp >= start_date, AuditLog.timestamp <= end_date))
-            .group_by(AuditLog.action_type)
-        )
-
-        results = query.all()
+        results = self.db.execute(
+            _ACTION_SUMMARY_SQL,
+            {
+                "action_types": AuditLog.ALLOWED_ACTION_TYPES,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+        ).all()
 
         summary = {row.action_type: row.count for row in results}
-
-        total_actions = sum(summary.values())
-
-        print(
-            f"[AuditService] Action summary ({start_date} to {end_date}): {total_actions} total actions"
+        total_actions = int(results[0].total_actions) if results else 0
+
+        logger.debug(
+            "Action summary (%s to %s): %d total actions, breakdown: %s",
+            start_date,
+            end_date,
+            total_actions,
+            summary,
         )
-        print(f"[AuditService] Breakdown: {summary}")
 
         return {
             "total_actions": total_actions,
@@ -286,3 +549,300 @@ class AuditService:
             "period_start": start_date.isoformat(),
             "period_end": end_date.isoformat(),
         }
+
+    def drop_expired_partitions(self, retention_years: int = RETENTION_YEARS) -> int:
+        """
+        Drop monthly audit_logs partitions older than the retention period.
+
+        Intended to run from a scheduled (nightly) job. Dropping whole
+        partitions avoids row-level DELETEs, which the immutability trigger
+        forbids.
+
+        Args:
+            retention_years: Number of years of audit history to keep
+
+        Returns:
+            Number of partitions dropped
+
+        Logs:
+            - INFO: Number of partitions dropped
+        """
+        now = datetime.utcnow()
+        cutoff = datetime(now.year - retention_years, now.month, 1)
+
+        dropped = self.db.execute(
+            text("SELECT drop_audit_logs_partitions_before(:cutoff)"), {"cutoff": cutoff}
+        ).scalar()
+        self.db.commit()
+
+        logger.info("Dropped %d audit log partitions older than %s", dropped, cutoff.date())
+        return dropped
+
+
+class AuditBuffer:
+    """
+    Request-scoped buffer that coalesces audit events into one bulk INSERT.
+
+    Events are validated when added and written by flush(), so a request that
+    records several actions pays for a single round-trip and commit.
+    """
+
+    def __init__(self, audit_service: AuditService, audit_queue: Optional["AuditQueue"] = None):
+        """
+        Initialize AuditBuffer.
+
+        Args:
+            audit_service: Service used to write buffered events
+            audit_queue: Background queue to hand events to (written directly
+                if omitted, not running or full)
+        """
+        self.audit_service = audit_service
+        self.audit_queue = audit_queue
+        self._events: List[AuditLogCreate] = []
+
+    def add(
+        self,
+        user_id: str,
+        action_type: str,
+        resource_type: str,
+        resource_id: str,
+        old_value: Optional[Dict],
+        new_value: Optional[Dict],
+        ip_address: str,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """Validate and buffer an audit event (same arguments as log_action)."""
+        self._events.append(
+            AuditLogCreate(
+                user_id=user_id,
+                action_type=action_type,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                old_value=old_value,
+                new_value=new_value,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
+        )
+
+    def flush(self) -> int:
+        """
+        Hand all buffered events to the audit queue (or write them) and clear
+        the buffer.
+
+        Returns:
+            Number of events queued or written
+        """
+        events, self._events = self._events, []
+        rejected = self.audit_queue.offer(events) if self.audit_queue is not None else events
+        self.audit_service.log_actions_bulk(rejected)
+        return len(events)
+
+    def __enter__(self) -> "AuditBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+
+class AuditQueue:
+    """
+    Bounded in-process queue of audit events drained by a background writer.
+
+    The writer collects up to batch_size events (waiting at most
+    flush_interval for a batch to fill) and writes them with one
+    log_actions_bulk commit, so request handlers do not wait on the audit
+    INSERT. offer() never blocks: events that do not fit are returned to the
+    caller to be written synchronously, so nothing is dropped on overflow.
+
+    start() and stop() are called from the application lifespan; stop()
+    drains everything still queued before returning.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        maxsize: int = AUDIT_QUEUE_MAXSIZE,
+        batch_size: int = AUDIT_QUEUE_BATCH_SIZE,
+        flush_interval: float = AUDIT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize AuditQueue.
+
+        Args:
+            session_factory: Creates a database session for each batch write
+            maxsize: Maximum number of queued events
+            batch_size: Maximum events written per commit
+            flush_interval: Seconds to wait for a batch to fill
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._writer_task: Optional[asyncio.Task] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be written."""
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is accepting events."""
+        return self._writer_task is not None and not self._writer_task.done()
+
+    def start(self) -> None:
+        """Start the background writer (must be called from the event loop)."""
+        if self.running:
+            return
+        self._writer_task = asyncio.create_task(self._run())
+        logger.info(
+            "Audit queue writer started (maxsize=%d, batch_size=%d)", self._queue.maxsize, self.batch_size
+        )
+
+    async def stop(self) -> None:
+        """Write all queued events and stop the background writer."""
+        if not self.running:
+            return
+        writer_task, self._writer_task = self._writer_task, None
+        # Queued after every pending event, so the writer drains them first
+        await self._queue.put(self._STOP)
+        await writer_task
+        logger.info("Audit queue writer stopped, queue drained")
+
+    def offer(self, events: List[AuditLogCreate]) -> List[AuditLogCreate]:
+        """
+        Queue events for the background writer without blocking.
+
+        Must be called from the event loop thread.
+
+        Args:
+            events: Validated audit log entries
+
+        Returns:
+            Events that were not queued (writer not running or queue full);
+            the caller must write these itself
+        """
+        if not self.running:
+            return events
+
+        for index, event in enumerate(events):
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Audit queue full (%d events), writing synchronously", self.depth)
+                return events[index:]
+        return []
+
+    async def _run(self) -> None:
+        """Writer loop: write batches until the stop sentinel is reached."""
+        while True:
+            batch = await self._next_batch()
+            stopping = batch and batch[-1] is self._STOP
+            if stopping:
+                batch.pop()
+            if batch:
+                await self._write(batch)
+            if stopping:
+                return
+
+    async def _next_batch(self) -> list:
+        """Wait for one event, then gather more until full or flush_interval passes."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size and batch[-1] is not self._STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        return batch
+
+    async def _write(self, events: List[AuditLogCreate]) -> None:
+        """
+        Write a batch off the event loop, retrying transient failures.
+
+        A batch rejected by an integrity violation (log_actions_bulk raises
+        ValueError) cannot succeed on retry, so its events are written one by
+        one and only the offending events are dead-lettered.
+        """
+        unwritten = events
+        for attempt in range(1, AUDIT_QUEUE_WRITE_ATTEMPTS + 1):
+            try:
+                await asyncio.to_thread(self._write_batch, events)
+                return
+            except ValueError as e:
+                logger.error(
+                    "Audit batch of %d events rejected, writing events individually: %s",
+                    len(events),
+                    e,
+                )
+                unwritten = await asyncio.to_thread(self._write_each, events)
+                break
+            except Exception as e:
+                logger.error(
+                    "Failed to write %d audit events (attempt %d/%d): %s",
+                    len(events),
+                    attempt,
+                    AUDIT_QUEUE_WRITE_ATTEMPTS,
+                    e,
+                )
+                await asyncio.sleep(self.flush_interval * attempt)
+
+        # Keep a replayable record of events that could not be persisted
+        for event in unwritten:
+            logger.error("Unwritten audit event: %s", json.dumps(event.model_dump(), default=str))
+
+    def _write_batch(self, events: List[AuditLogCreate]) -> None:
+        """Write one batch in its own session (runs in a worker thread)."""
+        db = self.session_factory()
+        try:
+            AuditService(db).log_actions_bulk(events)
+        finally:
+            db.close()
+
+    def _write_each(self, events: List[AuditLogCreate]) -> List[AuditLogCreate]:
+        """
+        Write events one commit each in a single session (runs in a worker
+        thread).
+
+        Returns:
+            Events that could not be written
+        """
+        db = self.session_factory()
+        unwritten = []
+        try:
+            audit_service = AuditService(db)
+            for event in events:
+                try:
+                    audit_service.log_actions_bulk([event])
+                except Exception as e:
+                    db.rollback()
+                    logger.error("Failed to write audit event: %s", e)
+                    unwritten.append(event)
+        finally:
+            db.close()
+        return unwritten
+
+
+# Singleton instance
+_audit_queue_instance: Optional[AuditQueue] = None
+
+
+def get_audit_queue() -> AuditQueue:
+    """Get or create singleton AuditQueue instance."""
+    global _audit_queue_instance
+    if _audit_queue_instance is None:
+        from ..database import SessionLocal
+
+        _audit_queue_instance = AuditQueue(SessionLocal)
+    return _audit_queue_instance
@@ -3,17 +3,63 @@ Batch processor service with Celery integration.
 
 Feature 011: Document Ingestion & Batch Processing
 T039: Celery task queue with worker distribution, retry logic, and progress tracking
+
+The batches of one ingestion job run as a chord whose callback,
+finalize_ingestion_job, closes the IngestionJob once every batch is done.
+Each process_document_batch task receives retry_attempts, the number of
+times it retries a failed document (FR-030).
+
+Cancelling a job revokes its batch tasks (the chord's group ID is stored on
+IngestionJob.celery_group_id): batches still waiting are discarded and
+running ones are terminated.
 """
 
+import os
+import time
+import uuid
 from datetime import datetime
 from typing import List, Dict, Optional
-from celery import Celery, group
-from celery.result import AsyncResult
+from celery import Celery, chord, shared_task
+from celery.result import AsyncResult, GroupResult
+from sqlalchemy import case, cast, insert, literal, select, update
 from sqlalchemy.orm import Session
 
 from src.models.processing_job import ProcessingJob, ProcessingStatus
 from src.models.processing_queue import ProcessingQueue, QueuePriority
-from src.models.ingestion_job import IngestionJob, IngestionStatus
+from src.models.ingestion_job import IngestionJob, IngestionMethod, IngestionStatus
+
+# IngestionJob counter column tracking the number of jobs in each status
+STATUS_COUNTER_COLUMNS = {
+    ProcessingStatus.QUEUED: "queued_count",
+    ProcessingStatus.PROCESSING: "processing_count",
+    ProcessingStatus.COMPLETED: "processed_documents",
+    ProcessingStatus.FAILED: "failed_documents",
+}
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The 48-bit millisecond timestamp prefix makes new processing job and
+    queue IDs sort after existing ones, so primary key inserts append to the
+    rightmost index page instead of splitting random pages as uuid4 does.
+    The hex text form sorts the same way, so this also holds for the
+    String(36) key columns.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Set version 7 and the RFC 4122 variant over the random bits
+    value = value & ~(0xF << 76) | (0x7 << 76)
+    value = value & ~(0x3 << 62) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+# ProcessingQueue.source_type for each ingestion method
+QUEUE_SOURCE_TYPES = {
+    IngestionMethod.URL: "url",
+    IngestionMethod.UPLOAD: "file",
+    IngestionMethod.CLOUD: "cloud",
+}
 
 
 class BatchProcessorService:
@@ -49,7 +95,7 @@ class BatchProcessorService:
             document_ids: List of document IDs to process
             chunk_size: Token count per chunk (FR-028, FR-032)
             parallel_workers: Number of parallel workers (1-10, FR-029)
-            retry_attempts: Retry count for failed chunks (0-5, FR-030)
+            retry_attempts: Retry count for failed documents (0-5, FR-030)
 
         Returns:
             Dict with:
@@ -66,65 +112,79 @@ class BatchProcessorService:
         if not (0 <= retry_attempts <= 5):
             raise ValueError("retry_attempts must be between 0 and 5")
 
-        # Create processing queue entries
-        processing_jobs = []
-
-        for doc_id in document_ids:
-            # Create processing job
-            processing_job = ProcessingJob(
-                processing_job_id=self._generate_job_id(),
-                ingestion_job_id=ingestion_job_id,
-                document_id=doc_id,
-                status=ProcessingStatus.QUEUED,
-                progress=0.0,
-                retry_count=0,
-            )
+        ingestion_job = self.db.query(IngestionJob).filter_by(job_id=ingestion_job_id).first()
 
-            self.db.add(processing_job)
-            processing_jobs.append(processing_job.processing_job_id)
+        if not ingestion_job:
+            raise ValueError(f"Ingestion job not found: {ingestion_job_id}")
 
-            # Add to processing queue
-            queue_entry = ProcessingQueue(
-                queue_id=self._generate_queue_id(),
-                ingestion_job_id=ingestion_job_id,
-                document_id=doc_id,
-                priority=QueuePriority.NORMAL,
+        # Create processing jobs and queue entries with one multi-row INSERT
+        # each instead of two INSERTs per document
+        processing_jobs = [self._generate_job_id() for _ in document_ids]
+
+        if document_ids:
+            self.db.execute(
+                insert(ProcessingJob),
+                [
+                    {
+                        "processing_job_id": processing_job_id,
+                        "ingestion_job_id": ingestion_job_id,
+                        "document_id": doc_id,
+                        "status": ProcessingStatus.QUEUED,
+                        "progress": 0.0,
+                        "retry_count": 0,
+                    }
+                    for processing_job_id, doc_id in zip(processing_jobs, document_ids)
+                ],
+            )
+            self.db.execute(
+                insert(ProcessingQueue),
+                self._queue_rows(
+                    ingestion_job_id,
+                    QUEUE_SOURCE_TYPES[ingestion_job.method],
+                    document_ids,
+                    QueuePriority.NORMAL,
+                ),
             )
 
-            self.db.add(queue_entry)
+        ingestion_job.status = IngestionStatus.IN_PROGRESS
+        ingestion_job.total_documents = len(document_ids)
+        self._adjust_status_counts(ingestion_job_id, {ProcessingStatus.QUEUED: len(document_ids)})
 
+        # Single commit, before dispatch so workers see the queued rows
         self.db.commit()
 
         # Distribute work across workers using Celery groups (FR-034)
-        # Split documents into batches for each worker
-        batch_size = len(document_ids) // parallel_workers or 1
+        # Round-robin split: one batch per worker, sizes differ by at most one
+        # (fewer batches only when there are fewer documents than workers)
         batches = [
-            document_ids[i : i + batch_size] for i in range(0, len(document_ids), batch_size)
+            document_ids[i::parallel_workers]
+            for i in range(min(parallel_workers, len(document_ids)))
         ]
 
-        # Create Celery task group
-        task_signatures = []
-        for batch in batches:
-            task_signatures.append(
-                self.celery.signature(
-                    "process_document_batch", args=[batch, chunk_size, retry_attempts]
-                )
+        # Create Celery task group; each batch retries its failed documents
+        # up to retry_attempts times (FR-030)
+        task_signatures = [
+            self.celery.signature(
+                "process_document_batch",
+                args=[batch, chunk_size, retry_attempts],
+                kwargs={"ingestion_job_id": ingestion_job_id},
             )
+            for batch in batches
+        ]
+
+        # Execute tasks in parallel, closing the ingestion job when all finish
+        job = chord(task_signatures)(
+            self.celery.signature("finalize_ingestion_job", args=[ingestion_job_id])
+        )
 
-        # Execute tasks in parallel
-        job = group(task_signatures).apply_async()
+        # Keep the batch group restorable so cancel_ingestion can revoke it
+        job.parent.save()
+        ingestion_job.celery_group_id = job.parent.id
+        self.db.commit()
 
         # Estimate duration (simplified: assume 30 seconds per document)
         estimated_duration = len(document_ids) * 30 // parallel_workers
 
-        # Update ingestion job
-        ingestion_job = self.db.query(IngestionJob).filter_by(job_id=ingestion_job_id).first()
-
-        if ingestion_job:
-            ingestion_job.status = IngestionStatus.IN_PROGRESS
-            ingestion_job.total_documents = len(document_ids)
-            self.db.commit()
-
         return {
             "job_id": ingestion_job_id,
             "queued_documents": len(document_ids),
@@ -148,48 +208,45 @@ class BatchProcessorService:
             - queue_status: Dict with pending/processing/completed counts
             - progress_percentage: Overall progress (0-100)
             - eta_seconds: Estimated time remaining
+
+        Status counts are read from the counters on the IngestionJob row;
+        processing_jobs is only queried while jobs are in progress.
         """
         ingestion_job = self.db.query(IngestionJob).filter_by(job_id=ingestion_job_id).first()
 
         if not ingestion_job:
             raise ValueError(f"Ingestion job not found: {ingestion_job_id}")
 
-        # Get processing jobs
-        processing_jobs = (
-            self.db.query(ProcessingJob).filter_by(ingestion_job_id=ingestion_job_id).all()
-        )
-
         # Count statuses
-        queued_count = sum(1 for job in processing_jobs if job.status == ProcessingStatus.QUEUED)
-        processing_count = sum(
-            1 for job in processing_jobs if job.status == ProcessingStatus.PROCESSING
-        )
-        completed_count = sum(
-            1 for job in processing_jobs if job.status == ProcessingStatus.COMPLETED
-        )
-        failed_count = sum(1 for job in processing_jobs if job.status == ProcessingStatus.FAILED)
+        queued_count = ingestion_job.queued_count
+        processing_count = ingestion_job.processing_count
+        completed_count = ingestion_job.processed_documents
+        failed_count = ingestion_job.failed_documents
+
+        # In-flight jobs (at most one per worker) for active workers and ETA
+        active_jobs = []
+        if processing_count > 0:
+            active_jobs = self.db.execute(
+                select(
+                    ProcessingJob.worker_id, ProcessingJob.progress, ProcessingJob.start_time
+                ).where(
+                    ProcessingJob.ingestion_job_id == ingestion_job_id,
+                    ProcessingJob.status == ProcessingStatus.PROCESSING,
+                )
+            ).all()
 
         # Get active workers
-        active_workers = list(
-            set(
-                job.worker_id
-                for job in processing_jobs
-                if job.status == ProcessingStatus.PROCESSING and job.worker_id
-            )
-        )
+        active_workers = list({job.worker_id for job in active_jobs if job.worker_id})
 
         # Calculate overall progress
         progress_percentage = ingestion_job.progress_percentage
 
         # Calculate ETA (based on average processing time)
-        if processing_count > 0:
-            processing_jobs_active = [
-                job for job in processing_jobs if job.status == ProcessingStatus.PROCESSING
-            ]
-
-            avg_eta = sum(job.eta_seconds for job in processing_jobs_active) / len(
-                processing_jobs_active
-            )
+        if active_jobs:
+            avg_eta = sum(
+                ProcessingJob.estimate_eta_seconds(job.progress, job.start_time)
+                for job in active_jobs
+            ) / len(active_jobs)
             eta_seconds = int(avg_eta * (queued_count + processing_count))
         else:
             eta_seconds = 0
@@ -226,36 +283,46 @@ class BatchProcessorService:
             - retried_count: Number of jobs retried
             - job_ids: List of retried job IDs
         """
-        # Get failed jobs
-        query = self.db.query(ProcessingJob).filter_by(
-            ingestion_job_id=ingestion_job_id, status=ProcessingStatus.FAILED
-        )
-
+        # Reset failed jobs with one UPDATE ... RETURNING
+        conditions = [
+            ProcessingJob.ingestion_job_id == ingestion_job_id,
+            ProcessingJob.status == ProcessingStatus.FAILED,
+        ]
         if job_ids:
-            query = query.filter(ProcessingJob.processing_job_id.in_(job_ids))
-
-        failed_jobs = query.all()
-
-        retried_job_ids = []
+            conditions.append(ProcessingJob.processing_job_id.in_(job_ids))
 
-        for job in failed_jobs:
-            # Reset job status
-            job.status = ProcessingStatus.QUEUED
-            job.progress = 0.0
-            job.error_message = None
-            job.retry_count += 1
-
-            # Re-add to processing queue
-            queue_entry = ProcessingQueue(
-                queue_id=self._generate_queue_id(),
-                ingestion_job_id=ingestion_job_id,
-                document_id=job.document_id,
-                priority=QueuePriority.HIGH,  # Prioritize retries
+        retried_jobs = self.db.execute(
+            update(ProcessingJob)
+            .where(*conditions)
+            .values(
+                status=ProcessingStatus.QUEUED,
+                progress=0.0,
+                error_message=None,
+                retry_count=ProcessingJob.retry_count + 1,
+            )
+            .returning(ProcessingJob.processing_job_id, ProcessingJob.document_id)
+            .execution_options(synchronize_session="fetch")
+        ).all()
+
+        retried_job_ids = [job.processing_job_id for job in retried_jobs]
+
+        if retried_jobs:
+            # Re-add to processing queue, prioritizing retries
+            source_types = self._queue_source_types([ingestion_job_id])
+            self.db.execute(
+                insert(ProcessingQueue),
+                self._queue_rows(
+                    ingestion_job_id,
+                    source_types[ingestion_job_id],
+                    [job.document_id for job in retried_jobs],
+                    QueuePriority.HIGH,
+                ),
             )
 
-            self.db.add(queue_entry)
-            retried_job_ids.append(job.processing_job_id)
-
+        self._adjust_status_counts(
+            ingestion_job_id,
+            {ProcessingStatus.FAILED: -len(retried_jobs), ProcessingStatus.QUEUED: len(retried_jobs)},
+        )
         self.db.commit()
 
         return {"retried_count": len(retried_job_ids), "job_ids": retried_job_ids}
@@ -273,33 +340,48 @@ class BatchProcessorService:
             - redistributed_jobs: Count of jobs redistributed
             - new_worker_assignments: Dict mapping job_id to new worker_id
         """
-        # Find all jobs assigned to failed worker
-        failed_worker_jobs = (
-            self.db.query(ProcessingJob)
-            .filter_by(worker_id=worker_id, status=ProcessingStatus.PROCESSING)
-            .all()
-        )
+        # Reset all jobs assigned to the failed worker with one UPDATE ... RETURNING
+        failed_worker_jobs = self.db.execute(
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.worker_id == worker_id,
+                ProcessingJob.status == ProcessingStatus.PROCESSING,
+            )
+            .values(status=ProcessingStatus.QUEUED, worker_id=None, progress=0.0)
+            .returning(ProcessingJob.ingestion_job_id, ProcessingJob.document_id)
+            .execution_options(synchronize_session="fetch")
+        ).all()
 
-        redistributed_count = 0
+        redistributed_count = len(failed_worker_jobs)
         new_assignments = {}
 
+        documents_per_ingestion: Dict[str, List[str]] = {}
         for job in failed_worker_jobs:
-            # Reset job to queued
-            job.status = ProcessingStatus.QUEUED
-            job.worker_id = None
-            job.progress = 0.0
+            documents_per_ingestion.setdefault(job.ingestion_job_id, []).append(job.document_id)
 
+        if documents_per_ingestion:
             # Re-add to queue with high priority
-            queue_entry = ProcessingQueue(
-                queue_id=self._generate_queue_id(),
-                ingestion_job_id=job.ingestion_job_id,
-                document_id=job.document_id,
-                priority=QueuePriority.HIGH,
+            source_types = self._queue_source_types(list(documents_per_ingestion))
+            self.db.execute(
+                insert(ProcessingQueue),
+                [
+                    row
+                    for ingestion_job_id, document_ids in documents_per_ingestion.items()
+                    for row in self._queue_rows(
+                        ingestion_job_id,
+                        source_types[ingestion_job_id],
+                        document_ids,
+                        QueuePriority.HIGH,
+                    )
+                ],
             )
 
-            self.db.add(queue_entry)
-            redistributed_count += 1
-
+        for ingestion_job_id, document_ids in documents_per_ingestion.items():
+            count = len(document_ids)
+            self._adjust_status_counts(
+                ingestion_job_id,
+                {ProcessingStatus.PROCESSING: -count, ProcessingStatus.QUEUED: count},
+            )
         self.db.commit()
 
         return {
@@ -330,14 +412,8 @@ class BatchProcessorService:
         self.db.commit()
 
         # Count jobs by status
-        processing_jobs = (
-            self.db.query(ProcessingJob).filter_by(ingestion_job_id=ingestion_job_id).all()
-        )
-
-        completing_count = sum(
-            1 for job in processing_jobs if job.status == ProcessingStatus.PROCESSING
-        )
-        paused_count = sum(1 for job in processing_jobs if job.status == ProcessingStatus.QUEUED)
+        completing_count = ingestion_job.processing_count
+        paused_count = ingestion_job.queued_count
 
         return {
             "job_id": ingestion_job_id,
@@ -363,29 +439,193 @@ class BatchProcessorService:
         ingestion_job.status = IngestionStatus.CANCELLED
         self.db.commit()
 
-        # Cancel all queued processing jobs
-        queued_jobs = (
-            self.db.query(ProcessingJob)
-            .filter_by(ingestion_job_id=ingestion_job_id, status=ProcessingStatus.QUEUED)
-            .all()
+        # Stop in-flight batch tasks instead of letting them run to completion
+        self._stop_batch_tasks(ingestion_job)
+
+        # Cancel all queued processing jobs with one UPDATE
+        cancelled_count = self.db.execute(
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.ingestion_job_id == ingestion_job_id,
+                ProcessingJob.status == ProcessingStatus.QUEUED,
+            )
+            .values(status=ProcessingStatus.FAILED, error_message="Cancelled by user")
+            .execution_options(synchronize_session="fetch")
+        ).rowcount
+
+        self._adjust_status_counts(
+            ingestion_job_id,
+            {ProcessingStatus.QUEUED: -cancelled_count, ProcessingStatus.FAILED: cancelled_count},
         )
+        self.db.commit()
+
+        return {"job_id": ingestion_job_id, "cancelled_documents": cancelled_count}
 
-        for job in queued_jobs:
-            job.status = ProcessingStatus.FAILED
-            job.error_message = "Cancelled by user"
+    def _stop_batch_tasks(self, ingestion_job: IngestionJob) -> None:
+        """
+        Signal workers to stop processing a cancelled ingestion job.
 
+        Revokes the batch group: waiting tasks are discarded and running ones
+        are sent SIGUSR1 (raising SoftTimeLimitExceeded in the task so it can
+        clean up).
+        """
+        if self.celery is None or not ingestion_job.celery_group_id:
+            return
+
+        group_result = GroupResult.restore(ingestion_job.celery_group_id, app=self.celery)
+        if group_result is not None:
+            group_result.revoke(terminate=True, signal="SIGUSR1")
+
+    async def record_status_change(
+        self,
+        processing_job_id: str,
+        from_status: ProcessingStatus,
+        to_status: ProcessingStatus,
+        worker_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Move a processing job between statuses and update the ingestion
+        job's counters (called by workers as they pick up and finish jobs).
+
+        The job UPDATE only matches while the job is still in from_status,
+        so a transition that lost a race is a no-op and counters stay exact.
+
+        Args:
+            processing_job_id: Processing job to transition
+            from_status: Status the job is expected to be in
+            to_status: New status
+            worker_id: Worker taking the job (recorded when moving to PROCESSING)
+
+        Returns:
+            True if the job was transitioned, False if it was not in from_status
+        """
+        values = {"status": to_status}
+        if to_status == ProcessingStatus.PROCESSING:
+            values.update(worker_id=worker_id, start_time=datetime.utcnow())
+        elif to_status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+            values["end_time"] = datetime.utcnow()
+
+        row = self.db.execute(
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.processing_job_id == processing_job_id,
+                ProcessingJob.status == from_status,
+            )
+            .values(values)
+            .returning(ProcessingJob.ingestion_job_id)
+        ).first()
+
+        if row is None:
+            return False
+
+        self._adjust_status_counts(row.ingestion_job_id, {from_status: -1, to_status: 1})
         self.db.commit()
+        return True
+
+    def _adjust_status_counts(
+        self, ingestion_job_id: str, deltas: Dict[ProcessingStatus, int]
+    ) -> None:
+        """
+        Apply per-status deltas to the IngestionJob counters in one atomic
+        UPDATE (column = column + delta, never read-modify-write in Python)
+        """
+        values = {
+            STATUS_COUNTER_COLUMNS[status]: getattr(IngestionJob, STATUS_COUNTER_COLUMNS[status])
+            + delta
+            for status, delta in deltas.items()
+            if delta
+        }
+        if not values:
+            return
+
+        self.db.execute(
+            update(IngestionJob)
+            .where(IngestionJob.job_id == ingestion_job_id)
+            .values(values)
+            .execution_options(synchronize_session="fetch")
+        )
 
-        return {"job_id": ingestion_job_id, "cancelled_documents": len(queued_jobs)}
+    def _queue_source_types(self, ingestion_job_ids: List[str]) -> Dict[str, str]:
+        """Map ingestion job IDs to the ProcessingQueue.source_type of their method"""
+        rows = self.db.execute(
+            select(IngestionJob.job_id, IngestionJob.method).where(
+                IngestionJob.job_id.in_(ingestion_job_ids)
+            )
+        )
+        return {row.job_id: QUEUE_SOURCE_TYPES[row.method] for row in rows}
 
-    def _generate_job_id(self) -> str:
-        """Generate unique processing job ID"""
-        import uuid
+    def _queue_rows(
+        self,
+        ingestion_job_id: str,
+        source_type: str,
+        document_ids: List[str],
+        priority: QueuePriority,
+    ) -> List[Dict]:
+        """Build ProcessingQueue rows for a bulk INSERT"""
+        return [
+            {
+                "queue_id": self._generate_queue_id(),
+                "ingestion_job_id": ingestion_job_id,
+                "document_identifier": doc_id,
+                "source_type": source_type,
+                "priority": priority,
+            }
+            for doc_id in document_ids
+        ]
 
-        return str(uuid.uuid4())
+    def _generate_job_id(self) -> str:
+        """Generate unique, time-ordered processing job ID"""
+        return str(uuid7())
 
     def _generate_queue_id(self) -> str:
-        """Generate unique queue entry ID"""
-        import uuid
+        """Generate unique, time-ordered queue entry ID"""
+        return str(uuid7())
+
+
+@shared_task(name="finalize_ingestion_job")
+def finalize_ingestion_job(batch_results: List, ingestion_job_id: str) -> Dict:
+    """
+    Chord callback run once every batch of an ingestion job has finished.
 
-        return str(uuid.uuid4())
+    Marks the job COMPLETED (FAILED if no document succeeded) in a single
+    conditional UPDATE; jobs that were paused or cancelled meanwhile keep
+    their status.
+
+    Args:
+        batch_results: Results of the process_document_batch tasks
+        ingestion_job_id: Ingestion job to finalize
+
+    Returns:
+        Dict with job_id and whether the job was finalized
+    """
+    from src.database import SessionLocal
+
+    status_type = IngestionJob.__table__.c.status.type
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            update(IngestionJob)
+            .where(
+                IngestionJob.job_id == ingestion_job_id,
+                IngestionJob.status == IngestionStatus.IN_PROGRESS,
+            )
+            .values(
+                # CAST so PostgreSQL reads the CASE result as the enum type
+                status=cast(
+                    case(
+                        (
+                            (IngestionJob.processed_documents == 0)
+                            & (IngestionJob.failed_documents > 0),
+                            literal(IngestionStatus.FAILED, status_type),
+                        ),
+                        else_=literal(IngestionStatus.COMPLETED, status_type),
+                    ),
+                    status_type,
+                ),
+                end_time=datetime.utcnow(),
+            )
+        )
+        db.commit()
+        return {"job_id": ingestion_job_id, "finalized": result.rowcount == 1}
+    finally:
+        db.close()
@@ -8,13 +8,32 @@ Contract: .specify/specs/019-process-all-7/contracts/chrome_stripper_contract.md
 Patterns: .specify/specs/019-process-all-7/research.md lines 12-73
 """
 import logging
-from typing import Tuple, Dict, List, Any
+from typing import AnyStr, Tuple, Dict, List, Any, Optional, Set, Union
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import re
 
 # Configure structured logging
 logger = logging.getLogger(__name__)
 
+# Simple selectors of the form tag, .class, #id, tag.class, tag[attr="value"]
+SIMPLE_SELECTOR_RE = re.compile(
+    r'^(?P<tag>[a-z][a-z0-9]*)?'
+    r'(?:\.(?P<cls>[\w-]+))?'
+    r'(?:#(?P<id>[\w-]+))?'
+    r'(?:\[(?P<attr>[\w-]+)="(?P<value>[^"]*)"\])?$'
+)
+
+# Attribute selector part, e.g. [href="#main-content"]
+ATTRIBUTE_SELECTOR_RE = re.compile(r'\[.*?\]')
+
+# Characters that can follow '<main' in an opening <main> tag
+MAIN_TAG_ENDS = ('>', '/', ' ', '\t', '\n', '\r')
+MAIN_TAG_ENDS_BYTES = tuple(end.encode() for end in MAIN_TAG_ENDS)
+
+# Documents shorter than this are scanned for chrome before being parsed
+MIN_PARSE_CHARS = 2048
+
 
 class ChromeDetectionError(Exception):
     """Raised when HTML parsing or chrome detection fails."""
@@ -101,16 +120,28 @@ class ChromeStripper:
         self.chrome_patterns = self.CHROME_PATTERNS
         self.version = self.VERSION
 
+        # All patterns as one selector list (a single DOM traversal), plus a
+        # matcher per pattern to attribute each hit back to its pattern
+        self._joined_pattern = ", ".join(self.chrome_patterns)
+        self._pattern_matchers = [
+            SIMPLE_SELECTOR_RE.match(pattern) for pattern in self.chrome_patterns
+        ]
+        self._pattern_tokens = [self._pattern_token(matcher) for matcher in self._pattern_matchers]
+        self._pattern_byte_tokens = [token.encode() if token else None for token in self._pattern_tokens]
+        self._normalized_names = [self._normalize_pattern_name(pattern) for pattern in self.chrome_patterns]
+
     def strip_chrome(
         self,
-        html: str,
+        html: Union[str, bytes],
         document_id: str
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Remove GOV.UK chrome from HTML and return cleaned content + stats.
 
         Args:
-            html: Raw HTML from scraped GOV.UK document
+            html: Raw HTML from scraped GOV.UK document. UTF-8 bytes are
+                  parsed as-is, without decoding them first; the stats are
+                  then counted in bytes instead of characters.
             document_id: Document UUID for logging
 
         Returns:
@@ -128,37 +159,30 @@ class ChromeStripper:
             # Calculate original length
             original_chars = len(html)
 
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
-
-            # Track which patterns matched
-            patterns_matched = []
-
-            # Remove all chrome patterns
-            for pattern in self.chrome_patterns:
-                elements = soup.select(pattern)
-                if elements:
-                    # Track pattern (normalize pattern name for stats)
-                    pattern_name = self._normalize_pattern_name(pattern)
-                    if pattern_name not in patterns_matched:
-                        patterns_matched.append(pattern_name)
-
-                    # Remove elements
-                    for element in elements:
-                        element.decompose()
-
-            # Extract main content (prefer main wrapper, fall back to body)
-            main_content = (
-                soup.find('main', class_='govuk-main-wrapper') or
-                soup.find('main') or
-                soup.find('div', id='content') or
-                soup.find('body') or
-                soup
-            )
-
-            # Get cleaned HTML
-            cleaned_html = str(main_content)
-            cleaned_chars = len(cleaned_html)
+            # Tiny documents without any chrome pattern are returned as-is
+            if original_chars < MIN_PARSE_CHARS and not self._may_contain_chrome(html):
+                if isinstance(html, bytes):
+                    html = html.decode('utf-8', errors='replace')
+                return (html, {
+                    "original_chars": original_chars,
+                    "chrome_chars": 0,
+                    "guidance_chars": original_chars,
+                    "chrome_percentage": 0.0,
+                    "patterns_matched": []
+                })
+
+            try:
+                cleaned_html, patterns_matched = self._strip_with_selectolax(html)
+            except Exception as e:
+                # selectolax rejects some malformed pages; BeautifulSoup is
+                # slower but more lenient
+                logger.debug(f"selectolax failed for document {document_id}, using BeautifulSoup: {e}")
+                cleaned_html, patterns_matched = self._strip_with_beautifulsoup(html)
+
+            if isinstance(html, bytes):
+                cleaned_chars = len(cleaned_html.encode('utf-8'))
+            else:
+                cleaned_chars = len(cleaned_html)
 
             # Calculate stats
             chrome_chars = original_chars - cleaned_chars
@@ -195,12 +219,236 @@ class ChromeStripper:
                 "patterns_matched": []
             }
 
+            if isinstance(html, bytes):
+                html = html.decode('utf-8', errors='replace')
+
             return (html, fallback_stats)
 
+    def _strip_with_selectolax(self, html: Union[str, bytes]) -> Tuple[str, List[str]]:
+        """
+        Remove chrome patterns using selectolax (lexbor C parser and DOM).
+
+        Returns:
+            Tuple of (cleaned_html, patterns_matched)
+        """
+        tree, matched_indexes = self._strip_core(html)
+        return (self._main_content_html(tree), self._pattern_names(matched_indexes))
+
+    def _strip_core(self, html: Union[str, bytes]) -> Tuple[LexborHTMLParser, Set[int]]:
+        """
+        Parse HTML with selectolax and remove chrome from the tree in place.
+
+        The cleaned output is the <main> element, so when the page has one
+        only the <main>...</main> range is parsed; chrome around it (header,
+        footer, cookie banner) is reported for stats by a substring scan.
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            Tuple of (tree, indexes of the chrome patterns that matched)
+        """
+        bounds = self._find_main_bounds(html)
+        if bounds is not None:
+            start, end = bounds
+            tree = LexborHTMLParser(html[start:end])
+            if tree.css_first('main') is not None:
+                matched_indexes, chrome_nodes = self._find_chrome_nodes(tree)
+                matched_indexes.update(self._patterns_outside(html, start, end))
+
+                for node in chrome_nodes:
+                    node.decompose()
+                return (tree, matched_indexes)
+
+        # No usable <main>: parse the whole page
+        tree = LexborHTMLParser(html)
+        matched_indexes, chrome_nodes = self._find_chrome_nodes(tree)
+        for node in chrome_nodes:
+            node.decompose()
+        return (tree, matched_indexes)
+
+    def _find_main_bounds(self, html: AnyStr) -> Optional[Tuple[int, int]]:
+        """Return (start, end) of the first <main ...> to the last </main>, if any."""
+        if isinstance(html, bytes):
+            open_tag, close_tag, tag_ends = b'<main', b'</main>', MAIN_TAG_ENDS_BYTES
+        else:
+            open_tag, close_tag, tag_ends = '<main', '</main>', MAIN_TAG_ENDS
+
+        start = html.find(open_tag)
+        while start != -1 and html[start + 5:start + 6] not in tag_ends:
+            start = html.find(open_tag, start + 5)
+
+        end = html.rfind(close_tag)
+        if start == -1 or end < start:
+            return None
+        return (start, end + len(close_tag))
+
+    def _patterns_outside(self, html: AnyStr, start: int, end: int) -> Set[int]:
+        """Indexes of patterns whose token occurs outside html[start:end]."""
+        tokens = self._pattern_byte_tokens if isinstance(html, bytes) else self._pattern_tokens
+        return {
+            index
+            for index, token in enumerate(tokens)
+            if token and (html.find(token, 0, start) != -1 or html.find(token, end) != -1)
+        }
+
+    def _may_contain_chrome(self, html: AnyStr) -> bool:
+        """
+        Whether any chrome pattern's token occurs in html (case-insensitive,
+        since tag names are). Patterns without a token always count.
+        """
+        tokens = self._pattern_byte_tokens if isinstance(html, bytes) else self._pattern_tokens
+        lowered = html.lower()
+        return any(token is None or token.lower() in lowered for token in tokens)
+
+    def _find_chrome_nodes(self, tree: LexborHTMLParser) -> Tuple[Set[int], List[Any]]:
+        """
+        Find all chrome in a parsed tree.
+
+        Returns:
+            Tuple of (indexes of the chrome patterns that matched, top-level
+            chrome nodes to remove; nested matches go with their ancestor)
+        """
+        # Match all chrome patterns in one traversal (document order, so
+        # ancestors come before their descendants)
+        nodes = tree.css(self._joined_pattern)
+
+        # Stats match removing one pattern at a time, in order: a node counts
+        # for its first matching pattern unless a matched ancestor (or the
+        # node itself) was already removed by an earlier pattern
+        removed_at: Dict[int, int] = {}
+        matched_indexes = set()
+        top_level_nodes = []
+
+        for node in nodes:
+            index = self._first_matching_pattern(node)
+
+            ancestor = node.parent
+            while ancestor is not None and ancestor.mem_id not in removed_at:
+                ancestor = ancestor.parent
+
+            if ancestor is None:
+                top_level_nodes.append(node)
+                removed_at[node.mem_id] = index
+            else:
+                removed_at[node.mem_id] = min(index, removed_at[ancestor.mem_id])
+
+            if removed_at[node.mem_id] == index:
+                matched_indexes.add(index)
+
+        return (matched_indexes, top_level_nodes)
+
+    def _main_content_html(self, tree: LexborHTMLParser) -> str:
+        """
+        Serialize the main content (prefer main wrapper, fall back to body).
+
+        node.html is serialized by lexbor in C, so this is cheap compared
+        with str() on a BeautifulSoup tag.
+        """
+        main_content = (
+            tree.css_first('main.govuk-main-wrapper') or
+            tree.css_first('main') or
+            tree.css_first('div#content') or
+            tree.body
+        )
+        return main_content.html if main_content is not None else tree.html
+
+    def _pattern_names(self, matched_indexes: Set[int]) -> List[str]:
+        """Normalized names of matched patterns, sorted."""
+        return sorted({self._normalized_names[index] for index in matched_indexes})
+
+    def _first_matching_pattern(self, node: Any) -> int:
+        """Index of the first chrome pattern matching a selectolax node."""
+        attributes = node.attributes
+        for index, (pattern, matcher) in enumerate(
+            zip(self.chrome_patterns, self._pattern_matchers)
+        ):
+            if matcher is None:
+                # Not a simple selector: let the selector engine decide
+                if node.css_matches(pattern):
+                    return index
+                continue
+
+            tag, cls, element_id, attr, value = matcher.group('tag', 'cls', 'id', 'attr', 'value')
+            if tag and node.tag != tag:
+                continue
+            if cls and cls not in (attributes.get('class') or '').split():
+                continue
+            if element_id and attributes.get('id') != element_id:
+                continue
+            if attr and attributes.get(attr) != value:
+                continue
+            return index
+
+        # Unreachable for nodes returned by the joined selector
+        return len(self.chrome_patterns)
+
+    def _pattern_token(self, matcher: Optional[re.Match]) -> Optional[str]:
+        """
+        Substring that a simple selector's matches contain in raw HTML, used
+        to detect chrome outside <main> without parsing it.
+
+        Examples:
+            '.gem-c-cookie-banner' -> 'gem-c-cookie-banner'
+            'link[rel="stylesheet"]' -> 'rel="stylesheet"'
+            'script' -> '<script'
+        """
+        if matcher is None:
+            return None
+
+        tag, cls, element_id, attr, value = matcher.group('tag', 'cls', 'id', 'attr', 'value')
+        if cls:
+            return cls
+        if element_id:
+            return element_id
+        if attr:
+            return f'{attr}="{value}"'
+        return f'<{tag}'
+
+    def _strip_with_beautifulsoup(self, html: Union[str, bytes]) -> Tuple[str, List[str]]:
+        """
+        Remove chrome patterns using BeautifulSoup (fallback for pages
+        selectolax cannot handle).
+
+        Returns:
+            Tuple of (cleaned_html, patterns_matched)
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        # Track which patterns matched
+        patterns_matched = set()
+
+        # Remove all chrome patterns
+        for pattern, pattern_name in zip(self.chrome_patterns, self._normalized_names):
+            elements = soup.select(pattern)
+            if elements:
+                # Track pattern (normalized pattern name for stats)
+                patterns_matched.add(pattern_name)
+
+                # Remove elements
+                for element in elements:
+                    element.decompose()
+
+        # Extract main content (prefer main wrapper, fall back to body)
+        main_content = (
+            soup.find('main', class_='govuk-main-wrapper') or
+            soup.find('main') or
+            soup.find('div', id='content') or
+            soup.find('body') or
+            soup
+        )
+
+        # str() serializes in Python; acceptable here because this path only
+        # runs for pages selectolax rejects
+        return (str(main_content), sorted(patterns_matched))
+
     def detect_chrome_percentage(self, html: str) -> float:
         """
         Calculate percentage of content that is chrome.
 
+        Same measure as strip_chrome's chrome_percentage stat: the share of
+        the raw HTML not kept in the serialized cleaned content.
+
         Args:
             html: Raw HTML from GOV.UK document
 
@@ -256,7 +504,7 @@ class ChromeStripper:
         normalized = pattern.lstrip('.#')
 
         # Remove attribute selectors [...]
-        normalized = re.sub(r'\[.*?\]', '', normalized)
+        normalized = ATTRIBUTE_SELECTOR_RE.sub('', normalized)
 
         # Extract last component after space (compound selectors)
         if ' ' in normalized:
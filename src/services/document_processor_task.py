@@ -7,17 +7,123 @@ CRITICAL: Adapted to work with production processing_queue table schema
 Production schema: processing_queue (id, document_id, url, status, priority, attempt_count)
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
+
+import blake3
 from celery import Task
+from celery.signals import worker_process_init, worker_process_shutdown
+import httpx
 from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
 from celery_config import app
 from src.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Transient failures worth retrying (database/network connection and timeouts)
+RETRYABLE_ERRORS = (
+    OperationalError,
+    httpx.ConnectError,
+    httpx.TimeoutException,
+    asyncio.TimeoutError,
+    ConnectionError,
+)
+
+# Claimed ('queued') rows not picked up by a worker within this many seconds
+# are dispatched again by the poller, but only while the task queue is empty:
+# a stale row with no message waiting means its message was lost
+QUEUED_TIMEOUT_SECONDS = 60 * 60
+
+# Worker-lifetime singletons, built once per worker process instead of per task
+_CHROME_STRIPPER = None
+_FILE_PROCESSOR = None
+_EVENT_LOOP = None
+
+# Chrome stripping results of recently processed documents, keyed by the
+# BLAKE3 digest of the raw HTML, so retries and re-queued documents with
+# unchanged content skip the DOM pass
+CHROME_CACHE_SIZE = 256
+_CHROME_CACHE: "OrderedDict[bytes, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+
+
+def _get_chrome_stripper():
+    """Return the worker's ChromeStripper, creating it on first use."""
+    global _CHROME_STRIPPER
+    if _CHROME_STRIPPER is None:
+        # Deferred to avoid circular imports
+        from src.services.chrome_stripper import ChromeStripper
+
+        _CHROME_STRIPPER = ChromeStripper()
+    return _CHROME_STRIPPER
+
+
+def _get_file_processor():
+    """Return the worker's FileProcessorService, creating it on first use."""
+    global _FILE_PROCESSOR
+    if _FILE_PROCESSOR is None:
+        # Deferred to avoid circular imports
+        from src.services.file_processor import FileProcessorService
+
+        _FILE_PROCESSOR = FileProcessorService(chunk_size_tokens=512)
+    return _FILE_PROCESSOR
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's event loop, creating it on first use."""
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_EVENT_LOOP)
+    return _EVENT_LOOP
+
+
+def _strip_chrome_cached(content: str, document_id: str) -> Tuple[str, Dict[str, Any]]:
+    """Strip chrome from a document's HTML, reusing the result for identical HTML."""
+    key = blake3.blake3(content.encode("utf-8")).digest()
+    cached = _CHROME_CACHE.get(key)
+    if cached is not None:
+        _CHROME_CACHE.move_to_end(key)
+        cleaned_content, chrome_stats = cached
+        return cleaned_content, dict(chrome_stats)
+
+    cleaned_content, chrome_stats = _get_chrome_stripper().strip_chrome(
+        html=content,
+        document_id=document_id
+    )
+    _CHROME_CACHE[key] = (cleaned_content, dict(chrome_stats))
+    if len(_CHROME_CACHE) > CHROME_CACHE_SIZE:
+        _CHROME_CACHE.popitem(last=False)
+    return cleaned_content, chrome_stats
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs) -> None:
+    """Build the singletons when a worker process starts (prefork pool)."""
+    _get_event_loop()
+    _get_chrome_stripper()
+    _get_file_processor()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs) -> None:
+    """Release the worker's event loop and extraction pool when it exits."""
+    global _EVENT_LOOP
+    if _EVENT_LOOP is not None and not _EVENT_LOOP.is_closed():
+        _EVENT_LOOP.run_until_complete(_EVENT_LOOP.shutdown_asyncgens())
+        _EVENT_LOOP.close()
+    _EVENT_LOOP = None
+
+    if _FILE_PROCESSOR is not None:
+        # Deferred to avoid circular imports
+        from src.services.file_processor import shutdown_extraction_pool
+
+        shutdown_extraction_pool()
+
 
 @app.task(bind=True, name='process_document', max_retries=3, default_retry_delay=60)
 def process_document_task(self: Task, queue_id: int) -> Dict:
@@ -33,35 +139,37 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
     db = SessionLocal()
 
     try:
-        # Get queue record using raw SQL (production schema)
+        # Claim the queue record as processing and load its document in one
+        # round trip (raw SQL, production schema). Only a record still waiting
+        # for a worker (or failed, on a Celery retry) is claimed, so a
+        # duplicate message for a record another worker took is a no-op.
+        # NOTE: document_id in processing_queue is the document UUID string,
+        # not documents.id (integer PK)
         result = db.execute(
-            text("SELECT id, document_id, url, status, attempt_count FROM processing_queue WHERE id = :id"),
-            {"id": queue_id}
+            text("""
+                WITH q AS (
+                    UPDATE processing_queue
+                    SET status = 'processing', last_attempt_at = NOW(), attempt_count = attempt_count + 1
+                    WHERE id = :id
+                      AND (status IN ('pending', 'queued') OR (:is_retry AND status = 'failed'))
+                    RETURNING id, document_id, url
+                )
+                SELECT q.id, q.document_id, q.url, d.id, d.document_id, d.content
+                FROM q
+                LEFT JOIN documents d ON d.document_id = q.document_id
+            """),
+            {"id": queue_id, "is_retry": self.request.retries > 0}
         )
         queue_row = result.fetchone()
+        db.commit()
 
         if not queue_row:
-            logger.error(f"Queue record not found: {queue_id}")
-            return {"status": "failed", "error": "Queue record not found"}
-
-        queue_id, doc_id, url, status, attempt_count = queue_row
-
-        # Update status to 'processing'
-        db.execute(
-            text("UPDATE processing_queue SET status = 'processing', last_attempt_at = NOW(), attempt_count = attempt_count + 1 WHERE id = :id"),
-            {"id": queue_id}
-        )
-        db.commit()
+            logger.info(f"Queue record {queue_id} missing or already claimed, skipping")
+            return {"status": "skipped", "reason": "already claimed"}
 
-        # Get document from documents table
-        # NOTE: doc_id from processing_queue is document_id (UUID string), not id (integer PK)
-        doc_result = db.execute(
-            text("SELECT id, document_id, content FROM documents WHERE document_id = :document_id"),
-            {"document_id": doc_id}
-        )
-        doc_row = doc_result.fetchone()
+        queue_id, doc_id, url, doc_pk, doc_uuid, content = queue_row
 
-        if not doc_row:
+        if doc_pk is None:
             logger.error(f"Document not found: {doc_id}")
             db.execute(
                 text("UPDATE processing_queue SET status = 'failed', error_message = 'Document not found' WHERE id = :id"),
@@ -70,8 +178,6 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
             db.commit()
             return {"status": "failed", "error": "Document not found"}
 
-        doc_pk, doc_uuid, content = doc_row
-
         if not content:
             logger.error(f"Document has no content: {doc_id}")
             db.execute(
@@ -83,20 +189,11 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
 
         logger.info(f"Processing document {doc_id} (queue {queue_id}, URL: {url[:100]})")
 
-        # Import processing dependencies (deferred to avoid circular imports)
-        from src.services.chrome_stripper import ChromeStripper
-        from src.services.file_processor import FileProcessorService
-        import asyncio
-
         # Apply chrome stripping
-        chrome_stripper = ChromeStripper()
-        cleaned_content, chrome_stats = chrome_stripper.strip_chrome(
-            html=content,
-            document_id=doc_uuid
-        )
+        cleaned_content, chrome_stats = _strip_chrome_cached(content, doc_uuid)
 
         # Process document through file processor
-        file_processor = FileProcessorService(chunk_size_tokens=512)
+        file_processor = _get_file_processor()
 
         file_data = {
             'filename': f"{doc_uuid}.html",
@@ -104,34 +201,28 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
             'content_type': 'text/html'
         }
 
-        # Run async processing in new event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
+        # Run async processing on the worker's long-lived event loop
+        result = _get_event_loop().run_until_complete(
             file_processor._process_single_file(file_data, chunk_size_tokens=512)
         )
-        loop.close()
 
         if isinstance(result, Exception):
             raise result
 
-        # Update document
+        # Update document and mark the queue record completed in one statement
         # NOTE: Use doc_pk (integer PK), not doc_id (UUID string)
         db.execute(
             text("""
+                WITH q AS (
+                    UPDATE processing_queue SET status = 'completed' WHERE id = :queue_id
+                )
                 UPDATE documents
                 SET processing_success = true,
                     processed_at = NOW(),
                     chunk_count = :chunk_count
                 WHERE id = :id
             """),
-            {"chunk_count": result.get('chunk_count', 0), "id": doc_pk}
-        )
-
-        # Update queue status to completed
-        db.execute(
-            text("UPDATE processing_queue SET status = 'completed' WHERE id = :id"),
-            {"id": queue_id}
+            {"chunk_count": result.get('chunk_count', 0), "id": doc_pk, "queue_id": queue_id}
         )
 
         db.commit()
@@ -162,7 +253,7 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
             pass
 
         # Retry on transient errors
-        if "connection" in str(e).lower() or "timeout" in str(e).lower():
+        if isinstance(e, RETRYABLE_ERRORS):
             raise self.retry(exc=e)
 
         return {"status": "failed", "error": str(e)}
@@ -171,11 +262,29 @@ def process_document_task(self: Task, queue_id: int) -> Dict:
         db.close()
 
 
+def _dispatch_backlog() -> Optional[int]:
+    """
+    Number of process_document messages waiting in the broker, or None if
+    the broker cannot be asked.
+    """
+    queue = app.amqp.router.route({}, process_document_task.name)["queue"]
+    try:
+        with app.connection_for_write() as connection:
+            return queue(connection.default_channel).queue_declare(passive=True).message_count
+    except Exception as e:
+        logger.warning(f"Could not read the {queue.name} queue length: {e}")
+        return None
+
+
 @app.task(name='poll_processing_queue')
 def poll_processing_queue_task() -> Dict:
     """
     Poll processing_queue table for 'pending' jobs and dispatch to workers.
 
+    Dispatched jobs are marked 'queued' until a worker starts them; jobs still
+    'queued' after QUEUED_TIMEOUT_SECONDS are dispatched again when the task
+    queue is empty (their message was lost).
+
     Runs every 30 seconds via Celery beat scheduler.
 
     Returns:
@@ -184,31 +293,62 @@ def poll_processing_queue_task() -> Dict:
     db = SessionLocal()
 
     try:
-        # Query for pending jobs (production schema)
+        # Atomically claim a batch of pending jobs (production schema). Rows
+        # locked by a concurrent poller are skipped, and claimed rows leave
+        # 'pending' so they cannot be dispatched twice. The claim time is kept
+        # in last_attempt_at; rows left 'queued' past QUEUED_TIMEOUT_SECONDS
+        # are claimed again only if no message is waiting in the task queue.
+        reclaim_stale = _dispatch_backlog() == 0
         result = db.execute(
             text("""
-                SELECT id, document_id, url
-                FROM processing_queue
-                WHERE status = 'pending'
-                ORDER BY priority DESC, id ASC
-                LIMIT 100
-            """)
+                UPDATE processing_queue
+                SET status = 'queued', last_attempt_at = NOW()
+                WHERE id IN (
+                    SELECT id
+                    FROM processing_queue
+                    WHERE status = 'pending'
+                       OR (:reclaim_stale
+                           AND status = 'queued'
+                           AND (last_attempt_at IS NULL
+                                OR last_attempt_at < NOW() - make_interval(secs => :queued_timeout)))
+                    ORDER BY priority DESC, id ASC
+                    LIMIT 100
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, document_id, url
+            """),
+            {"queued_timeout": QUEUED_TIMEOUT_SECONDS, "reclaim_stale": reclaim_stale}
         )
-        pending_jobs = result.fetchall()
+        claimed_jobs = result.fetchall()
+        db.commit()
 
-        jobs_found = len(pending_jobs)
+        jobs_found = len(claimed_jobs)
         jobs_dispatched = 0
 
-        logger.info(f"Polling queue: found {jobs_found} pending jobs")
-
-        for job in pending_jobs:
-            queue_id, doc_id, url = job
-
-            # Dispatch to worker
-            process_document_task.delay(queue_id)
-            jobs_dispatched += 1
-
-            logger.info(f"Dispatched queue_id={queue_id}, document_id={doc_id}, url={url[:100]}")
+        logger.info(f"Polling queue: claimed {jobs_found} pending jobs")
+
+        if claimed_jobs:
+            # Dispatch to workers, publishing all messages over one producer.
+            # Published messages are counted so that, if publishing fails
+            # part way, only the jobs never sent go back to 'pending' (jobs
+            # already sent would otherwise be dispatched twice).
+            sent = 0
+            try:
+                with app.producer_or_acquire() as producer:
+                    for queue_id, _, _ in claimed_jobs:
+                        process_document_task.apply_async((queue_id,), producer=producer)
+                        sent += 1
+            except Exception:
+                db.execute(
+                    text("UPDATE processing_queue SET status = 'pending' WHERE id = ANY(:ids) AND status = 'queued'"),
+                    {"ids": [queue_id for queue_id, _, _ in claimed_jobs[sent:]]}
+                )
+                db.commit()
+                raise
+            jobs_dispatched = jobs_found
+
+            for queue_id, doc_id, url in claimed_jobs:
+                logger.info(f"Dispatched queue_id={queue_id}, document_id={doc_id}, url={url[:100]}")
 
         return {
             "jobs_found": jobs_found,
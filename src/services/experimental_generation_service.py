@@ -9,9 +9,11 @@ Tasks: T011
 """
 
 import os
+import json
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 import httpx
 import textstat
 
@@ -37,6 +39,10 @@ class ExperimentalGenerationService:
         "claude-3-sonnet": "anthropic/claude-3-sonnet",
     }
 
+    # Prompt size limits (characters)
+    MAX_ARTIFACT_CHARS = 2000  # per artifact
+    MAX_PROMPT_CHARS = 20000  # custom prompt plus all artifacts
+
     def __init__(self):
         """Initialize experimental generation service."""
         self.api_key = os.getenv("OPENROUTER_API_KEY")
@@ -44,6 +50,10 @@ class ExperimentalGenerationService:
         self.timeout = 60  # 60 seconds for template generation
         self.referer = os.getenv("OPENROUTER_REFERER", "https://vectorgov.poview.ai")
 
+        # Shared HTTP client so connections to OpenRouter are reused across
+        # calls (created on first use, closed by aclose())
+        self._client: Optional[httpx.AsyncClient] = None
+
         if not self.api_key:
             logger.warning("OPENROUTER_API_KEY not configured - API calls will fail")
 
@@ -94,8 +104,8 @@ class ExperimentalGenerationService:
                 f"Allowed: {list(self.MODEL_MAP.keys())}"
             )
 
-        # Start timing
-        start_time = datetime.utcnow()
+        # Start timing (monotonic, unaffected by wall-clock adjustments)
+        start_ns = time.perf_counter_ns()
 
         try:
             # Build prompt with artifact context
@@ -116,8 +126,7 @@ class ExperimentalGenerationService:
             readability_metrics = self._calculate_readability_metrics(generated_content)
 
             # Calculate render time
-            end_time = datetime.utcnow()
-            render_time_ms = (end_time - start_time).total_seconds() * 1000
+            render_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             logger.info(
                 f"Template generated: model={model_used}, "
@@ -161,10 +170,19 @@ class ExperimentalGenerationService:
 
         if artifact_content:
             prompt_parts.append("\n\n## Sample Documents\n")
+
+            # Limit each artifact and the artifacts in total to avoid token limits
+            remaining = self.MAX_PROMPT_CHARS - len(custom_system_prompt)
             for i, content in enumerate(artifact_content, 1):
-                # Limit each artifact to 2000 chars to avoid token limits
-                truncated_content = content[:2000]
-                if len(content) > 2000:
+                if remaining <= 0:
+                    omitted = len(artifact_content) - i + 1
+                    prompt_parts.append(f"\n... ({omitted} more documents omitted)\n")
+                    break
+
+                limit = min(self.MAX_ARTIFACT_CHARS, remaining)
+                truncated_content = content[:limit]
+                remaining -= len(truncated_content)
+                if len(content) > limit:
                     truncated_content += "\n... (truncated)"
 
                 prompt_parts.append(f"\n### Document {i}\n{truncated_content}\n")
@@ -201,6 +219,7 @@ class ExperimentalGenerationService:
             ValueError: If API key not configured
             httpx.TimeoutException: If request exceeds timeout
             httpx.HTTPStatusError: If API returns error status
+            RuntimeError: If the response stream reports an error
         """
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not configured")
@@ -221,17 +240,51 @@ class ExperimentalGenerationService:
             ],
             "max_tokens": max_tokens,
             "temperature": temperature,
+            "stream": True,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(self.api_url, json=payload, headers=headers)
+        # Accumulate streamed (SSE) deltas as they arrive instead of waiting
+        # for the whole completion to be buffered and returned as one JSON body
+        content_parts: List[str] = []
+        model_used = openrouter_model
+
+        async with self._get_client().stream(
+            "POST", self.api_url, json=payload, headers=headers
+        ) as response:
             response.raise_for_status()
 
-            data = response.json()
-            generated_content = data["choices"][0]["message"]["content"]
-            model_used = data.get("model", openrouter_model)
+            async for line in response.aiter_lines():
+                # Skip blank separators and SSE comments (": OPENROUTER PROCESSING")
+                if not line.startswith("data:"):
+                    continue
+
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                chunk = json.loads(data)
+                if "error" in chunk:
+                    raise RuntimeError(f"OpenRouter stream error: {chunk['error'].get('message', chunk['error'])}")
 
-            return generated_content.strip(), model_used
+                model_used = chunk.get("model", model_used)
+                for choice in chunk.get("choices", []):
+                    delta = choice.get("delta", {}).get("content")
+                    if delta:
+                        content_parts.append(delta)
+
+        return "".join(content_parts).strip(), model_used
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _calculate_readability_metrics(self, text: str) -> Dict[str, float]:
         """
@@ -243,22 +296,48 @@ class ExperimentalGenerationService:
         Returns:
             Dict with flesch_score, grade_level, reading_age
         """
-        # Calculate Flesch Reading Ease (0-100, higher = easier)
-        flesch_score = textstat.flesch_reading_ease(text)
-
-        # Calculate Flesch-Kincaid Grade Level
-        grade_level = textstat.flesch_kincaid_grade(text)
-
-        # Estimate reading age (grade level + 5)
-        reading_age = grade_level + 5
+        flesch_score, grade_level, reading_age = _readability_scores(text)
 
         return {
-            "flesch_score": round(flesch_score, 1),
-            "grade_level": round(grade_level, 1),
-            "reading_age": round(reading_age, 1),
+            "flesch_score": flesch_score,
+            "grade_level": grade_level,
+            "reading_age": reading_age,
         }
 
 
+@lru_cache(maxsize=1024)
+def _readability_scores(text: str) -> Tuple[float, float, float]:
+    """
+    Flesch score, grade level and reading age for text, rounded to 1 dp.
+
+    Cached because prompt experiments often regenerate identical content
+    and the scores depend only on the text.
+    """
+    # Count sentences, words and syllables once and derive both scores
+    sentences = textstat.sentence_count(text)
+    words = textstat.lexicon_count(text)
+    syllables = textstat.syllable_count(text)
+
+    words_per_sentence = words / sentences if sentences else 0.0
+    syllables_per_word = syllables / words if words else 0.0
+
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        # Same as textstat for text without words or syllables
+        flesch_score = 0.0
+        grade_level = 0.0
+    else:
+        # Flesch Reading Ease (0-100, higher = easier)
+        flesch_score = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+
+        # Flesch-Kincaid Grade Level
+        grade_level = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+
+    # Estimate reading age (grade level + 5)
+    reading_age = grade_level + 5
+
+    return (round(flesch_score, 1), round(grade_level, 1), round(reading_age, 1))
+
+
 # Singleton instance
 _service_instance: Optional[ExperimentalGenerationService] = None
 
@@ -269,3 +348,9 @@ def get_experimental_generation_service() -> ExperimentalGenerationService:
     if _service_instance is None:
         _service_instance = ExperimentalGenerationService()
     return _service_instance
+
+
+async def close_experimental_generation_service() -> None:
+    """Close the singleton's HTTP client, if the singleton was created."""
+    if _service_instance is not None:
+        await _service_instance.aclose()
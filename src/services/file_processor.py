@@ -8,17 +8,31 @@ Feature 019: Process All Cross-Government Guidance Documents
 T012: ChromeStripper integration for GOV.UK chrome removal
 """
 
-import hashlib
+import logging
 import mimetypes
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Optional, BinaryIO
+from types import MappingProxyType
+from typing import Callable, List, Dict, Optional, BinaryIO, Tuple
 import asyncio
+from collections import OrderedDict
+
+import blake3
 
 # PDF extraction
 try:
-    import PyPDF2
+    import pypdf
+except ImportError:
+    pypdf = None
+
+# Token counting for chunking
+try:
+    import tiktoken
 except ImportError:
-    PyPDF2 = None
+    tiktoken = None
 
 # Word document extraction
 try:
@@ -26,22 +40,24 @@ try:
 except ImportError:
     DocxDocument = None
 
-# HTML extraction
-from bs4 import BeautifulSoup
-import markdown
+# HTML and Markdown extraction
+from selectolax.lexbor import LexborHTMLParser
+from markdown_it import MarkdownIt
 
 # Chrome stripping (Feature 019)
 from src.services.chrome_stripper import ChromeStripper
 
-# File format validation
-ALLOWED_MIME_TYPES = {
-    "application/pdf": [".pdf"],
-    "application/msword": [".doc"],
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": [".docx"],
-    "text/html": [".html", ".htm"],
-    "text/markdown": [".md", ".markdown"],
-    "text/plain": [".txt"],
-}
+logger = logging.getLogger(__name__)
+
+# File format validation (read-only: _ALLOWED_EXTS below is derived from it)
+ALLOWED_MIME_TYPES = MappingProxyType({
+    "application/pdf": (".pdf",),
+    "application/msword": (".doc",),
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": (".docx",),
+    "text/html": (".html", ".htm"),
+    "text/markdown": (".md", ".markdown"),
+    "text/plain": (".txt",),
+})
 
 # Magic numbers for format validation (first few bytes)
 MAGIC_NUMBERS = {
@@ -50,8 +66,182 @@ MAGIC_NUMBERS = {
     "doc": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE format
 }
 
+# Derived once at import instead of on every validation
+_ALLOWED_EXTS = frozenset(
+    ext for extensions in ALLOWED_MIME_TYPES.values() for ext in extensions
+)
+# Binary extensions that must start with a magic number: ext -> (magic, label)
+_MAGIC_TABLE = {
+    ".pdf": (MAGIC_NUMBERS["pdf"], "PDF"),
+    ".docx": (MAGIC_NUMBERS["docx"], "DOCX"),
+    ".doc": (MAGIC_NUMBERS["doc"], "DOC"),
+}
+
 MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024  # 50MB (FR-014)
 
+# Dedup hash of extracted text, reported with each result as content_hash_algorithm
+CONTENT_HASH_ALGORITHM = "blake3"
+
+# Texts at least this large are hashed in a worker thread; blake3 releases the
+# GIL while hashing, so files processed together hash on separate cores
+HASH_IN_THREAD_MIN_BYTES = 1024 * 1024  # 1MB
+
+
+# Total characters of extracted text kept for re-uploaded files, across all
+# service instances (the upload endpoint creates a service per request)
+EXTRACT_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+# PDF/DOCX files at least this large are extracted in the process pool; smaller
+# ones (a few pages) are cheaper to extract inline than to send to a worker
+POOL_EXTRACTION_MIN_BYTES = 48 * 1024  # 48KB
+
+# Tokenizer used to size chunks (same BPE as the OpenAI embedding models)
+TOKEN_ENCODING_NAME = "cl100k_base"
+
+# tiktoken encoding, loaded on first use; False if it could not be loaded
+_token_encoding = None
+
+# Process pool for CPU-bound PDF/DOCX extraction, shared by all service
+# instances and created on first use
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+# Extraction results of recently seen files, least recently used first, keyed
+# by (extension, raw bytes hash): (text_content, content_hash,
+# chrome_removal_stats); _extract_cache_chars is the total text length
+_extract_cache: "OrderedDict[Tuple[str, str], Tuple[str, str, Optional[Dict]]]" = OrderedDict()
+_extract_cache_chars = 0
+
+
+def _content_hash(data: bytes) -> str:
+    """BLAKE3 hex digest, multithreaded for large inputs (dedup key, not a MAC)."""
+    if len(data) >= HASH_IN_THREAD_MIN_BYTES:
+        return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+    return blake3.blake3(data).hexdigest()
+
+
+def _extract_pdf_sync(content: bytes) -> str:
+    """Extract text from PDF using pypdf (module-level so it pickles)."""
+    pdf_reader = pypdf.PdfReader(BytesIO(content))
+    text_parts = []
+
+    # Pages share the reader's stream, so they are extracted sequentially
+    for page in pdf_reader.pages:
+        text_parts.append(page.extract_text())
+
+    return "\n\n".join(text_parts)
+
+
+def _extract_docx_sync(content: bytes) -> str:
+    """Extract text from DOCX using python-docx (module-level so it pickles)."""
+    doc = DocxDocument(BytesIO(content))
+    text_parts = []
+
+    for paragraph in doc.paragraphs:
+        text_parts.append(paragraph.text)
+
+    return "\n\n".join(text_parts)
+
+
+def _get_token_encoding():
+    """
+    Return the tiktoken encoding for chunk sizing, or None if tiktoken is not
+    installed or the encoding cannot be loaded (it is downloaded on first use).
+    """
+    global _token_encoding
+    if _token_encoding is None:
+        _token_encoding = False
+        if tiktoken is not None:
+            try:
+                _token_encoding = tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+            except Exception as e:
+                logger.warning(f"tiktoken encoding unavailable, chunking by characters: {e}")
+    return _token_encoding or None
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction pool, creating it on first use."""
+    global _extraction_pool
+    if _extraction_pool is None:
+        # spawn: forking a process that runs threads (event loop, audit
+        # writer) can copy held locks into the child
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the shared extraction pool, if it was created."""
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown()
+        _extraction_pool = None
+
+
+async def _run_extraction(extract: Callable[[bytes], str], content: bytes) -> str:
+    """Run a sync extractor inline for small files, else in the process pool."""
+    if len(content) < POOL_EXTRACTION_MIN_BYTES:
+        return extract(content)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_extraction_pool(), extract, content)
+
+
+def _extract_cache_get(key: Tuple[str, str]) -> Optional[Tuple[str, str, Optional[Dict]]]:
+    """Return the cached extraction for key (marking it recently used), or None."""
+    cached = _extract_cache.get(key)
+    if cached is not None:
+        _extract_cache.move_to_end(key)
+    return cached
+
+
+def _extract_cache_put(key: Tuple[str, str], entry: Tuple[str, str, Optional[Dict]]) -> None:
+    """Cache an extraction, evicting least recently used ones to stay in budget."""
+    global _extract_cache_chars
+    size = len(entry[0])
+    if size > EXTRACT_CACHE_MAX_CHARS:
+        return
+
+    previous = _extract_cache.pop(key, None)
+    if previous is not None:
+        _extract_cache_chars -= len(previous[0])
+    _extract_cache[key] = entry
+    _extract_cache_chars += size
+
+    while _extract_cache_chars > EXTRACT_CACHE_MAX_CHARS:
+        _, (evicted_text, _, _) = _extract_cache.popitem(last=False)
+        _extract_cache_chars -= len(evicted_text)
+
+
+def _clean_extracted_text(text: str) -> str:
+    """Split on line breaks and double spaces, strip pieces and drop empty ones."""
+    # Lines are rejoined with a double space so a single split() handles both
+    # separators; the extra spaces are stripped with the pieces
+    phrases = "  ".join(text.splitlines()).split("  ")
+    return "\n".join(filter(None, map(str.strip, phrases)))
+
+
+def _markdown_tokens_text(tokens) -> str:
+    """Concatenate the text of a markdown-it token stream, one line per block."""
+    parts = []
+    for token in tokens:
+        if token.type == "inline":
+            for child in token.children or ():
+                if child.type in ("text", "code_inline"):
+                    parts.append(child.content)
+                elif child.type in ("softbreak", "hardbreak"):
+                    parts.append("\n")
+            parts.append("\n")
+        elif token.type in ("fence", "code_block"):
+            parts.append(token.content)
+        elif token.type == "html_block":
+            tree = LexborHTMLParser(token.content)
+            if tree.root is not None:
+                parts.append(tree.root.text(separator="", strip=False))
+            parts.append("\n")
+    return "".join(parts)
+
 
 class FileProcessorService:
     """
@@ -61,7 +251,8 @@ class FileProcessorService:
     - Multi-format support: PDF, Word, HTML, Markdown, Plain Text
     - 50MB file size validation (FR-014)
     - Format validation via magic numbers and MIME types (FR-016)
-    - Parallel upload handling (FR-018)
+    - Parallel upload handling (FR-018); large PDF/DOCX extraction runs in a
+      shared process pool
     - Content chunking per config (FR-032)
     - Content hash deduplication
     """
@@ -69,7 +260,7 @@ class FileProcessorService:
     def __init__(self, chunk_size_tokens: int = 512):
         self.chunk_size_tokens = chunk_size_tokens
         self.chrome_stripper = ChromeStripper()  # Feature 019: GOV.UK chrome removal
-        self._chrome_removal_stats = None  # Stores stats from last HTML processing
+        self._md_parser = MarkdownIt("commonmark")
 
     async def process_files(
         self, files: List[Dict], chunk_size_tokens: Optional[int] = None
@@ -139,11 +330,34 @@ class FileProcessorService:
         # Validate file format (FR-016)
         self._validate_file_format(filename, content, content_type)
 
-        # Extract text content
-        text_content = await self._extract_text(filename, content)
+        # Reuse the extraction of identical bytes (e.g. re-ingestion runs)
+        file_ext = Path(filename).suffix.lower()
+        if len(content) >= HASH_IN_THREAD_MIN_BYTES:
+            raw_hash = await asyncio.to_thread(_content_hash, content)
+        else:
+            raw_hash = _content_hash(content)
+        cache_key = (file_ext, raw_hash)
+
+        cached = _extract_cache_get(cache_key)
+        if cached is not None:
+            text_content, content_hash, chrome_removal_stats = cached
+        else:
+            # Extract text content (and chrome stats for HTML)
+            text_content, chrome_removal_stats = await self._extract_text(filename, content)
+
+            # Calculate content hash for deduplication. Plain text decodes
+            # from exactly the raw bytes, so their hash is reused as is.
+            if file_ext == ".txt":
+                content_hash = raw_hash
+            else:
+                text_bytes = text_content.encode()
+                if len(text_bytes) >= HASH_IN_THREAD_MIN_BYTES:
+                    content_hash = await asyncio.to_thread(_content_hash, text_bytes)
+                else:
+                    content_hash = _content_hash(text_bytes)
+                del text_bytes  # free the encoded copy before chunking
 
-        # Calculate content hash for deduplication
-        content_hash = hashlib.sha256(text_content.encode()).hexdigest()
+            _extract_cache_put(cache_key, (text_content, content_hash, chrome_removal_stats))
 
         # Chunk text content (FR-032)
         chunks = self._chunk_text(text_content, chunk_size_tokens)
@@ -153,16 +367,16 @@ class FileProcessorService:
             "content_type": content_type,
             "text_content": text_content,
             "content_hash": content_hash,
+            "content_hash_algorithm": CONTENT_HASH_ALGORITHM,
             "chunks": chunks,
             "chunk_count": len(chunks),
             "file_size_bytes": len(content),
         }
 
         # Include chrome removal stats if HTML was processed (Feature 019)
-        if self._chrome_removal_stats:
-            result["chrome_removal_stats"] = self._chrome_removal_stats
+        if chrome_removal_stats:
+            result["chrome_removal_stats"] = dict(chrome_removal_stats)
             result["chrome_removed"] = True
-            self._chrome_removal_stats = None  # Reset for next file
         else:
             result["chrome_removed"] = False
 
@@ -181,11 +395,7 @@ class FileProcessorService:
         file_ext = Path(filename).suffix.lower()
 
         # Validate extension is allowed
-        allowed_extensions = set()
-        for extensions in ALLOWED_MIME_TYPES.values():
-            allowed_extensions.update(extensions)
-
-        if file_ext not in allowed_extensions:
+        if file_ext not in _ALLOWED_EXTS:
             raise ValueError(
                 f"Invalid file format: {filename}. "
                 f"Allowed formats: PDF, Word (.doc, .docx), HTML, Markdown, Plain Text"
@@ -197,19 +407,13 @@ class FileProcessorService:
                 raise ValueError(f"Invalid MIME type: {content_type} for file {filename}")
 
         # Validate magic numbers for binary formats
-        if file_ext == ".pdf":
-            if not content.startswith(MAGIC_NUMBERS["pdf"]):
-                raise ValueError(f"Corrupted PDF file: {filename}")
+        magic = _MAGIC_TABLE.get(file_ext)
+        if magic is not None and not content.startswith(magic[0]):
+            raise ValueError(f"Corrupted {magic[1]} file: {filename}")
 
-        elif file_ext == ".docx":
-            if not content.startswith(MAGIC_NUMBERS["docx"]):
-                raise ValueError(f"Corrupted DOCX file: {filename}")
-
-        elif file_ext == ".doc":
-            if not content.startswith(MAGIC_NUMBERS["doc"]):
-                raise ValueError(f"Corrupted DOC file: {filename}")
-
-    async def _extract_text(self, filename: str, content: bytes) -> str:
+    async def _extract_text(
+        self, filename: str, content: bytes
+    ) -> Tuple[str, Optional[Dict]]:
         """
         Extract text content based on file format.
 
@@ -218,7 +422,8 @@ class FileProcessorService:
             content: File content as bytes
 
         Returns:
-            Extracted text content
+            Tuple of (extracted text content, chrome removal stats for HTML
+            files or None)
 
         Raises:
             ValueError: If extraction fails
@@ -227,10 +432,10 @@ class FileProcessorService:
 
         try:
             if file_ext == ".pdf":
-                return await self._extract_pdf(content)
+                return await self._extract_pdf(content), None
 
             elif file_ext == ".docx":
-                return await self._extract_docx(content)
+                return await self._extract_docx(content), None
 
             elif file_ext == ".doc":
                 # .doc files require more complex parsing (python-docx doesn't support them)
@@ -243,10 +448,10 @@ class FileProcessorService:
                 return await self._extract_html(content)
 
             elif file_ext in [".md", ".markdown"]:
-                return await self._extract_markdown(content)
+                return await self._extract_markdown(content), None
 
             elif file_ext == ".txt":
-                return content.decode("utf-8")
+                return content.decode("utf-8"), None
 
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
@@ -255,87 +460,79 @@ class FileProcessorService:
             raise ValueError(f"Failed to extract text from {filename}: {e}")
 
     async def _extract_pdf(self, content: bytes) -> str:
-        """Extract text from PDF using PyPDF2"""
-        if not PyPDF2:
-            raise ValueError("PyPDF2 not installed. Cannot process PDF files.")
-
-        from io import BytesIO
-
-        pdf_reader = PyPDF2.PdfReader(BytesIO(content))
-        text_parts = []
+        """Extract text from PDF using pypdf (in the process pool for large files)"""
+        if not pypdf:
+            raise ValueError("pypdf not installed. Cannot process PDF files.")
 
-        for page in pdf_reader.pages:
-            text_parts.append(page.extract_text())
-
-        return "\n\n".join(text_parts)
+        return await _run_extraction(_extract_pdf_sync, content)
 
     async def _extract_docx(self, content: bytes) -> str:
-        """Extract text from DOCX using python-docx"""
+        """Extract text from DOCX using python-docx (in the process pool for large files)"""
         if not DocxDocument:
             raise ValueError("python-docx not installed. Cannot process DOCX files.")
 
-        from io import BytesIO
-
-        doc = DocxDocument(BytesIO(content))
-        text_parts = []
-
-        for paragraph in doc.paragraphs:
-            text_parts.append(paragraph.text)
-
-        return "\n\n".join(text_parts)
+        return await _run_extraction(_extract_docx_sync, content)
 
-    async def _extract_html(self, content: bytes) -> str:
+    async def _extract_html(self, content: bytes) -> Tuple[str, Dict]:
         """
-        Extract text from HTML using BeautifulSoup.
+        Extract text from HTML using selectolax (lexbor C parser).
 
         Feature 019: Integrates ChromeStripper to remove GOV.UK chrome
         (cookie banners, navigation, footer) before text extraction.
         """
-        html = content.decode("utf-8")
+        # Lexbor replaces invalid UTF-8 without raising, so reject non-UTF-8
+        # uploads here (UnicodeDecodeError is a ValueError) as decoding did
+        content.decode("utf-8")
 
         # Feature 019: Strip GOV.UK chrome before processing (FR-004, FR-006)
-        # This removes navigation, footers, cookie banners, etc.
+        # This removes navigation, footers, cookie banners, etc. The raw bytes
+        # go straight to the parser.
         cleaned_html, chrome_stats = self.chrome_stripper.strip_chrome(
-            html,
+            content,
             document_id="html-extraction"  # Actual document_id set by caller
         )
 
-        # Store chrome removal stats for inclusion in result (FR-008)
-        self._chrome_removal_stats = chrome_stats
-
-        # Parse cleaned HTML
-        soup = BeautifulSoup(cleaned_html, "lxml")
+        # Parse cleaned HTML. Only <body> is walked: <head> holds the page
+        # title ("... - GOV.UK"), metadata and styles, not guidance text.
+        # Fragments without <html>/<body> tags are parsed into a body too.
+        body = LexborHTMLParser(cleaned_html).body
+        if body is None:
+            return "", chrome_stats
 
         # Remove any remaining script and style elements (defense in depth)
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Get text
-        text = soup.get_text()
+        for node in body.css("script, style"):
+            node.decompose()
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = "\n".join(chunk for chunk in chunks if chunk)
+        # Get text (text nodes concatenated without a separator, as
+        # BeautifulSoup's get_text() did)
+        text = body.text(separator="", strip=False)
 
-        return text
+        # Clean up whitespace; chrome stats are returned for the result (FR-008)
+        return _clean_extracted_text(text), chrome_stats
 
     async def _extract_markdown(self, content: bytes) -> str:
-        """Extract text from Markdown (convert to HTML then extract)"""
+        """
+        Extract text from Markdown by walking the markdown-it token stream.
+
+        Markdown has no GOV.UK chrome, so this skips the HTML round trip
+        (render, ChromeStripper, re-parse) and reads text tokens directly.
+        """
         md_text = content.decode("utf-8")
 
-        # Convert Markdown to HTML
-        html = markdown.markdown(md_text)
+        # Text, inline code and code blocks; link targets, images and inline
+        # HTML tags contribute no text, as in the rendered HTML
+        text = _markdown_tokens_text(self._md_parser.parse(md_text))
 
-        # Extract text from HTML
-        return await self._extract_html(html.encode("utf-8"))
+        # Clean up whitespace
+        return _clean_extracted_text(text)
 
     def _chunk_text(self, text: str, chunk_size_tokens: int) -> List[str]:
         """
         Split text into chunks based on token count.
 
-        Simple approximation: 1 token ≈ 4 characters
-        For production, use tiktoken or similar tokenizer.
+        Sentences are measured with tiktoken (cl100k_base) when available,
+        counting one extra token for each sentence's ". " separator. Without
+        tiktoken, falls back to the approximation 1 token ≈ 4 characters.
 
         Args:
             text: Full text content
@@ -344,28 +541,34 @@ class FileProcessorService:
         Returns:
             List of text chunks
         """
-        # Approximate characters per chunk (1 token ≈ 4 chars)
-        chars_per_chunk = chunk_size_tokens * 4
+        # Split by sentences (simple approach)
+        sentences = text.split(". ")
+
+        encoding = _get_token_encoding()
+        if encoding is not None:
+            # Tokenize all sentences in one call
+            token_ids = encoding.encode_ordinary_batch(sentences)
+            sentence_sizes = [len(ids) + 1 for ids in token_ids]
+            max_chunk_size = chunk_size_tokens
+        else:
+            # Approximate characters per chunk (1 token ≈ 4 chars)
+            sentence_sizes = [len(sentence) for sentence in sentences]
+            max_chunk_size = chunk_size_tokens * 4
 
         # Split into chunks
         chunks = []
         current_chunk = []
-        current_length = 0
-
-        # Split by sentences (simple approach)
-        sentences = text.split(". ")
-
-        for sentence in sentences:
-            sentence_length = len(sentence)
+        current_size = 0
 
-            if current_length + sentence_length > chars_per_chunk and current_chunk:
+        for sentence, sentence_size in zip(sentences, sentence_sizes):
+            if current_size + sentence_size > max_chunk_size and current_chunk:
                 # Finalize current chunk
                 chunks.append(". ".join(current_chunk) + ".")
                 current_chunk = []
-                current_length = 0
+                current_size = 0
 
             current_chunk.append(sentence)
-            current_length += sentence_length
+            current_size += sentence_size
 
         # Add remaining chunk
         if current_chunk:
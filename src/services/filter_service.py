@@ -9,12 +9,41 @@ Features:
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Publication dates without a timezone are treated as UTC; unparseable dates
+# fall back to the epoch
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+DOCUMENT_TYPE_LABELS = {
+    "guidance": "Guidance",
+    "form": "Form",
+    "appendix": "Appendix",
+    "caseworker_instruction": "Caseworker Instruction",
+    "policy": "Policy",
+    "other": "Other",
+}
+
+SOURCE_LABELS = {
+    "home_office": "Home Office",
+    "passport_office": "Passport Office",
+    "ukvi": "UK Visas and Immigration",
+    "border_force": "Border Force",
+    "unknown": "Unknown",
+}
+
+DATE_RANGE_LABELS = {
+    "last_30_days": "Last 30 days",
+    "last_6_months": "Last 6 months",
+    "last_year": "Last year",
+    "all_time": "All time",
+}
+
 
 class FilterService:
     """
@@ -65,10 +94,24 @@ class FilterService:
         """
         logger.info(f"Calculating facets for {len(results)} results")
 
-        # Extract document types
+        # Category counts run in Counter's C loop; each date is parsed once
+        # and the parsed list is then compared against every preset cutoff
+        now = datetime.now(timezone.utc)
+        cutoffs = [
+            (preset, now - delta)
+            for preset, delta in cls.DATE_RANGES.items()
+            if delta is not None
+        ]
         document_type_counts = Counter(
             result.get("document_type", "other") for result in results
         )
+        source_counts = Counter(result.get("source", "unknown") for result in results)
+        pub_dates = [cls._parse_date(result.get("publication_date")) for result in results]
+        date_range_counts = {
+            preset: sum(1 for pub_date in pub_dates if pub_date >= cutoff_date)
+            for preset, cutoff_date in cutoffs
+        }
+
         document_type_facets = [
             {
                 "label": cls._humanize_document_type(doc_type),
@@ -77,16 +120,18 @@ class FilterService:
             }
             for doc_type, count in document_type_counts.items()
         ]
-
-        # Extract sources
-        source_counts = Counter(result.get("source", "unknown") for result in results)
         source_facets = [
             {"label": cls._humanize_source(source), "value": source, "count": count}
             for source, count in source_counts.items()
         ]
-
-        # Calculate date range counts
-        date_range_facets = cls._calculate_date_range_facets(results)
+        date_range_facets = [
+            {
+                "label": cls._humanize_date_range(preset),
+                "value": preset,
+                "count": len(results) if delta is None else date_range_counts[preset],
+            }
+            for preset, delta in cls.DATE_RANGES.items()
+        ]
 
         return {
             "document_type": sorted(document_type_facets, key=lambda x: -x["count"]),
@@ -182,7 +227,7 @@ class FilterService:
                 return results  # No filtering
 
             if preset in cls.DATE_RANGES:
-                cutoff_date = datetime.utcnow() - cls.DATE_RANGES[preset]
+                cutoff_date = datetime.now(timezone.utc) - cls.DATE_RANGES[preset]
                 return [
                     r
                     for r in results
@@ -202,94 +247,46 @@ class FilterService:
 
         return results
 
-    @classmethod
-    def _calculate_date_range_facets(cls, results: List[Dict]) -> List[Dict]:
-        """
-        Calculate facet counts for preset date ranges.
-
-        Args:
-            results: List of search result documents
-
-        Returns:
-            List of date range facets with counts
-        """
-        now = datetime.utcnow()
-        facets = []
-
-        for preset, delta in cls.DATE_RANGES.items():
-            if delta is None:  # all_time
-                count = len(results)
-            else:
-                cutoff_date = now - delta
-                count = sum(
-                    1
-                    for r in results
-                    if cls._parse_date(r.get("publication_date")) >= cutoff_date
-                )
-
-            facets.append(
-                {
-                    "label": cls._humanize_date_range(preset),
-                    "value": preset,
-                    "count": count,
-                }
-            )
-
-        return facets
-
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_date(date_str: Optional[str]) -> datetime:
         """
         Parse date string to datetime object.
 
+        Memoized: results repeat the same publication dates, and facet and
+        filter calls parse the same result set again.
+
         Args:
             date_str: ISO-8601 date string
 
         Returns:
-            datetime object (defaults to epoch if parsing fails)
+            Timezone-aware UTC datetime (defaults to epoch if parsing fails)
         """
         if not date_str:
-            return datetime(1970, 1, 1)  # Epoch
+            return EPOCH
 
         try:
             # Try ISO-8601 format
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            parsed = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
         except (ValueError, AttributeError):
             logger.warning(f"Failed to parse date: {date_str}")
-            return datetime(1970, 1, 1)
+            return EPOCH
+
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed
 
     @staticmethod
     def _humanize_document_type(doc_type: str) -> str:
         """Convert document type to human-readable label."""
-        labels = {
-            "guidance": "Guidance",
-            "form": "Form",
-            "appendix": "Appendix",
-            "caseworker_instruction": "Caseworker Instruction",
-            "policy": "Policy",
-            "other": "Other",
-        }
-        return labels.get(doc_type, doc_type.title())
+        return DOCUMENT_TYPE_LABELS.get(doc_type, doc_type.title())
 
     @staticmethod
     def _humanize_source(source: str) -> str:
         """Convert source to human-readable label."""
-        labels = {
-            "home_office": "Home Office",
-            "passport_office": "Passport Office",
-            "ukvi": "UK Visas and Immigration",
-            "border_force": "Border Force",
-            "unknown": "Unknown",
-        }
-        return labels.get(source, source.replace("_", " ").title())
+        return SOURCE_LABELS.get(source, source.replace("_", " ").title())
 
     @staticmethod
     def _humanize_date_range(preset: str) -> str:
         """Convert date range preset to human-readable label."""
-        labels = {
-            "last_30_days": "Last 30 days",
-            "last_6_months": "Last 6 months",
-            "last_year": "Last year",
-            "all_time": "All time",
-        }
-        return labels.get(preset, preset.replace("_", " ").title())
+        return DATE_RANGE_LABELS.get(preset, preset.replace("_", " ").title())
@@ -13,20 +13,223 @@ Architecture:
 - LLM-based extraction for complex structures (requirements, conditions, processes)
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
 import re
 import hashlib
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
 from typing import List, Dict, Any, Tuple, Optional
 from haystack import component, Document
 from neo4j import GraphDatabase, Driver
 import spacy
 from spacy.language import Language
 
-from src.services.openrouter_service import OpenRouterService
+# Token counting for LLM batch sizing
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Sentence segmentation for relationship co-occurrence
+try:
+    import blingfire
+except ImportError:
+    blingfire = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from src.cache.graph_query_cache import GraphQueryCache
+from src.services.openrouter_service import OpenRouterService, close_openrouter_client
 
 logger = logging.getLogger(__name__)
 
+# Documents per nlp.pipe mini-batch for SpaCy NER
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+
+# Worker processes for SpaCy NER on large runs; below the document threshold
+# the cost of starting workers outweighs the parallel speedup
+SPACY_N_PROCESS = int(
+    os.getenv("SPACY_N_PROCESS", str(max(1, min((os.cpu_count() or 1) - 1, 8))))
+)
+SPACY_MULTIPROCESS_MIN_DOCS = 200
+
+# Content is truncated to this many chars before SpaCy NER to avoid memory issues
+SPACY_MAX_CHARS = 1_000_000
+
+# Only ner (and the tok2vec it may listen to) produce doc.ents; the other
+# en_core_web components are not loaded at all
+SPACY_EXCLUDED_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter"]
+
+# Per-content SpaCy and regex results kept per extractor instance, so
+# re-indexed or retried documents with unchanged content skip both passes
+ENTITY_CACHE_SIZE = 4096
+
+# SpaCy labels kept as graph entities
+SPACY_ENTITY_LABELS = frozenset({"ORG", "GPE", "DATE", "MONEY", "PERSON", "LOC"})
+
+# Concurrent OpenRouter requests per extraction run
+LLM_CONCURRENCY = int(os.getenv("LLM_EXTRACTION_CONCURRENCY", "8"))
+
+# LLM response used when the API call fails
+LLM_EMPTY_RESPONSE = '{"requirements": [], "conditions": [], "processes": []}'
+
+# Documents without a visa type, an amount of money or a requirement phrase
+# ("must provide", ...) rarely hold requirements, conditions or processes
+# (navigation, contents pages, boilerplate), so they are not sent to the LLM
+LLM_SIGNAL_GATE = os.getenv("LLM_EXTRACTION_SIGNAL_GATE", "true").lower() == "true"
+LLM_SIGNAL_ENTITY_TYPES = frozenset({"visa_type", "money"})
+
+# Documents per LLM extraction prompt, limited by the document text tokens
+# per prompt; the response budget grows with the number of documents
+LLM_BATCH_SIZE = int(os.getenv("LLM_EXTRACTION_BATCH_SIZE", "4"))
+LLM_BATCH_MAX_TOKENS = int(os.getenv("LLM_EXTRACTION_BATCH_TOKENS", "6000"))
+LLM_MAX_TOKENS_PER_DOC = 2000
+
+# Document content sent to the LLM is truncated to this many chars for cost
+LLM_MAX_CHARS = 4000
+
+# Fallback sentence boundary without blingfire: sentence-ending punctuation
+# followed by whitespace and a capital or digit, so "U.K. visa", "£1.50"
+# and "2.1" are not split
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+
+# tiktoken encodings per LLM model, loaded on first use; False if unavailable
+_token_encodings: Dict[str, Any] = {}
+
+# LLM extractions are cached in Redis per model and document text, so
+# re-indexing unchanged content does not pay for the same extraction again
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/1")
+LLM_CACHE_TTL = int(os.getenv("LLM_EXTRACTION_CACHE_TTL", str(30 * 24 * 3600)))
+LLM_CACHE_KEY_PREFIX = "graph:llm:"
+
+# JSONL file of {doc_id, entities} per document whose LLM extraction
+# succeeded; an interrupted run restarted with the same file skips them
+LLM_CHECKPOINT_PATH = os.getenv("GRAPH_EXTRACTION_CHECKPOINT")
+
+# Distinct (text, entity_type) pairs whose IDs are memoized
+ENTITY_ID_CACHE_SIZE = 16384
+
+# Terms for the domain-specific regex patterns
+VISA_TYPE_TERMS = (
+    "Skilled Worker", "Student", "Family", "Tourist", "Entrepreneur", "Innovator", "Graduate",
+    "Health and Care Worker", "Global Talent", "Start-up", "Intra-Company Transfer",
+    "Minister of Religion", "Sportsperson", "Representative of an Overseas Business",
+    "Temporary Worker", "Seasonal Worker", "Creative Worker", "Charity Worker", "Religious Worker",
+    "Youth Mobility", "Parent", "Partner", "Child", "Adult Dependent Relative", "Settlement",
+    "Indefinite Leave to Remain", "British Citizenship",
+)
+DOCUMENT_TYPE_TERMS = (
+    "passport", "birth certificate", "marriage certificate", "divorce certificate",
+    "death certificate", "bank statement", "payslip", "P60", "employment contract",
+    "sponsor licence", "certificate of sponsorship", "CAS", "degree certificate",
+    "academic transcript", "English language test", "IELTS", "TOEFL", "PTE", "SELT",
+    "tuberculosis test", "TB certificate", "police certificate", "criminal record check",
+    "DBS check", "tenancy agreement", "mortgage statement", "utility bill", "council tax bill",
+    "NHS registration", "travel itinerary", "flight booking", "accommodation booking",
+)
+
+
+@lru_cache(maxsize=ENTITY_ID_CACHE_SIZE)
+def _entity_id(text: str, entity_type: str) -> str:
+    """Deterministic entity ID: type plus truncated SHA256 of text and type."""
+    # Not for security, for uniqueness. IDs are MERGE keys of existing graph
+    # nodes, so the hash must not change.
+    content_hash = hashlib.sha256(f"{text}:{entity_type}".encode()).hexdigest()[:12]
+    return f"{entity_type}_{content_hash}"
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from sync code.
+
+    Haystack calls run() synchronously; when that happens inside a running
+    event loop, the coroutine gets its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _get_token_encoding(model: str):
+    """
+    Return the tiktoken encoding for an OpenRouter model, or None if tiktoken
+    is not installed or has no (loadable) encoding for the model.
+    """
+    encoding = _token_encodings.get(model)
+    if encoding is None:
+        encoding = False
+        if tiktoken is not None:
+            try:
+                encoding = tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+            except Exception as e:
+                logger.warning(f"tiktoken encoding for {model} unavailable, estimating tokens: {e}")
+        _token_encodings[model] = encoding
+    return encoding or None
+
+
+def _split_sentences(content: str) -> List[str]:
+    """Split text into sentences (blingfire when installed, else a regex)."""
+    if blingfire is not None:
+        return blingfire.text_to_sentences(content).split("\n")
+    return SENTENCE_BOUNDARY.split(content)
+
+
+# RE2 class matching exactly the characters re's \s matches in str patterns
+# (str.isspace()); RE2's own \s is ASCII-only and misses e.g. the no-break
+# spaces common in GOV.UK text
+RE2_WHITESPACE = r"[\t\n\v\f\r \x{1c}-\x{1f}\x{85}\pZ]"
+
+
+def _compile_terms(terms: Tuple[str, ...], suffix: str = ""):
+    """
+    Compile a case-insensitive alternation group of terms (plus suffix).
+
+    Uses RE2 when google-re2 is installed: it matches the whole alternation
+    with an automaton in one linear pass. Otherwise falls back to re, with a
+    lookahead on the terms' first characters so most positions are rejected
+    by one character-class test instead of trying every alternative.
+    For RE2, \\s in suffix is replaced by RE2_WHITESPACE, so both return the
+    same matches; they expose the same finditer/group API.
+    """
+    alternation = f"({'|'.join(re.escape(term) for term in terms)})"
+    if re2 is not None:
+        re2_suffix = suffix.replace(r"\s", RE2_WHITESPACE)
+        return re2.compile(f"(?i){alternation}{re2_suffix}")
+    alternation += suffix
+
+    first_chars = sorted({c for term in terms for c in (term[0].lower(), term[0].upper())})
+    first_class = "".join(re.escape(c) for c in first_chars)
+    return re.compile(f"(?=[{first_class}]){alternation}", re.IGNORECASE)
+
+
+# Domain-specific regex patterns by entity type, compiled once at import and
+# shared (read-only) by all extractor instances
+PATTERNS = MappingProxyType({
+    "visa_type": _compile_terms(VISA_TYPE_TERMS, r"\s*(?:visa|route)?"),
+    "visa_code": re.compile(r"\b(T[1-5]|PBS)\b"),  # e.g., T2, T4, T5, PBS
+    "document_type": _compile_terms(DOCUMENT_TYPE_TERMS),
+    "requirement_indicator": re.compile(
+        r"(must|required to|need to|should|have to|necessary to|mandatory)\s+(provide|submit|demonstrate|show|have|hold|meet|satisfy)",
+        re.IGNORECASE,
+    ),
+    "time_period": re.compile(
+        r"\d+\s*(day|week|month|year|hour)s?", re.IGNORECASE
+    ),
+    "money": re.compile(r"£\d+(?:,\d{3})*(?:\.\d{2})?"),
+})
+
 
 @component
 class Neo4JGraphExtractor:
@@ -47,8 +250,14 @@ class Neo4JGraphExtractor:
         neo4j_database: str = "neo4j",
         spacy_model: str = "en_core_web_lg",
         llm_extractor_model: str = "openai/gpt-4o-mini",  # Via OpenRouter
-        batch_size: int = 50,
+        batch_size: int = 1000,
         enable_llm_extraction: bool = True,
+        spacy_batch_size: int = SPACY_BATCH_SIZE,
+        spacy_n_process: int = SPACY_N_PROCESS,
+        llm_concurrency: int = LLM_CONCURRENCY,
+        llm_batch_size: int = LLM_BATCH_SIZE,
+        llm_signal_gate: bool = LLM_SIGNAL_GATE,
+        llm_checkpoint_path: Optional[str] = LLM_CHECKPOINT_PATH,
     ):
         """
         Initialize Neo4J graph extractor.
@@ -60,16 +269,36 @@ class Neo4JGraphExtractor:
             neo4j_database: Neo4J database name (default: neo4j)
             spacy_model: SpaCy model name (default: en_core_web_lg)
             llm_extractor_model: LLM model for complex extraction
-            batch_size: Batch size for Neo4J writes
+            batch_size: Entities per Neo4J write transaction (default: 1000)
             enable_llm_extraction: Enable LLM-based extraction (default: True)
+            spacy_batch_size: Documents per SpaCy nlp.pipe batch (default: 64)
+            spacy_n_process: SpaCy worker processes for runs of at least
+                200 documents (default: CPU count - 1, capped at 8)
+            llm_concurrency: Concurrent LLM requests per run (default: 8)
+            llm_batch_size: Documents per LLM extraction prompt (default: 4)
+            llm_signal_gate: Skip LLM extraction for documents without any
+                visa type, money or requirement phrase match (default: True)
+            llm_checkpoint_path: JSONL checkpoint of LLM extractions, for
+                resuming interrupted runs (default: none)
         """
         self.neo4j_uri = neo4j_uri
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
         self.neo4j_database = neo4j_database
         self.batch_size = batch_size
+        self.spacy_batch_size = spacy_batch_size
+        self.spacy_n_process = spacy_n_process
+
+        # (text, label) tuples found in recently seen content, keyed by
+        # content hash; turned into per-document entity dicts on use
+        self._spacy_cache: "OrderedDict[bytes, Tuple[Tuple[str, str], ...]]" = OrderedDict()
+        self._pattern_cache: "OrderedDict[bytes, Tuple[Tuple[str, str], ...]]" = OrderedDict()
         self.enable_llm_extraction = enable_llm_extraction
         self.llm_model = llm_extractor_model
+        self.llm_concurrency = llm_concurrency
+        self.llm_batch_size = max(1, llm_batch_size)
+        self.llm_signal_gate = llm_signal_gate
+        self.llm_checkpoint_path = llm_checkpoint_path
 
         # Initialize Neo4J driver
         self.driver: Optional[Driver] = None
@@ -77,8 +306,10 @@ class Neo4JGraphExtractor:
 
         # Initialize SpaCy
         try:
-            self.nlp: Optional[Language] = spacy.load(spacy_model)
-            logger.info(f"✓ SpaCy model loaded: {spacy_model}")
+            self.nlp: Optional[Language] = spacy.load(
+                spacy_model, exclude=SPACY_EXCLUDED_COMPONENTS
+            )
+            logger.info(f"✓ SpaCy model loaded: {spacy_model} (pipeline: {self.nlp.pipe_names})")
         except OSError:
             logger.warning(
                 f"SpaCy model {spacy_model} not found. "
@@ -89,37 +320,18 @@ class Neo4JGraphExtractor:
 
         # Initialize OpenRouter service for LLM extraction
         if self.enable_llm_extraction:
-            self.openrouter_service = OpenRouterService()
+            # No DB session: extraction does not use the summary/translation cache
+            self.openrouter_service = OpenRouterService(db_session=None)
+            self.llm_cache = GraphQueryCache(
+                redis_url=REDIS_URL,
+                default_ttl=LLM_CACHE_TTL,
+                key_prefix=LLM_CACHE_KEY_PREFIX,
+            )
+            self._llm_checkpoint = self._load_llm_checkpoint()
             logger.info(f"✓ LLM extractor initialized: {llm_extractor_model}")
 
-        # Domain-specific regex patterns
-        self.patterns = {
-            "visa_type": re.compile(
-                r"(Skilled Worker|Student|Family|Tourist|Entrepreneur|Innovator|Graduate|Health and Care Worker|"
-                r"Global Talent|Start-up|Intra-Company Transfer|Minister of Religion|Sportsperson|Representative of an Overseas Business|"
-                r"Temporary Worker|Seasonal Worker|Creative Worker|Charity Worker|Religious Worker|"
-                r"Youth Mobility|Parent|Partner|Child|Adult Dependent Relative|Settlement|Indefinite Leave to Remain|British Citizenship)\s*(?:visa|route)?",
-                re.IGNORECASE,
-            ),
-            "visa_code": re.compile(r"\b(T[1-5]|PBS)\b"),  # e.g., T2, T4, T5, PBS
-            "document_type": re.compile(
-                r"(passport|birth certificate|marriage certificate|divorce certificate|death certificate|"
-                r"bank statement|payslip|P60|employment contract|sponsor licence|certificate of sponsorship|CAS|"
-                r"degree certificate|academic transcript|English language test|IELTS|TOEFL|PTE|SELT|"
-                r"tuberculosis test|TB certificate|police certificate|criminal record check|DBS check|"
-                r"tenancy agreement|mortgage statement|utility bill|council tax bill|NHS registration|"
-                r"travel itinerary|flight booking|accommodation booking)",
-                re.IGNORECASE,
-            ),
-            "requirement_indicator": re.compile(
-                r"(must|required to|need to|should|have to|necessary to|mandatory)\s+(provide|submit|demonstrate|show|have|hold|meet|satisfy)",
-                re.IGNORECASE,
-            ),
-            "time_period": re.compile(
-                r"\d+\s*(day|week|month|year|hour)s?", re.IGNORECASE
-            ),
-            "money": re.compile(r"£\d+(?:,\d{3})*(?:\.\d{2})?"),
-        }
+        # Domain-specific regex patterns, compiled once at import
+        self.patterns = PATTERNS
 
         logger.info(f"Neo4JGraphExtractor initialized (database: {neo4j_database})")
 
@@ -137,6 +349,22 @@ class Neo4JGraphExtractor:
             self.driver = None
             raise RuntimeError(f"Neo4J connection failed: {e}") from e
 
+        self._ensure_entity_id_constraint()
+
+    def _ensure_entity_id_constraint(self) -> None:
+        """Create the Entity.id uniqueness constraint that backs MERGE/MATCH by id."""
+        try:
+            with self.driver.session(database=self.neo4j_database) as session:
+                session.run(
+                    """
+                    CREATE CONSTRAINT entity_id_unique IF NOT EXISTS
+                    FOR (e:Entity) REQUIRE e.id IS UNIQUE
+                    """
+                )
+        except Exception as e:
+            # Writes still work without it, only slower
+            logger.warning(f"Could not create Entity.id constraint: {e}")
+
     def close(self) -> None:
         """Close Neo4J driver connection."""
         if self.driver:
@@ -154,46 +382,86 @@ class Neo4JGraphExtractor:
             documents: List of Haystack Document objects with content and metadata
 
         Returns:
-            entities: List of extracted entities with types and properties
-            relationships: List of (source_id, relationship_type, target_id) tuples
+            entities: List of extracted entities with types and properties, one
+                per entity ID with the chunk_ids of every document it was found in
+            relationships: List of distinct (source_id, relationship_type, target_id) tuples
         """
         if not self.driver:
             raise RuntimeError("Neo4J driver not initialized")
 
-        all_entities = []
-        all_relationships = []
-
         logger.info(f"Extracting entities from {len(documents)} documents...")
 
-        for doc in documents:
-            try:
-                # Step 1: SpaCy NER extraction
-                spacy_entities = self._extract_spacy_entities(doc)
-
-                # Step 2: Regex pattern extraction
-                pattern_entities = self._extract_pattern_entities(doc)
-
-                # Step 3: LLM-based extraction for complex structures
-                llm_entities = []
-                if self.enable_llm_extraction:
-                    llm_entities = self._extract_llm_entities(doc)
+        # Content hashes, computed once and shared by the SpaCy and regex caches
+        content_keys = [self._content_key(doc) for doc in documents]
 
-                # Combine all entities
-                doc_entities = spacy_entities + pattern_entities + llm_entities
+        # Step 1: SpaCy NER extraction, batched across all documents
+        spacy_entities_per_doc = self._extract_spacy_entities_batch(documents, content_keys)
 
-                # Step 4: Relationship extraction
-                relationships = self._extract_relationships(doc, doc_entities)
-
-                all_entities.extend(doc_entities)
-                all_relationships.extend(relationships)
+        # Step 2: Regex pattern extraction
+        pattern_entities_per_doc = [
+            self._extract_pattern_entities(doc, content_key)
+            for doc, content_key in zip(documents, content_keys)
+        ]
 
-            except Exception as e:
-                logger.error(f"Error extracting from document {doc.id}: {e}")
-                continue
+        # SpaCy and regex entities are final at this point (LLM entity types
+        # never share their IDs), so while the LLM runs they are written to
+        # Neo4J in the background
+        ner_entities = self._merge_entities(
+            spacy_entities + pattern_entities
+            for spacy_entities, pattern_entities in zip(spacy_entities_per_doc, pattern_entities_per_doc)
+        )
 
-        # Step 5: Write to Neo4J
-        if all_entities or all_relationships:
-            self._write_to_neo4j(all_entities, all_relationships)
+        with ThreadPoolExecutor(max_workers=1) as write_pool:
+            ner_write = None
+            if self.enable_llm_extraction and ner_entities:
+                ner_write = write_pool.submit(self._write_to_neo4j, ner_entities, [])
+
+            # Step 3: LLM-based extraction for complex structures, requests for
+            # all documents in flight concurrently
+            llm_entities_per_doc = [[] for _ in documents]
+            if self.enable_llm_extraction:
+                llm_indices = [
+                    i
+                    for i, (doc, pattern_entities) in enumerate(zip(documents, pattern_entities_per_doc))
+                    if not self.llm_signal_gate or self._has_llm_signal(doc, pattern_entities)
+                ]
+                if self.llm_signal_gate:
+                    logger.info(
+                        f"LLM extraction: {len(llm_indices)}/{len(documents)} documents, "
+                        f"{len(documents) - len(llm_indices)} skipped without requirement signals"
+                    )
+                llm_results = self._extract_llm_entities_batch([documents[i] for i in llm_indices])
+                for i, llm_entities in zip(llm_indices, llm_results):
+                    llm_entities_per_doc[i] = llm_entities
+
+            # Step 4: Relationship extraction, as an ordered set so each edge is
+            # written once
+            all_relationships: Dict[Tuple[str, str, str], None] = {}
+            for doc, spacy_entities, pattern_entities, llm_entities in zip(
+                documents, spacy_entities_per_doc, pattern_entities_per_doc, llm_entities_per_doc
+            ):
+                try:
+                    doc_entities = spacy_entities + pattern_entities + llm_entities
+                    all_relationships.update(
+                        dict.fromkeys(self._extract_relationships(doc, doc_entities))
+                    )
+                except Exception as e:
+                    logger.error(f"Error extracting from document {doc.id}: {e}")
+                    continue
+
+            llm_entities = self._merge_entities(llm_entities_per_doc)
+            all_entities = ner_entities + llm_entities
+            all_relationships = list(all_relationships)
+
+            # Step 5: Write the remaining entities and all relationships to
+            # Neo4J once their SpaCy/regex endpoints exist
+            if ner_write is not None:
+                ner_write.result()
+                pending_entities = llm_entities
+            else:
+                pending_entities = all_entities
+            if pending_entities or all_relationships:
+                self._write_to_neo4j(pending_entities, all_relationships)
 
         logger.info(
             f"Extracted {len(all_entities)} entities and {len(all_relationships)} relationships"
@@ -201,69 +469,199 @@ class Neo4JGraphExtractor:
 
         return {"entities": all_entities, "relationships": all_relationships}
 
-    def _extract_spacy_entities(self, doc: Document) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _merge_entities(entity_lists) -> List[Dict[str, Any]]:
+        """
+        One entity per ID, with the first occurrence's properties and the
+        chunk_ids of every occurrence, so each node is written once.
+        """
+        merged_by_id: Dict[str, Dict[str, Any]] = {}
+        seen_chunk_ids = set()
+
+        for entities in entity_lists:
+            for entity in entities:
+                merged = merged_by_id.get(entity["id"])
+                if merged is None:
+                    merged = merged_by_id[entity["id"]] = {**entity, "chunk_ids": []}
+                for chunk_id in entity["chunk_ids"]:
+                    if (entity["id"], chunk_id) not in seen_chunk_ids:
+                        seen_chunk_ids.add((entity["id"], chunk_id))
+                        merged["chunk_ids"].append(chunk_id)
+
+        return list(merged_by_id.values())
+
+    @staticmethod
+    def _content_key(doc: Document) -> bytes:
+        """Cache key for a document's content (128-bit BLAKE2b digest)."""
+        content = doc.content if doc.content else ""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: bytes):
+        """Return a cached value and mark it recently used, or None."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: bytes, value) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        cache[key] = value
+        if len(cache) > ENTITY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _extract_spacy_entities(
+        self, doc: Document, content_key: Optional[bytes] = None
+    ) -> List[Dict[str, Any]]:
         """Extract named entities using SpaCy."""
         if not self.nlp:
             return []
 
-        entities = []
+        if content_key is None:
+            content_key = self._content_key(doc)
 
-        try:
-            # Limit content to 1M chars to avoid memory issues
-            content = doc.content[:1000000] if doc.content else ""
-            spacy_doc = self.nlp(content)
-
-            for ent in spacy_doc.ents:
-                if ent.label_ in ["ORG", "GPE", "DATE", "MONEY", "PERSON", "LOC"]:
-                    entity_id = self._generate_entity_id(doc.id, ent.text, ent.label_)
-                    entities.append(
-                        {
-                            "id": entity_id,
-                            "type": self._map_spacy_label(ent.label_),
-                            "text": ent.text,
-                            "name": ent.text,
-                            "chunk_ids": [doc.id],
-                            "confidence": 0.8,  # SpaCy NER baseline confidence
-                            "source": "spacy",
-                        }
-                    )
+        spans = self._cache_get(self._spacy_cache, content_key)
+        if spans is None:
+            try:
+                # Limit content to avoid memory issues
+                content = doc.content[:SPACY_MAX_CHARS] if doc.content else ""
+                spans = self._spacy_doc_spans(self.nlp(content))
 
-        except Exception as e:
-            logger.error(f"SpaCy extraction error for document {doc.id}: {e}")
+            except Exception as e:
+                logger.error(f"SpaCy extraction error for document {doc.id}: {e}")
+                return []
 
-        return entities
+            self._cache_put(self._spacy_cache, content_key, spans)
+
+        return self._spacy_entity_dicts(doc, spans)
+
+    def _extract_spacy_entities_batch(
+        self, docs: List[Document], content_keys: Optional[List[bytes]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Extract named entities for many documents in one nlp.pipe pass.
+
+        Returns one entity list per document, in input order. Content seen
+        before is served from the cache; only the rest goes through SpaCy.
+        If the batch fails, each document is retried on its own so one bad
+        document does not drop the others' entities.
+
+        Large runs are spread over spacy_n_process worker processes, except
+        inside daemonic processes (e.g. Celery prefork workers), which
+        cannot start children.
+        """
+        if not self.nlp:
+            return [[] for _ in docs]
+
+        if content_keys is None:
+            content_keys = [self._content_key(doc) for doc in docs]
+
+        spans_per_doc = [self._cache_get(self._spacy_cache, key) for key in content_keys]
+        misses = [i for i, spans in enumerate(spans_per_doc) if spans is None]
 
-    def _extract_pattern_entities(self, doc: Document) -> List[Dict[str, Any]]:
+        if misses:
+            n_process = 1
+            if (
+                len(misses) >= SPACY_MULTIPROCESS_MIN_DOCS
+                and not multiprocessing.current_process().daemon
+            ):
+                n_process = self.spacy_n_process
+
+            texts = (
+                docs[i].content[:SPACY_MAX_CHARS] if docs[i].content else "" for i in misses
+            )
+
+            try:
+                for i, spacy_doc in zip(
+                    misses,
+                    self.nlp.pipe(texts, batch_size=self.spacy_batch_size, n_process=n_process),
+                ):
+                    spans_per_doc[i] = self._spacy_doc_spans(spacy_doc)
+                    self._cache_put(self._spacy_cache, content_keys[i], spans_per_doc[i])
+
+            except Exception as e:
+                logger.error(f"SpaCy batch extraction error, retrying per document: {e}")
+                return [
+                    self._extract_spacy_entities(doc, key) for doc, key in zip(docs, content_keys)
+                ]
+
+        return [
+            self._spacy_entity_dicts(doc, spans) for doc, spans in zip(docs, spans_per_doc)
+        ]
+
+    @staticmethod
+    def _spacy_doc_spans(spacy_doc) -> Tuple[Tuple[str, str], ...]:
+        """Return the (text, label) pairs of a processed SpaCy Doc's kept entities."""
+        return tuple(
+            (ent.text, ent.label_) for ent in spacy_doc.ents if ent.label_ in SPACY_ENTITY_LABELS
+        )
+
+    def _spacy_entity_dicts(
+        self, doc: Document, spans: Tuple[Tuple[str, str], ...]
+    ) -> List[Dict[str, Any]]:
+        """Build SpaCy entity dicts for the source document."""
+        return [
+            {
+                "id": self._generate_entity_id(doc.id, text, label),
+                "type": self._map_spacy_label(label),
+                "text": text,
+                "name": text,
+                "chunk_ids": [doc.id],
+                "confidence": 0.8,  # SpaCy NER baseline confidence
+                "source": "spacy",
+            }
+            for text, label in spans
+        ]
+
+    def _extract_pattern_entities(
+        self, doc: Document, content_key: Optional[bytes] = None
+    ) -> List[Dict[str, Any]]:
         """Extract domain-specific entities using regex patterns."""
-        entities = []
-        content = doc.content if doc.content else ""
+        if content_key is None:
+            content_key = self._content_key(doc)
+
+        matches = self._cache_get(self._pattern_cache, content_key)
+        if matches is None:
+            matches = self._pattern_matches(doc.content if doc.content else "")
+            self._cache_put(self._pattern_cache, content_key, matches)
+
+        return [
+            {
+                "id": self._generate_entity_id(doc.id, text, entity_type),
+                "type": entity_type,
+                "text": text,
+                "name": text,
+                "chunk_ids": [doc.id],
+                "confidence": 0.9,  # High confidence for pattern matches
+                "source": "regex",
+            }
+            for entity_type, text in matches
+        ]
+
+    def _pattern_matches(self, content: str) -> Tuple[Tuple[str, str], ...]:
+        """Return the (entity_type, text) pairs matched by the regex patterns."""
+        matches = []
 
         for entity_type, pattern in self.patterns.items():
             if entity_type == "requirement_indicator":
                 continue  # This is used for relationship extraction, not entities
 
             try:
-                matches = pattern.finditer(content)
-                for match in matches:
-                    text = match.group(0).strip()
-                    entity_id = self._generate_entity_id(doc.id, text, entity_type)
-
-                    entities.append(
-                        {
-                            "id": entity_id,
-                            "type": entity_type,
-                            "text": text,
-                            "name": text,
-                            "chunk_ids": [doc.id],
-                            "confidence": 0.9,  # High confidence for pattern matches
-                            "source": "regex",
-                        }
-                    )
+                for match in pattern.finditer(content):
+                    matches.append((entity_type, match.group(0).strip()))
 
             except Exception as e:
                 logger.error(f"Pattern extraction error for {entity_type}: {e}")
 
-        return entities
+        return tuple(matches)
+
+    def _has_llm_signal(self, doc: Document, pattern_entities: List[Dict[str, Any]]) -> bool:
+        """Whether a document's regex matches suggest it is worth an LLM call."""
+        if any(entity["type"] in LLM_SIGNAL_ENTITY_TYPES for entity in pattern_entities):
+            return True
+        content = doc.content[:LLM_MAX_CHARS] if doc.content else ""
+        return self.patterns["requirement_indicator"].search(content) is not None
 
     def _extract_llm_entities(self, doc: Document) -> List[Dict[str, Any]]:
         """
@@ -271,56 +669,185 @@ class Neo4JGraphExtractor:
 
         Uses OpenRouter API with structured JSON extraction prompts.
         """
-        entities = []
-        content = (
-            doc.content[:4000] if doc.content else ""
-        )  # Limit to 4k chars for cost
+        return self._extract_llm_entities_batch([doc])[0]
+
+    def _extract_llm_entities_batch(
+        self, documents: List[Document]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        LLM extraction for many documents, one entity list per document.
 
-        if not content.strip():
-            return entities
+        Up to llm_batch_size documents share a prompt, and prompts run
+        concurrently, at most llm_concurrency at a time.
+        """
+        return _run_sync(self._gather_llm_entities(documents))
+
+    async def _gather_llm_entities(
+        self, documents: List[Document]
+    ) -> List[List[Dict[str, Any]]]:
+        """Run LLM extraction for all documents, batched and concurrently."""
+        results: List[List[Dict[str, Any]]] = [[] for _ in documents]
+
+        # Documents to send, by cache key: (text, [(index, doc), ...]), so
+        # identical texts in one run are extracted once
+        pending: Dict[str, Tuple[str, List[Tuple[int, Document]]]] = {}
+
+        for i, doc in enumerate(documents):
+            text = doc.content[:LLM_MAX_CHARS] if doc.content else ""
+            if not text.strip():
+                continue
+
+            # Extracted before an interrupted run
+            if doc.id in self._llm_checkpoint:
+                results[i] = [dict(entity) for entity in self._llm_checkpoint[doc.id]]
+                continue
+
+            key = self._llm_cache_key(text)
+            if key not in pending:
+                cached = self.llm_cache.get(key)
+                if cached is not None:
+                    results[i] = self._llm_entities(doc, cached)
+                    continue
+                pending[key] = (text, [])
+            pending[key][1].append((i, doc))
+
+        batches = self._llm_batches(list(pending.items()))
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        try:
+            extractions = await asyncio.gather(
+                *(self._extract_llm_batch_async(batch, semaphore) for batch in batches)
+            )
+        finally:
+            # The pooled client belongs to this run's event loop
+            await close_openrouter_client()
+
+        for batch, doc_data_per_text in zip(batches, extractions):
+            for (key, (_, docs)), doc_data in zip(batch, doc_data_per_text):
+                if doc_data is None:
+                    continue
+                self.llm_cache.set(key, doc_data)
+                for i, doc in docs:
+                    results[i] = self._llm_entities(doc, doc_data)
+                    self._checkpoint_llm_entities(doc.id, results[i])
+
+        return results
+
+    def _llm_batches(self, items: List[Tuple[str, Any]]) -> List[List[Tuple[str, Any]]]:
+        """
+        Group (cache key, (text, docs)) items into prompts of at most
+        llm_batch_size texts and LLM_BATCH_MAX_TOKENS text tokens.
+        """
+        batches: List[List[Tuple[str, Any]]] = []
+        batch: List[Tuple[str, Any]] = []
+        batch_tokens = 0
+
+        for item in items:
+            tokens = self._count_tokens(item[1][0])
+            if batch and (
+                len(batch) >= self.llm_batch_size
+                or batch_tokens + tokens > LLM_BATCH_MAX_TOKENS
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(item)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens for the LLM model, estimating ~4 chars per token without tiktoken."""
+        encoding = _get_token_encoding(self.llm_model)
+        if encoding is None:
+            return len(text) // 4 + 1
+        return len(encoding.encode_ordinary(text))
+
+    async def _extract_llm_batch_async(
+        self, batch: List[Tuple[str, Any]], semaphore: asyncio.Semaphore
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract a batch of texts with one LLM call, holding the semaphore
+        during the call. Returns each text's parsed extraction, or None if
+        the call failed or the response has no entry for it.
+        """
+        texts = [text for _, (text, _) in batch]
+
+        # Call LLM via OpenRouter
+        async with semaphore:
+            response_text = await self._call_llm_async(
+                self._llm_prompt(texts), max_tokens=LLM_MAX_TOKENS_PER_DOC * len(texts)
+            )
+        if response_text is None:
+            return [None] * len(texts)
+
+        response_data = self._parse_llm_json(response_text)
+        if not isinstance(response_data, dict):
+            return [None] * len(texts)
+
+        doc_data_per_text = []
+        for n in range(len(texts)):
+            doc_data = response_data.get(str(n))
+            doc_data_per_text.append(doc_data if isinstance(doc_data, dict) else None)
+        return doc_data_per_text
+
+    def _llm_prompt(self, texts: List[str]) -> str:
+        """Build the LLM extraction prompt for one or more document texts."""
+        documents_json = json.dumps(
+            {str(n): text for n, text in enumerate(texts)}, ensure_ascii=False, indent=1
+        )
 
         # LLM extraction prompt
-        prompt = f"""Extract immigration visa requirements and conditions from this UK immigration document text.
+        return f"""Extract immigration visa requirements and conditions from each of these UK immigration document texts.
 
-Text: {content}
+Documents (JSON object of document number to text):
+{documents_json}
 
-Return ONLY valid JSON with this exact structure (no markdown, no explanations):
+Return ONLY valid JSON mapping every document number to this exact structure (no markdown, no explanations):
 {{
-    "requirements": [
-        {{"text": "requirement description", "category": "financial|documents|english|health|other", "mandatory": true}}
-    ],
-    "conditions": [
-        {{"text": "condition description", "applies_to": ["visa type names"]}}
-    ],
-    "processes": [
-        {{"name": "process name", "steps": ["step 1", "step 2"], "duration": "estimate or null"}}
-    ]
+    "0": {{
+        "requirements": [
+            {{"text": "requirement description", "category": "financial|documents|english|health|other", "mandatory": true}}
+        ],
+        "conditions": [
+            {{"text": "condition description", "applies_to": ["visa type names"]}}
+        ],
+        "processes": [
+            {{"name": "process name", "steps": ["step 1", "step 2"], "duration": "estimate or null"}}
+        ]
+    }}
 }}
 
-If no entities found, return: {{"requirements": [], "conditions": [], "processes": []}}"""
+For a document with no entities, return: {{"requirements": [], "conditions": [], "processes": []}}"""
 
+    @staticmethod
+    def _parse_llm_json(response_text: str) -> Optional[Any]:
+        """Parse the LLM's JSON response, or None if it is not valid JSON."""
         try:
-            # Call LLM via OpenRouter
-            response_text = self._call_llm(prompt)
+            return json.loads(response_text)
+        except json.JSONDecodeError:
+            pass
 
-            # Parse JSON response
+        # Try to extract JSON from markdown code blocks
+        json_match = re.search(r"```(?:json)?\s*(\{.*\})\s*```", response_text, re.DOTALL)
+        if json_match:
             try:
-                response_data = json.loads(response_text)
+                return json.loads(json_match.group(1))
             except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                json_match = re.search(
-                    r"```(?:json)?\s*(\{.*\})\s*```", response_text, re.DOTALL
-                )
-                if json_match:
-                    response_data = json.loads(json_match.group(1))
-                else:
-                    logger.warning(
-                        f"Failed to parse LLM response as JSON: {response_text[:200]}"
-                    )
-                    return entities
+                pass
+
+        logger.warning(f"Failed to parse LLM response as JSON: {response_text[:200]}")
+        return None
+
+    def _llm_entities(
+        self, doc: Document, doc_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Turn a document's LLM extraction into entities."""
+        entities = []
 
+        try:
             # Process requirements
-            for req in response_data.get("requirements", []):
+            for req in doc_data.get("requirements", []):
                 entity_id = self._generate_entity_id(doc.id, req["text"], "requirement")
                 entities.append(
                     {
@@ -336,7 +863,7 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
                 )
 
             # Process conditions
-            for cond in response_data.get("conditions", []):
+            for cond in doc_data.get("conditions", []):
                 entity_id = self._generate_entity_id(doc.id, cond["text"], "condition")
                 entities.append(
                     {
@@ -351,7 +878,7 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
                 )
 
             # Process processes
-            for proc in response_data.get("processes", []):
+            for proc in doc_data.get("processes", []):
                 entity_id = self._generate_entity_id(doc.id, proc["name"], "process")
                 entities.append(
                     {
@@ -387,37 +914,51 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
         relationships = []
         content = doc.content if doc.content else ""
 
-        # Split into sentences for co-occurrence analysis
-        sentences = content.split(".")
-
         # Group entities by type
         visa_entities = [e for e in entities if e["type"] == "visa_type"]
         req_entities = [e for e in entities if e["type"] == "requirement"]
         doc_type_entities = [e for e in entities if e["type"] == "document_type"]
 
-        # Heuristic 1: If visa type and requirement appear in same sentence, create REQUIRES relationship
-        for sent in sentences:
-            sent_lower = sent.lower()
-
-            visa_in_sent = [v for v in visa_entities if v["text"].lower() in sent_lower]
-            req_in_sent = [r for r in req_entities if r["text"].lower() in sent_lower]
-
-            for visa in visa_in_sent:
-                for req in req_in_sent:
-                    relationships.append((visa["id"], "REQUIRES", req["id"]))
-
-        # Heuristic 2: If requirement and document type appear in same sentence, create SATISFIED_BY
-        for sent in sentences:
-            sent_lower = sent.lower()
-
-            req_in_sent = [r for r in req_entities if r["text"].lower() in sent_lower]
-            doc_in_sent = [
-                d for d in doc_type_entities if d["text"].lower() in sent_lower
-            ]
-
-            for req in req_in_sent:
-                for doc_type in doc_in_sent:
-                    relationships.append((req["id"], "SATISFIED_BY", doc_type["id"]))
+        # Both co-occurrence heuristics pair with a requirement, so without
+        # requirements (e.g. LLM extraction disabled) there is nothing to scan
+        if req_entities and (visa_entities or doc_type_entities):
+            # Lowercase entity texts once; each distinct text is then searched
+            # for once per sentence, however many entities share it. Pairs are
+            # emitted with zip/repeat so tuple building stays in C
+            visa_lowered = [(e["id"], e["text"].lower()) for e in visa_entities]
+            req_lowered = [(e["id"], e["text"].lower()) for e in req_entities]
+            doc_type_lowered = [(e["id"], e["text"].lower()) for e in doc_type_entities]
+            visa_texts = {t for _, t in visa_lowered}
+            req_texts = {t for _, t in req_lowered}
+            doc_type_texts = {t for _, t in doc_type_lowered}
+
+            # Heuristic 1 relationships precede heuristic 2 relationships
+            satisfied_by = []
+
+            # Split into sentences for co-occurrence analysis
+            for sent in _split_sentences(content):
+                sent_lower = sent.lower()
+
+                req_found = {t for t in req_texts if t in sent_lower}
+                if not req_found:
+                    continue
+                req_in_sent = [rid for rid, t in req_lowered if t in req_found]
+
+                # Heuristic 1: If visa type and requirement appear in same sentence, create REQUIRES relationship
+                visa_found = {t for t in visa_texts if t in sent_lower}
+                if visa_found:
+                    for visa_id, t in visa_lowered:
+                        if t in visa_found:
+                            relationships.extend(zip(repeat(visa_id), repeat("REQUIRES"), req_in_sent))
+
+                # Heuristic 2: If requirement and document type appear in same sentence, create SATISFIED_BY
+                doc_found = {t for t in doc_type_texts if t in sent_lower}
+                if doc_found:
+                    doc_in_sent = [did for did, t in doc_type_lowered if t in doc_found]
+                    for rid in req_in_sent:
+                        satisfied_by.extend(zip(repeat(rid), repeat("SATISFIED_BY"), doc_in_sent))
+
+            relationships.extend(satisfied_by)
 
         # Document provenance relationships: All entities are contained in their source document
         for entity in entities:
@@ -432,26 +973,61 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
         if not self.driver:
             raise RuntimeError("Neo4J driver not initialized")
 
-        try:
-            with self.driver.session(database=self.neo4j_database) as session:
-                # Create entities in batches
-                for i in range(0, len(entities), self.batch_size):
-                    batch = entities[i : i + self.batch_size]
-                    session.execute_write(self._create_entity_batch, batch)
+        # Each relationship is written in the transaction of the batch that
+        # writes the last of its entity endpoints (a CONTAINS_ENTITY source is
+        # a document, not an entity)
+        entity_batch = {}
+        for i, entity in enumerate(entities):
+            entity_batch.setdefault(entity["id"], i // self.batch_size)
+        last_batch = max(0, (len(entities) - 1) // self.batch_size)
 
-                logger.info(f"Wrote {len(entities)} entities to Neo4J")
-
-                # Create relationships in batches
-                for i in range(0, len(relationships), self.batch_size):
-                    batch = relationships[i : i + self.batch_size]
-                    session.execute_write(self._create_relationship_batch, batch)
+        relationship_batches: List[List[Tuple[str, str, str]]] = [
+            [] for _ in range(last_batch + 1)
+        ]
+        for rel in relationships:
+            src, _, tgt = rel
+            relationship_batches[
+                max(entity_batch.get(src, 0), entity_batch.get(tgt, last_batch))
+            ].append(rel)
 
-                logger.info(f"Wrote {len(relationships)} relationships to Neo4J")
+        try:
+            with self.driver.session(database=self.neo4j_database) as session:
+                # Entities with their first batch_size relationships in one
+                # transaction per batch; any further relationships of the batch
+                # follow in transactions of at most batch_size
+                for n, batch_relationships in enumerate(relationship_batches):
+                    batch = entities[n * self.batch_size : (n + 1) * self.batch_size]
+                    session.execute_write(
+                        self._write_batch, batch, batch_relationships[: self.batch_size]
+                    )
+                    for i in range(self.batch_size, len(batch_relationships), self.batch_size):
+                        session.execute_write(
+                            self._write_batch,
+                            [],
+                            batch_relationships[i : i + self.batch_size],
+                        )
+
+                logger.info(
+                    f"Wrote {len(entities)} entities and {len(relationships)} relationships to Neo4J"
+                )
 
         except Exception as e:
             logger.error(f"Neo4J write error: {e}")
             raise
 
+    @classmethod
+    def _write_batch(
+        cls,
+        tx,
+        entities: List[Dict[str, Any]],
+        relationships: List[Tuple[str, str, str]],
+    ) -> None:
+        """Write entity nodes, then relationships between them, in one transaction."""
+        if entities:
+            cls._create_entity_batch(tx, entities)
+        if relationships:
+            cls._create_relationship_batch(tx, relationships)
+
     @staticmethod
     def _create_entity_batch(tx, entities: List[Dict[str, Any]]) -> None:
         """Cypher query to create entity nodes with dynamic labels."""
@@ -473,33 +1049,89 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
         tx, relationships: List[Tuple[str, str, str]]
     ) -> None:
         """Cypher query to create relationships dynamically."""
-        # Format relationships for Cypher
-        rels_formatted = [
-            {"source": src, "type": rel_type, "target": tgt}
-            for src, rel_type, tgt in relationships
-        ]
+        # Format relationships for Cypher: between entities, both ends are
+        # looked up through the Entity.id constraint; a provenance source is
+        # a document node of unknown label
+        entity_rels = []
+        provenance_rels = []
+        for src, rel_type, tgt in relationships:
+            rels = provenance_rels if rel_type == "CONTAINS_ENTITY" else entity_rels
+            rels.append({"source": src, "type": rel_type, "target": tgt})
 
         query = """
         UNWIND $rels AS rel
+        MATCH (a:Entity {id: rel.source})
+        MATCH (b:Entity {id: rel.target})
+        CALL apoc.create.relationship(a, rel.type, {}, b) YIELD rel AS r
+        RETURN count(r) as created
+        """
+        provenance_query = """
+        UNWIND $rels AS rel
+        MATCH (b:Entity {id: rel.target})
         MATCH (a {id: rel.source})
-        MATCH (b {id: rel.target})
         CALL apoc.create.relationship(a, rel.type, {}, b) YIELD rel AS r
         RETURN count(r) as created
         """
-        result = tx.run(query, rels=rels_formatted)
-        count = result.single()["created"]
+
+        count = 0
+        if entity_rels:
+            count += tx.run(query, rels=entity_rels).single()["created"]
+        if provenance_rels:
+            count += tx.run(provenance_query, rels=provenance_rels).single()["created"]
         logger.debug(f"Created {count} relationships in batch")
 
     def _call_llm(self, prompt: str) -> str:
         """Call LLM via OpenRouter API."""
+        return _run_sync(self._call_llm_async(prompt)) or LLM_EMPTY_RESPONSE
+
+    async def _call_llm_async(
+        self, prompt: str, max_tokens: int = LLM_MAX_TOKENS_PER_DOC
+    ) -> Optional[str]:
+        """Call LLM via OpenRouter API without blocking the event loop; None on failure."""
         try:
-            response = self.openrouter_service.generate_sync(
-                prompt=prompt, model=self.llm_model, temperature=0.1, max_tokens=2000
+            return await self.openrouter_service.generate_async(
+                prompt=prompt, model=self.llm_model, temperature=0.1, max_tokens=max_tokens
             )
-            return response
         except Exception as e:
             logger.error(f"LLM API call failed: {e}")
-            return '{"requirements": [], "conditions": [], "processes": []}'
+            return None
+
+    def _llm_cache_key(self, text: str) -> str:
+        """Cache key of a document text's LLM extraction with the current model."""
+        return LLM_CACHE_KEY_PREFIX + hashlib.blake2b(
+            f"{self.llm_model}\0{text}".encode("utf-8")
+        ).hexdigest()
+
+    def _load_llm_checkpoint(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load LLM entities per document ID from the checkpoint file."""
+        checkpoint: Dict[str, List[Dict[str, Any]]] = {}
+        if not self.llm_checkpoint_path or not os.path.exists(self.llm_checkpoint_path):
+            return checkpoint
+
+        with open(self.llm_checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partial last line of an interrupted write
+                    continue
+                checkpoint[record["doc_id"]] = record["entities"]
+
+        logger.info(
+            f"Resuming LLM extraction: {len(checkpoint)} documents in {self.llm_checkpoint_path}"
+        )
+        return checkpoint
+
+    def _checkpoint_llm_entities(
+        self, doc_id: str, entities: List[Dict[str, Any]]
+    ) -> None:
+        """Record a document's LLM entities in the checkpoint file."""
+        if not self.llm_checkpoint_path:
+            return
+
+        self._llm_checkpoint[doc_id] = entities
+        with open(self.llm_checkpoint_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"doc_id": doc_id, "entities": entities}) + "\n")
 
     def _map_spacy_label(self, label: str) -> str:
         """Map SpaCy entity labels to graph node types."""
@@ -514,10 +1146,8 @@ If no entities found, return: {{"requirements": [], "conditions": [], "processes
         return mapping.get(label, label.lower())
 
     def _generate_entity_id(self, doc_id: str, text: str, entity_type: str) -> str:
-        """Generate deterministic entity ID based on content."""
-        # Use SHA256 hash of text + type for deterministic IDs (not for security, for uniqueness)
-        content_hash = hashlib.sha256(f"{text}:{entity_type}".encode()).hexdigest()[:12]
-        return f"{entity_type}_{content_hash}"
+        """Generate deterministic entity ID based on content (memoized)."""
+        return _entity_id(str(text), entity_type)
 
 
 # Singleton instance management
@@ -16,7 +16,7 @@ Architecture:
 
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from haystack import component, Document
 from neo4j import GraphDatabase, Driver
 import spacy
@@ -24,6 +24,64 @@ from spacy.language import Language
 
 logger = logging.getLogger(__name__)
 
+# Full-text index over entity text/name used to find the starting entities
+# of every retrieval strategy (same index as SCHEMA_QUERIES)
+ENTITY_FULLTEXT_INDEX = "entity_text_fulltext"
+
+# Word tokens of a query entity; drops Lucene operators and special characters
+LUCENE_TERM = re.compile(r"\w+")
+
+# Start entities (e) with their full-text score, found by a full-text seek
+START_ENTITIES = f"""
+CALL db.index.fulltext.queryNodes('{ENTITY_FULLTEXT_INDEX}', $ft_query)
+YIELD node AS e, score
+"""
+
+# Per-strategy Cypher continuing from the start entities, and the columns it
+# returns. Used on their own and as the branches of the combined query.
+DIRECT_SEARCH = """
+MATCH (d)-[:CONTAINS_ENTITY]->(e)
+WITH d.id AS doc_id,
+     collect(DISTINCT e.text)[..5] AS matched_entities,
+     count(DISTINCT e) AS entity_count,
+     max(score) AS score
+ORDER BY entity_count DESC, score DESC
+LIMIT 20
+"""
+DIRECT_COLUMNS = ("doc_id", "matched_entities", "entity_count", "score")
+
+RELATIONSHIP_EXPANSION = """
+MATCH (e)-[r:REQUIRES|SATISFIED_BY|DEPENDS_ON|APPLIES_IF|CAN_TRANSITION_TO]-(related:Entity)
+MATCH (d)-[:CONTAINS_ENTITY]->(related)
+WITH d.id AS doc_id,
+     e.text AS source_entity,
+     type(r) AS relationship,
+     related.text AS target_entity,
+     collect(DISTINCT related.text)[..3] AS related_entities,
+     score
+LIMIT 20
+"""
+EXPANSION_COLUMNS = (
+    "doc_id", "source_entity", "relationship", "target_entity", "related_entities", "score"
+)
+
+# Formatted with max_depth
+MULTIHOP_TRAVERSAL = """
+MATCH path = (e)-[*1..{max_depth}]-(end:Entity)
+MATCH (d)-[:CONTAINS_ENTITY]->(end)
+WITH DISTINCT d.id AS doc_id,
+     [node IN nodes(path) | node.text][..5] AS traversal_path,
+     [rel IN relationships(path) | type(rel)][..5] AS relationship_types,
+     length(path) AS hop_count,
+     score
+ORDER BY hop_count ASC, score DESC
+LIMIT 20
+"""
+MULTIHOP_COLUMNS = ("doc_id", "traversal_path", "relationship_types", "hop_count", "score")
+
+# Union of the strategy columns, returned by every branch of the combined query
+COMBINED_COLUMNS = tuple(dict.fromkeys(DIRECT_COLUMNS + EXPANSION_COLUMNS + MULTIHOP_COLUMNS))
+
 
 @component
 class Neo4JGraphRetriever:
@@ -100,6 +158,38 @@ class Neo4JGraphRetriever:
             self.driver = None
             raise RuntimeError(f"Neo4J connection failed: {e}") from e
 
+        self._ensure_fulltext_index()
+
+    def _ensure_fulltext_index(self) -> None:
+        """Create the Entity full-text index that the retrieval queries seek on."""
+        try:
+            with self.driver.session(database=self.neo4j_database) as session:
+                session.run(
+                    f"""
+                    CREATE FULLTEXT INDEX {ENTITY_FULLTEXT_INDEX} IF NOT EXISTS
+                    FOR (e:Entity) ON EACH [e.text, e.name]
+                    """
+                )
+        except Exception as e:
+            # Retrieval queries fail (and return no documents) until it exists
+            logger.warning(f"Could not create Entity full-text index: {e}")
+
+    @staticmethod
+    def _fulltext_query(entities: List[str]) -> str:
+        """
+        Build one Lucene query matching any of the entities.
+
+        Each entity matches entities containing all of its words as word
+        prefixes, e.g. ["Skilled Worker", "IELTS"] ->
+        "(skilled* AND worker*) OR (ielts*)".
+        """
+        clauses = []
+        for entity in entities:
+            terms = LUCENE_TERM.findall(entity.lower())
+            if terms:
+                clauses.append("(" + " AND ".join(f"{term}*" for term in terms) + ")")
+        return " OR ".join(clauses)
+
     def close(self) -> None:
         """Close Neo4J driver connection."""
         if self.driver:
@@ -132,14 +222,8 @@ class Neo4JGraphRetriever:
 
         logger.info(f"Graph retrieval for entities: {entities}")
 
-        # Strategy 1: Direct entity match
-        direct_docs = self._direct_entity_search(entities)
-
-        # Strategy 2: Relationship expansion
-        expanded_docs = self._relationship_expansion(entities)
-
-        # Strategy 3: Multi-hop reasoning
-        multihop_docs = self._multihop_traversal(entities)
+        # Direct match, relationship expansion and multi-hop reasoning in one query
+        direct_docs, expanded_docs, multihop_docs = self._combined_search(entities)
 
         # Merge and rank results
         all_docs = self._merge_and_rank(direct_docs, expanded_docs, multihop_docs)
@@ -156,24 +240,16 @@ class Neo4JGraphRetriever:
 
     def _direct_entity_search(self, entities: List[str]) -> List[Document]:
         """Find documents directly containing queried entities."""
-        if not self.driver:
+        ft_query = self._fulltext_query(entities)
+        if not self.driver or not ft_query:
             return []
 
         try:
             with self.driver.session(database=self.neo4j_database) as session:
-                query = """
-                UNWIND $entities AS entity_text
-                MATCH (e:Entity)
-                WHERE toLower(e.text) CONTAINS toLower(entity_text)
-                   OR toLower(e.name) CONTAINS toLower(entity_text)
-                MATCH (d)-[:CONTAINS_ENTITY]->(e)
-                RETURN DISTINCT d.id AS doc_id,
-                       collect(DISTINCT e.text)[..5] AS matched_entities,
-                       count(DISTINCT e) AS entity_count
-                ORDER BY entity_count DESC
-                LIMIT 20
-                """
-                result = session.run(query, entities=entities)
+                query = (
+                    START_ENTITIES + DIRECT_SEARCH + f"RETURN {', '.join(DIRECT_COLUMNS)}"
+                )
+                result = session.run(query, ft_query=ft_query)
                 documents = self._result_to_documents(result, strategy="direct")
 
                 logger.debug(f"Direct search found {len(documents)} documents")
@@ -190,26 +266,18 @@ class Neo4JGraphRetriever:
         Example: Query mentions "Skilled Worker visa" → Find REQUIRES relationships
         → Retrieve documents about those requirements.
         """
-        if not self.driver:
+        ft_query = self._fulltext_query(entities)
+        if not self.driver or not ft_query:
             return []
 
         try:
             with self.driver.session(database=self.neo4j_database) as session:
-                query = """
-                UNWIND $entities AS entity_text
-                MATCH (e:Entity)
-                WHERE toLower(e.text) CONTAINS toLower(entity_text)
-                   OR toLower(e.name) CONTAINS toLower(entity_text)
-                MATCH (e)-[r:REQUIRES|SATISFIED_BY|DEPENDS_ON|APPLIES_IF|CAN_TRANSITION_TO]-(related:Entity)
-                MATCH (d)-[:CONTAINS_ENTITY]->(related)
-                RETURN DISTINCT d.id AS doc_id,
-                       e.text AS source_entity,
-                       type(r) AS relationship,
-                       related.text AS target_entity,
-                       collect(DISTINCT related.text)[..3] AS related_entities
-                LIMIT 20
-                """
-                result = session.run(query, entities=entities)
+                query = (
+                    START_ENTITIES
+                    + RELATIONSHIP_EXPANSION
+                    + f"RETURN {', '.join(EXPANSION_COLUMNS)}"
+                )
+                result = session.run(query, ft_query=ft_query)
                 documents = self._result_to_documents(result, strategy="expanded")
 
                 logger.debug(f"Relationship expansion found {len(documents)} documents")
@@ -230,26 +298,18 @@ class Neo4JGraphRetriever:
         → Traverse SATISFIED_BY → Document types
         → Return documents about those document types
         """
-        if not self.driver:
+        ft_query = self._fulltext_query(entities)
+        if not self.driver or not ft_query:
             return []
 
         try:
             with self.driver.session(database=self.neo4j_database) as session:
-                query = f"""
-                UNWIND $entities AS entity_text
-                MATCH (start:Entity)
-                WHERE toLower(start.text) CONTAINS toLower(entity_text)
-                   OR toLower(start.name) CONTAINS toLower(entity_text)
-                MATCH path = (start)-[*1..{self.max_depth}]-(end:Entity)
-                MATCH (d)-[:CONTAINS_ENTITY]->(end)
-                RETURN DISTINCT d.id AS doc_id,
-                       [node IN nodes(path) | node.text][..5] AS traversal_path,
-                       [rel IN relationships(path) | type(rel)][..5] AS relationship_types,
-                       length(path) AS hop_count
-                ORDER BY hop_count ASC
-                LIMIT 20
-                """
-                result = session.run(query, entities=entities)
+                query = (
+                    START_ENTITIES
+                    + MULTIHOP_TRAVERSAL.format(max_depth=self.max_depth)
+                    + f"RETURN {', '.join(MULTIHOP_COLUMNS)}"
+                )
+                result = session.run(query, ft_query=ft_query)
                 documents = self._result_to_documents(result, strategy="multihop")
 
                 logger.debug(f"Multi-hop traversal found {len(documents)} documents")
@@ -259,6 +319,79 @@ class Neo4JGraphRetriever:
             logger.error(f"Multi-hop traversal error: {e}")
             return []
 
+    def _combined_search(
+        self, entities: List[str]
+    ) -> Tuple[List[Document], List[Document], List[Document]]:
+        """
+        Run the direct, relationship expansion and multi-hop strategies as one
+        query, so retrieval costs one round trip and one full-text seek.
+
+        Each UNION ALL branch tags its rows with a strategy column and pads the
+        other strategies' columns with null.
+
+        Returns:
+            (direct, expanded, multihop) documents
+        """
+        ft_query = self._fulltext_query(entities)
+        if not self.driver or not ft_query:
+            return [], [], []
+
+        branches = [
+            ("direct", DIRECT_SEARCH, DIRECT_COLUMNS),
+            ("expanded", RELATIONSHIP_EXPANSION, EXPANSION_COLUMNS),
+            (
+                "multihop",
+                MULTIHOP_TRAVERSAL.format(max_depth=self.max_depth),
+                MULTIHOP_COLUMNS,
+            ),
+        ]
+        union = "\nUNION ALL\n".join(
+            "WITH starts\n"
+            "UNWIND starts AS start\n"
+            "WITH start.node AS e, start.score AS score\n"
+            f"{body}"
+            f"RETURN '{strategy}' AS strategy, "
+            + ", ".join(
+                column if column in columns else f"null AS {column}"
+                for column in COMBINED_COLUMNS
+            )
+            + "\n"
+            for strategy, body, columns in branches
+        )
+        query = (
+            START_ENTITIES
+            + "WITH collect({node: e, score: score}) AS starts\n"
+            + f"CALL {{\n{union}}}\n"
+            + f"RETURN strategy, {', '.join(COMBINED_COLUMNS)}"
+        )
+
+        try:
+            with self.driver.session(database=self.neo4j_database) as session:
+                result = session.run(query, ft_query=ft_query)
+
+                records: Dict[str, List[Dict[str, Any]]] = {
+                    strategy: [] for strategy, _, _ in branches
+                }
+                for record in result:
+                    records[record["strategy"]].append(
+                        {key: value for key, value in record.items() if value is not None}
+                    )
+
+                direct, expanded, multihop = (
+                    self._result_to_documents(records[strategy], strategy=strategy)
+                    for strategy, _, _ in branches
+                )
+
+                logger.debug(
+                    f"Combined search found {len(direct)} direct, {len(expanded)} expanded, "
+                    f"{len(multihop)} multi-hop documents"
+                )
+                return direct, expanded, multihop
+
+        except Exception as e:
+            logger.error(f"Combined graph search error: {e}")
+            return [], [], []
+
     def _merge_and_rank(
         self,
         direct: List[Document],
@@ -441,6 +574,9 @@ class Neo4JGraphRetriever:
                 if "related_entities" in record:
                     meta["related_entities"] = record["related_entities"]
 
+                if "score" in record:
+                    meta["fulltext_score"] = record["score"]
+
                 # Create document (content will be fetched from Qdrant later)
                 doc = Document(
                     id=doc_id,
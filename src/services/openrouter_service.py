@@ -13,6 +13,7 @@ import hashlib
 import logging
 import re
 import asyncio
+import weakref
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 import httpx
@@ -24,6 +25,36 @@ from src.models.document_translation import DocumentTranslation
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for OpenRouter requests; failed connection attempts are
+# retried, HTTP error responses are not
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+HTTP_CONNECT_RETRIES = 3
+
+# Pooled HTTP client per event loop, shared by all OpenRouterService
+# instances (routes create one per request) so connections to OpenRouter are
+# reused; an httpx client's connections belong to the loop that opened them
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the running event loop's OpenRouter client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES)
+        )
+    return client
+
+
+async def close_openrouter_client() -> None:
+    """Close the running event loop's OpenRouter client and its pooled connections."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class OpenRouterService:
     """
@@ -1071,21 +1102,54 @@ Summary:"""
             "max_tokens": max_tokens
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(self.api_url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = await _get_http_client().post(
+            self.api_url, json=payload, headers=headers, timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        response_text = data["choices"][0]["message"]["content"]
+        model_used = data.get("model", self.default_model)
 
-            data = response.json()
-            response_text = data["choices"][0]["message"]["content"]
-            model_used = data.get("model", self.default_model)
+        return response_text.strip(), model_used
 
-            return response_text.strip(), model_used
+    async def generate_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000
+    ) -> str:
+        """
+        Generate a completion for a single user prompt (no caching).
+
+        Args:
+            prompt: LLM prompt text
+            model: OpenRouter model identifier (None = use default_model)
+            temperature: Sampling temperature (0.0-1.0)
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Response text
+
+        Raises:
+            httpx.TimeoutException: If request exceeds 30s
+            httpx.HTTPStatusError: If API returns error status
+        """
+        response_text, _ = await self._call_openrouter_api_with_messages(
+            [{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            model=model
+        )
+        return response_text
 
     async def _call_openrouter_api_with_messages(
         self,
         messages: list,
         temperature: float = 0.7,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        model: Optional[str] = None
     ) -> tuple[str, str]:
         """
         Call OpenRouter API with custom messages array (system + user prompts).
@@ -1097,6 +1161,7 @@ Summary:"""
             messages: Array of message dicts with role and content
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
+            model: OpenRouter model identifier (None = use default_model)
 
         Returns:
             Tuple of (response_text, model_used)
@@ -1115,18 +1180,19 @@ Summary:"""
         }
 
         payload = {
-            "model": self.default_model,
+            "model": model or self.default_model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(self.api_url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = await _get_http_client().post(
+            self.api_url, json=payload, headers=headers, timeout=self.timeout
+        )
+        response.raise_for_status()
 
-            data = response.json()
-            response_text = data["choices"][0]["message"]["content"]
-            model_used = data.get("model", self.default_model)
+        data = response.json()
+        response_text = data["choices"][0]["message"]["content"]
+        model_used = data.get("model", self.default_model)
 
-            return response_text.strip(), model_used
+        return response_text.strip(), model_used
@@ -176,9 +176,9 @@ def test_direct_entity_search_multiple_entities(graph_retriever, mock_neo4j_driv
 
     # Assert
     assert len(docs) == 1
-    # Verify query was called with all entities
+    # Verify one full-text query was built from all entities
     call_args = mock_neo4j_session.run.call_args
-    assert call_args[1]["entities"] == entities
+    assert call_args[1]["ft_query"] == "(student* AND visa*) OR (tier* AND 4*) OR (university*)"
 
 
 @pytest.mark.integration
@@ -607,36 +607,18 @@ def test_generate_explanation_paths_multihop(graph_retriever):
 @pytest.mark.integration
 def test_run_full_pipeline_success(graph_retriever, mock_neo4j_driver, mock_neo4j_session):
     """Test full retrieval pipeline (run method)."""
-    # Mock all query results
-    mock_direct = Mock()
-    mock_direct.__iter__ = Mock(return_value=iter([
-        {"doc_id": "chunk_001", "matched_entities": ["Skilled Worker"], "entity_count": 1}
-    ]))
-
-    mock_expanded = Mock()
-    mock_expanded.__iter__ = Mock(return_value=iter([
-        {"doc_id": "chunk_002", "source_entity": "Skilled Worker", "relationship": "REQUIRES",
-         "target_entity": "English test", "related_entities": ["IELTS"]}
-    ]))
-
-    mock_multihop = Mock()
-    mock_multihop.__iter__ = Mock(return_value=iter([
-        {"doc_id": "chunk_003", "traversal_path": ["Skilled Worker", "Job offer"],
+    # Mock the combined query result, one tagged row per strategy
+    mock_result = Mock()
+    mock_result.__iter__ = Mock(return_value=iter([
+        {"strategy": "direct", "doc_id": "chunk_001", "matched_entities": ["Skilled Worker"],
+         "entity_count": 1},
+        {"strategy": "expanded", "doc_id": "chunk_002", "source_entity": "Skilled Worker",
+         "relationship": "REQUIRES", "target_entity": "English test", "related_entities": ["IELTS"]},
+        {"strategy": "multihop", "doc_id": "chunk_003", "traversal_path": ["Skilled Worker", "Job offer"],
          "relationship_types": ["REQUIRES"], "hop_count": 1}
     ]))
 
-    call_count = [0]
-
-    def run_side_effect(query, **kwargs):
-        call_count[0] += 1
-        if call_count[0] == 1:  # Direct search
-            return mock_direct
-        elif call_count[0] == 2:  # Relationship expansion
-            return mock_expanded
-        else:  # Multi-hop
-            return mock_multihop
-
-    mock_neo4j_session.run = Mock(side_effect=run_side_effect)
+    mock_neo4j_session.run = Mock(return_value=mock_result)
     mock_neo4j_driver.session = Mock(return_value=mock_neo4j_session)
 
     # Execute
@@ -647,6 +629,34 @@ def test_run_full_pipeline_success(graph_retriever, mock_neo4j_driver, mock_neo4
     assert "graph_paths" in result
     assert len(result["documents"]) > 0
     assert len(result["graph_paths"]) > 0
+    # All three strategies ran in a single round trip
+    assert mock_neo4j_session.run.call_count == 1
+    strategies = {doc.meta["retrieval_strategy"] for doc in result["documents"]}
+    assert strategies == {"direct", "expanded", "multihop"}
+
+
+@pytest.mark.integration
+def test_combined_search_query_structure(graph_retriever, mock_neo4j_driver, mock_neo4j_session):
+    """Test combined query separates its UNION ALL branches and aligns their columns."""
+    mock_neo4j_session.run = Mock(return_value=iter([]))
+    mock_neo4j_driver.session = Mock(return_value=mock_neo4j_session)
+
+    graph_retriever._combined_search(["Skilled Worker visa"])
+
+    query = mock_neo4j_session.run.call_args.args[0]
+    lines = [line.strip() for line in query.splitlines()]
+
+    # UNION ALL stands on its own line between the three branches
+    assert "UNION ALL" not in query.replace("\nUNION ALL\n", "")
+    assert lines.count("UNION ALL") == 2
+    assert lines.count("WITH starts") == 3
+
+    # Every branch returns the strategy tag followed by the same columns
+    branch_returns = [line for line in lines if line.startswith("RETURN '")]
+    assert len(branch_returns) == 3
+    columns = [line.split(" AS strategy, ", 1)[1] for line in branch_returns]
+    aliases = [[column.split(" AS ")[-1] for column in c.split(", ")] for c in columns]
+    assert aliases[0] == aliases[1] == aliases[2]
 
 
 @pytest.mark.integration
@@ -688,7 +698,7 @@ def test_run_respects_top_k(graph_retriever, mock_neo4j_driver, mock_neo4j_sessi
     """Test run returns at most top_k documents."""
     # Mock many results
     many_results = [
-        {"doc_id": f"chunk_{i:03d}", "matched_entities": ["Test"], "entity_count": 1}
+        {"strategy": "direct", "doc_id": f"chunk_{i:03d}", "matched_entities": ["Test"], "entity_count": 1}
         for i in range(50)
     ]
 
@@ -702,7 +712,7 @@ def test_run_respects_top_k(graph_retriever, mock_neo4j_driver, mock_neo4j_sessi
     result = graph_retriever.run(query="Test query", entities=["Test"])
 
     # Assert - should return at most top_k
-    assert len(result["documents"]) <= graph_retriever.top_k
+    assert len(result["documents"]) == graph_retriever.top_k
 
 
 # ============================================================================
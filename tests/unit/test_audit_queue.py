@@ -0,0 +1,90 @@
+"""
+Unit tests for the background audit queue writer (AuditQueue).
+
+The database is replaced by a stub session and a patched
+AuditService.log_actions_bulk, so these tests run without PostgreSQL.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.models.audit_log import AuditLogCreate
+from src.services.audit_service import AuditQueue, AuditService
+
+
+def _event(user_id: str) -> AuditLogCreate:
+    return AuditLogCreate(
+        user_id=user_id,
+        action_type="update",
+        resource_type="config",
+        resource_id="cfg-1",
+        old_value=None,
+        new_value={"enabled": True},
+        ip_address="127.0.0.1",
+    )
+
+
+@pytest.mark.unit
+def test_integrity_error_dead_letters_only_the_bad_event(caplog):
+    """One event violating the users.id FK must not drop the rest of its batch."""
+    written = []
+
+    def log_actions_bulk(self, events):
+        # Mirrors the multi-row INSERT: any bad row rejects the whole statement
+        if any(event.user_id == "missing-user" for event in events):
+            raise ValueError("Failed to create audit logs: violates foreign key constraint")
+        written.extend(events)
+        return len(events)
+
+    events = [_event(f"user-{i}") for i in range(4)]
+    events.insert(2, _event("missing-user"))
+    queue = AuditQueue(session_factory=Mock, flush_interval=0)
+
+    with patch.object(AuditService, "log_actions_bulk", log_actions_bulk):
+        with caplog.at_level(logging.ERROR, logger="src.services.audit_service"):
+            asyncio.run(queue._write(events))
+
+    assert [event.user_id for event in written] == [f"user-{i}" for i in range(4)]
+    unwritten = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Unwritten")]
+    assert len(unwritten) == 1
+    assert "missing-user" in unwritten[0]
+
+
+@pytest.mark.unit
+def test_transient_failure_is_retried_as_a_batch():
+    """Non-integrity failures retry the whole batch rather than splitting it."""
+    calls = []
+
+    def log_actions_bulk(self, events):
+        calls.append(len(events))
+        if len(calls) == 1:
+            raise ConnectionError("server closed the connection unexpectedly")
+        return len(events)
+
+    queue = AuditQueue(session_factory=Mock, flush_interval=0)
+
+    with patch.object(AuditService, "log_actions_bulk", log_actions_bulk):
+        asyncio.run(queue._write([_event("user-1"), _event("user-2")]))
+
+    assert calls == [2, 2]
+
+
+@pytest.mark.unit
+def test_bulk_write_keeps_each_event_timestamp():
+    """Rows are stamped when the event was recorded, not when the batch is flushed."""
+    first, second = _event("user-1"), _event("user-2")
+    first.timestamp = datetime(2026, 9, 30, 23, 59, 59)
+    second.timestamp = datetime(2026, 10, 1, 0, 0, 1)
+    db = Mock()
+
+    AuditService(db).log_actions_bulk([first, second])
+
+    insert_stmt = db.execute.call_args_list[-1].args[0]
+    params = insert_stmt.compile().params
+    assert {params["timestamp_m0"], params["timestamp_m1"]} == {first.timestamp, second.timestamp}
+    # Both months' partitions are ensured before the INSERT
+    ensured = [c.args[1]["ts"] for c in db.execute.call_args_list[:-1]]
+    assert ensured == [first.timestamp, second.timestamp]
@@ -0,0 +1,61 @@
+"""
+Differential tests for the graph extractor's term patterns.
+
+_compile_terms builds the visa/document term patterns with RE2 when
+google-re2 is installed and with re otherwise; both engines must return the
+same matches, or entity texts (and their MERGE ids) would depend on which
+engine a worker has installed.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.services import neo4j_graph_extractor as extractor
+from src.services.neo4j_graph_extractor import (
+    DOCUMENT_TYPE_TERMS,
+    VISA_TYPE_TERMS,
+    _compile_terms,
+)
+
+pytest.importorskip("re2")
+
+# ASCII and Unicode whitespace between a term and its suffix
+SEPARATORS = ["", " ", "  ", "\t", "\n", "\xa0", "\u2009", "\u202f", "\u3000", "\x85"]
+
+TERM_LISTS = [
+    (VISA_TYPE_TERMS, r"\s*(?:visa|route)?"),
+    (DOCUMENT_TYPE_TERMS, ""),
+]
+
+
+def _matches(pattern, text):
+    return [(m.start(), m.end(), m.group(0), m.group(1)) for m in pattern.finditer(text)]
+
+
+def _texts(terms):
+    for term in terms:
+        for variant in (term, term.lower(), term.upper()):
+            for separator in SEPARATORS:
+                for suffix in ("visa", "Route", "VISA", "application"):
+                    yield f"Apply for the {variant}{separator}{suffix} today."
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("terms, suffix", TERM_LISTS)
+def test_re2_and_re_return_the_same_matches(terms, suffix):
+    """RE2 and re patterns agree on every term, case and whitespace variant."""
+    re2_pattern = _compile_terms(terms, suffix)
+    with patch.object(extractor, "re2", None):
+        re_pattern = _compile_terms(terms, suffix)
+
+    assert type(re2_pattern) is not type(re_pattern)
+    for text in _texts(terms):
+        assert _matches(re2_pattern, text) == _matches(re_pattern, text), text
+
+
+@pytest.mark.unit
+def test_visa_suffix_matches_no_break_space():
+    """A no-break space before 'visa' is part of the visa type match."""
+    match = extractor.PATTERNS["visa_type"].search("the Student\xa0visa route")
+
+    assert match.group(0) == "Student\xa0visa"